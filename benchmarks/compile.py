@@ -0,0 +1,60 @@
+"""Compare interpreted and compiled rendering speed for each generator."""
+
+from __future__ import annotations
+
+import random
+import timeit
+
+from wordsmith import (
+    Adjective,
+    BandName,
+    Component,
+    CriminalGangName,
+    NauticalShipName,
+    Noun,
+    PersonName,
+    TownName,
+    WorkTitle,
+    maybe,
+    one_of,
+)
+
+RENDERS = 20_000
+
+
+def build_cases() -> dict[str, Component]:
+    return {
+        "Noun phrase": (
+            "The"
+            | maybe(Adjective())
+            | one_of("Journey", "Voyage", "Chronicles")
+            | "of"
+            | Noun().prefixed_by_article()
+        ).title_case(),
+        "PersonName": PersonName(),
+        "TownName": TownName(),
+        "BandName": BandName(),
+        "CriminalGangName": CriminalGangName(),
+        "NauticalShipName": NauticalShipName(),
+        "WorkTitle": WorkTitle(),
+    }
+
+
+def time_renders(render, seed: int = 0) -> float:
+    rng = random.Random(seed)
+    return timeit.timeit(lambda: render(rng), number=RENDERS)
+
+
+def main() -> None:
+    print(f"{'component':<20} {'interpreted':>12} {'compiled':>12} {'speedup':>8}")
+    for name, component in build_cases().items():
+        interpreted = time_renders(component.make_text)
+        compiled = time_renders(component.compile())
+        print(
+            f"{name:<20} {interpreted:>11.3f}s {compiled:>11.3f}s "
+            f"{interpreted / compiled:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compare constrained generation with a plain rejection loop."""
+
+from __future__ import annotations
+
+import random
+import time
+
+from wordsmith import (
+    BandName,
+    Component,
+    NauticalShipName,
+    PersonName,
+    TownName,
+    WorkTitle,
+)
+
+RENDERS = 20_000
+
+
+def build_cases() -> dict[str, tuple[Component, dict[str, int]]]:
+    return {
+        "NauticalShipName <=24": (NauticalShipName(), dict(max_len=24)),
+        "BandName <=3 words": (BandName(), dict(max_words=3)),
+        "TownName 14-16": (TownName(), dict(min_len=14, max_len=16)),
+        "PersonName <=10": (PersonName(), dict(max_len=10)),
+        "WorkTitle <=12": (WorkTitle(), dict(max_len=12)),
+    }
+
+
+def time_rejection(component: Component, accepts, seed: int = 0) -> float:
+    render = component.compile()
+    rng = random.Random(seed)
+    begin = time.perf_counter()
+    for _ in range(RENDERS):
+        while not accepts(render(rng)):
+            pass
+    return time.perf_counter() - begin
+
+
+def time_constrained(render, seed: int = 0) -> float:
+    rng = random.Random(seed)
+    begin = time.perf_counter()
+    for _ in range(RENDERS):
+        render(rng)
+    return time.perf_counter() - begin
+
+
+def main() -> None:
+    print(f"{RENDERS:,} accepted renders per case; both sides compiled")
+    print(
+        f"{'case':<24} {'rejection':>10} {'constrained':>12} {'setup':>8} "
+        f"{'speedup':>8}"
+    )
+    for name, (component, limits) in build_cases().items():
+        begin = time.perf_counter()
+        limited = component.constrained(**limits)
+        render = limited.compile()
+        setup = time.perf_counter() - begin
+        rejection = time_rejection(component, limited.accepts)
+        pruned = time_constrained(render)
+        print(
+            f"{name:<24} {rejection:>9.3f}s {pruned:>11.3f}s {setup:>7.3f}s "
+            f"{rejection / pruned:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Compare the fast and system default RNG policies for unseeded calls."""
+
+from __future__ import annotations
+
+import timeit
+from typing import Callable
+
+from wordsmith import (
+    ExoticCharacter,
+    NauticalShipName,
+    PersonName,
+    ReadableUniqueIdentifier,
+    RngPolicy,
+    WorkTitle,
+    set_default_rng_policy,
+)
+
+CALLS = 20_000
+
+
+def build_cases() -> dict[str, Callable[[], str]]:
+    return {
+        "PersonName": PersonName(),
+        "NauticalShipName": NauticalShipName(),
+        "WorkTitle": WorkTitle(),
+        "ExoticCharacter": ExoticCharacter.random_character,
+        "Identifier": ReadableUniqueIdentifier.make_identifier,
+    }
+
+
+def time_calls(call: Callable[[], str], policy: RngPolicy) -> float:
+    set_default_rng_policy(policy)
+    try:
+        return timeit.timeit(call, number=CALLS)
+    finally:
+        set_default_rng_policy(RngPolicy.FAST)
+
+
+def main() -> None:
+    print(f"{'call':<20} {'system':>10} {'fast':>10} {'speedup':>8}")
+    for name, call in build_cases().items():
+        system = time_calls(call, RngPolicy.SYSTEM)
+        fast = time_calls(call, RngPolicy.FAST)
+        print(f"{name:<20} {system:>9.3f}s {fast:>9.3f}s {system / fast:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
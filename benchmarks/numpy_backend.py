@@ -0,0 +1,62 @@
+"""Compare NumPy-backed and pure-Python batch rendering throughput.
+
+Renders 10 million texts per case by default; pass a smaller count as the
+first argument for a quick run. Requires the ``numpy`` extra.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from wordsmith import (
+    Adjective,
+    Component,
+    CriminalGangName,
+    GivenName,
+    Noun,
+    PersonName,
+    Surname,
+    TownName,
+    WorkTitle,
+    maybe,
+)
+from wordsmith.vectorized import render_array
+
+RENDERS = 10_000_000
+
+
+def build_cases() -> dict[str, Component]:
+    return {
+        "Noun": Noun(),
+        "Full name": GivenName() | maybe(GivenName(), probability=0.2) | Surname(),
+        "Adjective noun": (Adjective() | Noun().prefixed_by_article()).title_case(),
+        "PersonName": PersonName(),
+        "TownName": TownName(),
+        "CriminalGangName": CriminalGangName(),
+        "WorkTitle": WorkTitle(),
+    }
+
+
+def time_call(call) -> float:
+    start = time.perf_counter()
+    call()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    renders = int(sys.argv[1]) if len(sys.argv) > 1 else RENDERS
+    print(f"{renders:,} renders per case")
+    print(f"{'component':<18} {'make_many':>12} {'numpy':>12} {'speedup':>8}")
+    for name, component in build_cases().items():
+        python = time_call(lambda: component.make_many(random.Random(0), renders))
+        vectorized = time_call(lambda: render_array(component, renders, 0))
+        print(
+            f"{name:<18} {renders / python:>10,.0f}/s {renders / vectorized:>10,.0f}/s"
+            f" {python / vectorized:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,10 @@ def main() -> None:
         print(ExoticCharacter.random_character_from_set("runic", rng), end=" ")
     print()
 
+    print("\nRandom strings:")
+    for length in (8, 16, 32):
+        print(ExoticCharacter.random_string(length, rng=rng))
+
 
 if __name__ == "__main__":
     main()
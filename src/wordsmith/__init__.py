@@ -1,66 +1,170 @@
 """Wordsmith text-generation DSL."""
 
-from wordsmith.core import (
-    Capitalized,
-    Component,
-    Either,
-    Empty,
-    FirstUppercased,
-    Literal,
-    Maybe,
-    OneOf,
-    PossessiveForm,
-    PrefixedByArticle,
-    PrefixedByDeterminer,
-    Text,
-    TitleCased,
-    WeightedOneOf,
-    either,
-    maybe,
-    one_of,
-    text,
-    weighted_one_of,
-)
-from wordsmith.generators import (
-    BandName,
-    CriminalGangName,
-    FictionalElementName,
-    FictionalMineralName,
-    NauticalShipName,
-    SimpleWorkTitle,
-    TownName,
-    UnusualWorkTitle,
-    WorkTitle,
-)
-from wordsmith.specials import ExoticCharacter, ReadableUniqueIdentifier
-from wordsmith.names import (
-    AncientName,
-    BinaryGender,
-    GivenName,
-    PersonName,
-    Surname,
-    WeirdName,
-)
-from wordsmith.words import (
-    Adjective,
-    Adverb,
-    Article,
-    ChemicalCompoundName,
-    Determiner,
-    LocationAdjective,
-    MartialSocialConcept,
-    NauticalShipNameColor,
-    NauticalShipNameObject,
-    Noun,
-    PrimitiveWeapon,
-    Pronoun,
-    ShipNameAdjective,
-    TimeOfDay,
-    UCBerkeleyEmotion,
-    Verb,
-    VerbTense,
-    VillainousPersonNoun,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wordsmith.core import (
+        Capitalized,
+        CoinFlips,
+        Component,
+        Either,
+        Empty,
+        FirstUppercased,
+        GrammarComponent,
+        Literal,
+        LiteralChoice,
+        Maybe,
+        OneOf,
+        PossessiveForm,
+        PrefixedByArticle,
+        PrefixedByDeterminer,
+        RolledOneOf,
+        Text,
+        TitleCased,
+        WeightedOneOf,
+        coin_flips,
+        either,
+        maybe,
+        one_of,
+        optimize,
+        rolled_one_of,
+        text,
+        weighted_one_of,
+    )
+    from wordsmith.generators import (
+        BandName,
+        CriminalGangName,
+        FictionalElementName,
+        FictionalMineralName,
+        NauticalShipName,
+        SimpleWorkTitle,
+        TownName,
+        UnusualWorkTitle,
+        WorkTitle,
+    )
+    from wordsmith.specials import (
+        DecodedIdentifier,
+        ExoticCharacter,
+        IdentifierLayout,
+        IdentifierMinter,
+        ReadableUniqueIdentifier,
+    )
+    from wordsmith.names import (
+        AncientName,
+        BinaryGender,
+        GivenName,
+        PersonName,
+        Surname,
+        WeirdName,
+    )
+    from wordsmith.util import (
+        CounterRandom,
+        RngPolicy,
+        SamplerPolicy,
+        preload,
+        set_default_rng_policy,
+        set_default_sampler_policy,
+    )
+    from wordsmith.words import (
+        Adjective,
+        Adverb,
+        Article,
+        ChemicalCompoundName,
+        Determiner,
+        LocationAdjective,
+        MartialSocialConcept,
+        NauticalShipNameColor,
+        NauticalShipNameObject,
+        Noun,
+        PrimitiveWeapon,
+        Pronoun,
+        ShipNameAdjective,
+        TimeOfDay,
+        UCBerkeleyEmotion,
+        Verb,
+        VerbTense,
+        VillainousPersonNoun,
+        WordList,
+    )
+
+# Public names resolve on first access (PEP 562), so importing one component
+# does not pull in every generator and its word lists.
+_LAZY_IMPORTS: dict[str, str] = {
+    "Capitalized": "wordsmith.core",
+    "CoinFlips": "wordsmith.core",
+    "Component": "wordsmith.core",
+    "Either": "wordsmith.core",
+    "Empty": "wordsmith.core",
+    "FirstUppercased": "wordsmith.core",
+    "GrammarComponent": "wordsmith.core",
+    "Literal": "wordsmith.core",
+    "LiteralChoice": "wordsmith.core",
+    "Maybe": "wordsmith.core",
+    "OneOf": "wordsmith.core",
+    "PossessiveForm": "wordsmith.core",
+    "PrefixedByArticle": "wordsmith.core",
+    "PrefixedByDeterminer": "wordsmith.core",
+    "RolledOneOf": "wordsmith.core",
+    "Text": "wordsmith.core",
+    "TitleCased": "wordsmith.core",
+    "WeightedOneOf": "wordsmith.core",
+    "coin_flips": "wordsmith.core",
+    "either": "wordsmith.core",
+    "maybe": "wordsmith.core",
+    "one_of": "wordsmith.core",
+    "optimize": "wordsmith.core",
+    "rolled_one_of": "wordsmith.core",
+    "text": "wordsmith.core",
+    "weighted_one_of": "wordsmith.core",
+    "BandName": "wordsmith.generators",
+    "CriminalGangName": "wordsmith.generators",
+    "FictionalElementName": "wordsmith.generators",
+    "FictionalMineralName": "wordsmith.generators",
+    "NauticalShipName": "wordsmith.generators",
+    "SimpleWorkTitle": "wordsmith.generators",
+    "TownName": "wordsmith.generators",
+    "UnusualWorkTitle": "wordsmith.generators",
+    "WorkTitle": "wordsmith.generators",
+    "AncientName": "wordsmith.names",
+    "BinaryGender": "wordsmith.names",
+    "GivenName": "wordsmith.names",
+    "PersonName": "wordsmith.names",
+    "Surname": "wordsmith.names",
+    "WeirdName": "wordsmith.names",
+    "DecodedIdentifier": "wordsmith.specials",
+    "ExoticCharacter": "wordsmith.specials",
+    "IdentifierLayout": "wordsmith.specials",
+    "IdentifierMinter": "wordsmith.specials",
+    "ReadableUniqueIdentifier": "wordsmith.specials",
+    "CounterRandom": "wordsmith.util",
+    "RngPolicy": "wordsmith.util",
+    "SamplerPolicy": "wordsmith.util",
+    "preload": "wordsmith.util",
+    "set_default_rng_policy": "wordsmith.util",
+    "set_default_sampler_policy": "wordsmith.util",
+    "Adjective": "wordsmith.words",
+    "Adverb": "wordsmith.words",
+    "Article": "wordsmith.words",
+    "ChemicalCompoundName": "wordsmith.words",
+    "Determiner": "wordsmith.words",
+    "LocationAdjective": "wordsmith.words",
+    "MartialSocialConcept": "wordsmith.words",
+    "NauticalShipNameColor": "wordsmith.words",
+    "NauticalShipNameObject": "wordsmith.words",
+    "Noun": "wordsmith.words",
+    "PrimitiveWeapon": "wordsmith.words",
+    "Pronoun": "wordsmith.words",
+    "ShipNameAdjective": "wordsmith.words",
+    "TimeOfDay": "wordsmith.words",
+    "UCBerkeleyEmotion": "wordsmith.words",
+    "Verb": "wordsmith.words",
+    "VerbTense": "wordsmith.words",
+    "VillainousPersonNoun": "wordsmith.words",
+    "WordList": "wordsmith.words",
+}
 
 __all__ = [
     "Adjective",
@@ -70,8 +174,10 @@ __all__ = [
     "BandName",
     "BinaryGender",
     "Capitalized",
+    "CoinFlips",
     "ChemicalCompoundName",
     "Component",
+    "CounterRandom",
     "CriminalGangName",
     "Determiner",
     "Either",
@@ -80,7 +186,9 @@ __all__ = [
     "FictionalMineralName",
     "FirstUppercased",
     "GivenName",
+    "GrammarComponent",
     "Literal",
+    "LiteralChoice",
     "LocationAdjective",
     "MartialSocialConcept",
     "Maybe",
@@ -95,8 +203,14 @@ __all__ = [
     "PrefixedByDeterminer",
     "PrimitiveWeapon",
     "Pronoun",
+    "DecodedIdentifier",
     "ExoticCharacter",
+    "IdentifierLayout",
+    "IdentifierMinter",
     "ReadableUniqueIdentifier",
+    "RngPolicy",
+    "RolledOneOf",
+    "SamplerPolicy",
     "ShipNameAdjective",
     "SimpleWorkTitle",
     "Surname",
@@ -112,9 +226,29 @@ __all__ = [
     "WeirdName",
     "WorkTitle",
     "WeightedOneOf",
+    "WordList",
+    "coin_flips",
     "either",
     "maybe",
     "one_of",
+    "optimize",
+    "preload",
+    "rolled_one_of",
+    "set_default_rng_policy",
+    "set_default_sampler_policy",
     "text",
     "weighted_one_of",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
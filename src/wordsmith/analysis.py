@@ -0,0 +1,553 @@
+"""Exact output-space analysis of component trees, without sampling.
+
+Counts and entropies are taken over *derivations*: the distinct sequences of
+output-affecting choices a component can make. Leaves (word lists, literal
+choices, names) are measured on their distinct strings. Branches of a choice
+that happen to render the same text are still counted separately, so
+``cardinality`` is an upper bound on the number of distinct strings and
+``entropy_bits`` an upper bound on the entropy of the rendered text; both are
+exact when branches do not overlap.
+
+Components rendered only through a custom ``make_text`` cannot be analyzed
+and raise ``TypeError``.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
+import math
+from typing import Iterable, Sequence
+
+from wordsmith.core.base import Component, GrammarComponent
+from wordsmith.core.components import (
+    Capitalized,
+    CoinFlips,
+    Either,
+    Empty,
+    FirstUppercased,
+    Literal,
+    LiteralChoice,
+    Maybe,
+    OneOf,
+    PossessiveForm,
+    PrefixedByArticle,
+    PrefixedByDeterminer,
+    RolledOneOf,
+    Text,
+    TitleCased,
+    WeightedOneOf,
+)
+from wordsmith.names.ancient_name import AncientName
+from wordsmith.names.gender import BinaryGender
+from wordsmith.names.given_name import GivenName
+from wordsmith.names.weird_name import WeirdName
+from wordsmith.words.articles import Article, Determiner
+from wordsmith.words.base import Pronoun, WordList
+
+Cardinality = int | float
+"""An exact count, or ``math.inf`` for recursive grammars."""
+
+_WRAPPERS = (Capitalized, FirstUppercased, TitleCased, PossessiveForm)
+_ENTROPY_TOLERANCE = 1e-12
+_ENTROPY_MAX_ITERATIONS = 10_000
+
+
+@dataclass(frozen=True)
+class BranchReport:
+    """Probability and output space of one branch of a choice node."""
+
+    path: tuple[int, ...]
+    """Child positions from the root, through ``Text`` parts and choices."""
+
+    label: str
+    probability: float
+    """Probability that a render takes this branch."""
+
+    cardinality: Cardinality
+    entropy_bits: float
+
+
+def cardinality(component: Component) -> Cardinality:
+    """Return the number of distinct derivations ``component`` can render.
+
+    Text multiplies its parts and choices sum their reachable options.
+    Recursive grammars return ``math.inf``.
+    """
+    return _Analyzer().cardinality(component)
+
+
+def entropy_bits(component: Component) -> float:
+    """Return the Shannon entropy of ``component``'s derivations, in bits.
+
+    Recursive grammars are solved as a fixed point, which is finite whenever
+    recursion ends with probability 1.
+    """
+    return _Analyzer().entropy_bits(component)
+
+
+def branch_report(component: Component, depth: int = 1) -> list[BranchReport]:
+    """Report every branch of the choice nodes within ``depth`` choice levels.
+
+    Each entry gives the probability of reaching the branch from the root,
+    along with the branch's own cardinality and entropy.
+    """
+    if depth < 1:
+        raise ValueError("Depth must be at least 1.")
+    analyzer = _Analyzer()
+    # Solving the root once leaves every branch a single memoized pass.
+    analyzer.entropy_bits(component)
+    reports: list[BranchReport] = []
+    analyzer.collect_branches(component, (), 1.0, depth, reports, set())
+    return reports
+
+
+def _distribution_entropy(probabilities: Iterable[float]) -> float:
+    return -sum(p * math.log2(p) for p in probabilities if p > 0.0)
+
+
+def _binary_entropy(probability: float) -> float:
+    return _distribution_entropy((probability, 1.0 - probability))
+
+
+def _string_distribution(
+    groups: Sequence[tuple[float, Sequence[str]]],
+) -> dict[str, float]:
+    """Merge uniform picks from weighted groups into one string distribution."""
+    distribution: dict[str, float] = {}
+    for weight, values in groups:
+        if weight <= 0.0:
+            continue
+        for value, count in Counter(values).items():
+            share = weight * count / len(values)
+            distribution[value] = distribution.get(value, 0.0) + share
+    return distribution
+
+
+def _frequency_distribution(
+    groups: Sequence[tuple[float, Sequence[str], Sequence[float] | None]],
+) -> dict[str, float]:
+    """Like ``_string_distribution``, with optional per-value weights."""
+    distribution: dict[str, float] = {}
+    for share, values, weights in groups:
+        if weights is None:
+            for value, probability in _string_distribution([(share, values)]).items():
+                distribution[value] = distribution.get(value, 0.0) + probability
+            continue
+        total = math.fsum(weights)
+        for value, weight in zip(values, weights):
+            distribution[value] = distribution.get(value, 0.0) + share * weight / total
+    return distribution
+
+
+def _leaf_distribution(component: Component) -> dict[str, float] | None:
+    """Return the output distribution of a leaf, or ``None`` for non-leaves."""
+    if isinstance(component, Literal):
+        return {component.text: 1.0}
+    if isinstance(component, Empty):
+        return {"": 1.0}
+    if isinstance(component, (LiteralChoice, WordList, GivenName, Pronoun)):
+        return _cached_leaf_distribution(component)
+    return None
+
+
+@lru_cache(maxsize=None)
+def _cached_leaf_distribution(component: Component) -> dict[str, float] | None:
+    if isinstance(component, LiteralChoice):
+        return _string_distribution([(1.0, component.values)])
+    if isinstance(component, WordList):
+        return _frequency_distribution(
+            [(1.0, component.word_table(), component.word_weights())]
+        )
+    if isinstance(component, GivenName):
+        genders = (
+            [component.gender]
+            if component.gender is not None
+            else [BinaryGender.MALE, BinaryGender.FEMALE]
+        )
+        names = [component._names(gender) for gender in genders]
+        return _frequency_distribution(
+            [
+                (1.0 / len(names), word_list.word_table(), word_list.word_weights())
+                for word_list in names
+            ]
+        )
+    if isinstance(component, Pronoun):
+        if component.is_third_person:
+            values = ["he", "she", "it"] if component.is_singular else ["they"]
+        else:
+            values = ["I", "you"] if component.is_singular else ["we", "you"]
+        return _string_distribution([(1.0, values)])
+    return None
+
+
+def _leaf_entropy(component: Component) -> float | None:
+    """Return the entropy of a leaf, or ``None`` for non-leaves."""
+    if isinstance(component, (LiteralChoice, WordList, GivenName, Pronoun)):
+        return _cached_leaf_entropy(component)
+    leaf = _leaf_distribution(component)
+    return None if leaf is None else _distribution_entropy(leaf.values())
+
+
+@lru_cache(maxsize=None)
+def _cached_leaf_entropy(component: Component) -> float:
+    return _distribution_entropy(_cached_leaf_distribution(component).values())
+
+
+def _choices(component: Component) -> list[tuple[float, Component]] | None:
+    """Return ``(probability, branch)`` pairs for choice nodes."""
+    if isinstance(component, OneOf):
+        share = 1.0 / len(component.options)
+        return [(share, option) for option in component.options]
+    if isinstance(component, CoinFlips):
+        share = 1.0 / len(component.options)
+        return [(share, option) for option in component.options]
+    if isinstance(component, (WeightedOneOf, RolledOneOf)):
+        total = float(sum(component.weights))
+        return [
+            (weight / total, option)
+            for weight, option in zip(component.weights, component.options)
+        ]
+    if isinstance(component, Either):
+        probability = component.first_probability
+        return [(probability, component.first), (1.0 - probability, component.second)]
+    if isinstance(component, Maybe):
+        probability = component.probability
+        return [(probability, component.option), (1.0 - probability, Empty())]
+    return None
+
+
+def _prefix_options(component: Component) -> int | None:
+    if isinstance(component, PrefixedByArticle):
+        return len(Article._options)
+    if isinstance(component, PrefixedByDeterminer):
+        return len(Determiner._options)
+    return None
+
+
+def _unsupported(component: Component) -> TypeError:
+    return TypeError(
+        f"Cannot analyze {type(component).__name__}: it renders through a custom "
+        "make_text rather than a component tree."
+    )
+
+
+class _Analyzer:
+    """Analysis state that memoizes the result of every node it has measured.
+
+    Counts are cached for every node. Entropies are cached once they no longer
+    depend on a recursive estimate; solving a recursive grammar caches the
+    converged values of its recursive references, so later nodes of the same
+    grammar are measured in a single pass. The tables are keyed by ``id``
+    because component hashes walk the whole subtree; each entry keeps its
+    node alive so the id cannot be reused.
+    """
+
+    def __init__(self) -> None:
+        self._counts: dict[int, tuple[Component, Cardinality]] = {}
+        self._entropies: dict[int, tuple[Component, float]] = {}
+
+    def cardinality(self, component: Component) -> Cardinality:
+        return self._count(component, set())
+
+    def entropy_bits(self, component: Component) -> float:
+        estimates: dict[GrammarComponent, float] = {}
+        for _ in range(_ENTROPY_MAX_ITERATIONS):
+            updated: dict[GrammarComponent, float] = {}
+            value = self._entropy(component, estimates, updated, set())[0]
+            if math.isinf(value):
+                return value
+            if all(
+                abs(updated[grammar] - estimates.get(grammar, 0.0))
+                <= _ENTROPY_TOLERANCE * max(1.0, updated[grammar])
+                for grammar in updated
+            ):
+                for grammar, bits in updated.items():
+                    self._entropies[id(grammar)] = grammar, bits
+                return value
+            estimates = updated
+        return math.inf
+
+    def _count(
+        self,
+        component: Component,
+        active: set[GrammarComponent],
+    ) -> Cardinality:
+        # A node that reaches a recursive reference counts as ``math.inf``
+        # from wherever it is entered, so every result can be cached.
+        leaf = _leaf_distribution(component)
+        if leaf is not None:
+            return len(leaf)
+        if (cached := self._counts.get(id(component))) is not None:
+            return cached[1]
+
+        if isinstance(component, GrammarComponent):
+            if component in active:
+                return math.inf
+            active.add(component)
+            try:
+                value = self._count(component.grammar(), active)
+            finally:
+                active.discard(component)
+        elif isinstance(component, Text):
+            value = math.prod(self._count(part, active) for part in component.parts)
+        elif (choices := _choices(component)) is not None:
+            value = sum(
+                self._count(option, active)
+                for probability, option in choices
+                if probability
+            )
+        elif isinstance(component, _WRAPPERS):
+            value = self._count(component.wrapped, active)
+        elif (prefixes := _prefix_options(component)) is not None:
+            value = prefixes * self._count(component.wrapped, active)  # type: ignore[attr-defined]
+        elif isinstance(component, AncientName):
+            value = _ancient_name_space(component)[0]
+        elif isinstance(component, WeirdName):
+            value = _weird_name_space(component)[0]
+        else:
+            raise _unsupported(component)
+        self._counts[id(component)] = component, value
+        return value
+
+    def _entropy(
+        self,
+        component: Component,
+        estimates: dict[GrammarComponent, float],
+        updated: dict[GrammarComponent, float],
+        active: set[GrammarComponent],
+    ) -> tuple[float, set[GrammarComponent]]:
+        """Return the entropy and the recursive references it estimated."""
+        if (cached := self._entropies.get(id(component))) is not None:
+            return cached[1], set()
+        if (leaf := _leaf_entropy(component)) is not None:
+            self._entropies[id(component)] = component, leaf
+            return leaf, set()
+
+        if isinstance(component, GrammarComponent):
+            if component in active:
+                return estimates.get(component, 0.0), {component}
+            active.add(component)
+            try:
+                value, recursion = self._entropy(
+                    component.grammar(), estimates, updated, active
+                )
+            finally:
+                active.discard(component)
+            if recursion:
+                # Keep reporting the recursion so callers, which depend on
+                # this estimate too, are re-solved rather than cached.
+                updated[component] = value
+            else:
+                self._entropies[id(component)] = component, value
+            return value, recursion
+
+        def child(option: Component) -> tuple[float, set[GrammarComponent]]:
+            return self._entropy(option, estimates, updated, active)
+
+        children: list[tuple[float, set[GrammarComponent]]]
+        if isinstance(component, Text):
+            children = [child(part) for part in component.parts]
+            value = sum(bits for bits, _ in children)
+        elif (choices := _choices(component)) is not None:
+            reachable = [(p, option) for p, option in choices if p]
+            children = [child(option) for _, option in reachable]
+            value = _distribution_entropy(p for p, _ in choices) + sum(
+                p * bits for (p, _), (bits, _) in zip(reachable, children)
+            )
+        elif isinstance(component, _WRAPPERS):
+            children = [child(component.wrapped)]
+            value = children[0][0]
+        elif (prefixes := _prefix_options(component)) is not None:
+            children = [child(component.wrapped)]  # type: ignore[attr-defined]
+            value = math.log2(prefixes) + children[0][0]
+        elif isinstance(component, AncientName):
+            children = []
+            value = _ancient_name_space(component)[1]
+        elif isinstance(component, WeirdName):
+            children = []
+            value = _weird_name_space(component)[1]
+        else:
+            raise _unsupported(component)
+        recursion = set().union(*(recursion for _, recursion in children))
+        if not recursion:
+            self._entropies[id(component)] = component, value
+        return value, recursion
+
+    def collect_branches(
+        self,
+        component: Component,
+        path: tuple[int, ...],
+        probability: float,
+        depth: int,
+        reports: list[BranchReport],
+        active: set[GrammarComponent],
+    ) -> None:
+        if isinstance(component, GrammarComponent):
+            if component in active:
+                return
+            active.add(component)
+            try:
+                self.collect_branches(
+                    component.grammar(), path, probability, depth, reports, active
+                )
+            finally:
+                active.discard(component)
+            return
+
+        if isinstance(component, Text):
+            for index, part in enumerate(component.parts):
+                self.collect_branches(
+                    part, path + (index,), probability, depth, reports, active
+                )
+            return
+
+        if isinstance(component, _WRAPPERS) or _prefix_options(component) is not None:
+            wrapped = component.wrapped  # type: ignore[attr-defined]
+            self.collect_branches(wrapped, path, probability, depth, reports, active)
+            return
+
+        choices = _choices(component)
+        if choices is None:
+            return
+        for index, (share, option) in enumerate(choices):
+            branch_path = path + (index,)
+            reports.append(
+                BranchReport(
+                    path=branch_path,
+                    label=_describe(option),
+                    probability=probability * share,
+                    cardinality=self.cardinality(option),
+                    entropy_bits=self.entropy_bits(option),
+                )
+            )
+            if depth > 1 and share:
+                self.collect_branches(
+                    option,
+                    branch_path,
+                    probability * share,
+                    depth - 1,
+                    reports,
+                    active,
+                )
+
+
+def _describe(component: Component) -> str:
+    if isinstance(component, Literal):
+        return repr(component.text)
+    if isinstance(component, (GrammarComponent, WordList)):
+        return repr(component)
+    if isinstance(component, _WRAPPERS):
+        return f"{type(component).__name__}({_describe(component.wrapped)})"
+    text = repr(component)
+    return text if len(text) <= 80 else f"{text[:77]}..."
+
+
+@lru_cache(maxsize=None)
+def _ancient_name_space(component: AncientName) -> tuple[int, float]:
+    """Closed-form derivation count and entropy for ``AncientName``."""
+    consonants = _string_distribution(
+        [
+            (0.90, AncientName._single_consonants),
+            (0.10, AncientName._double_consonants),
+        ]
+    )
+    vowels = _string_distribution(
+        [(0.95, AncientName._single_vowels), (0.05, AncientName._double_vowels)]
+    )
+    consonant_count, vowel_count = len(consonants), len(vowels)
+    consonant_bits = _distribution_entropy(consonants.values())
+    vowel_bits = _distribution_entropy(vowels.values())
+
+    # Syllable patterns: consonant-vowel, vowel-consonant, vowel only.
+    patterns = (
+        ("cv", Fraction(65, 100), consonant_count * vowel_count),
+        ("vc", Fraction(20, 100), vowel_count * consonant_count),
+        ("v", Fraction(15, 100), vowel_count),
+    )
+    opens_apostrophe = {"cv", "v"}
+    closes_apostrophe = {"vc", "v"}
+
+    # Walk the syllables tracking (last pattern, apostrophe slot seen yet) to
+    # count derivations and the chance that an apostrophe can be placed.
+    counts: dict[tuple[str | None, bool], int] = {(None, False): 1}
+    chances: dict[tuple[str | None, bool], Fraction] = {(None, False): Fraction(1)}
+    for _ in range(component.syllable_count):
+        next_counts: dict[tuple[str | None, bool], int] = {}
+        next_chances: dict[tuple[str | None, bool], Fraction] = {}
+        for (last, seen), count in counts.items():
+            for pattern, chance, letters in patterns:
+                key = (
+                    pattern,
+                    seen or (last in opens_apostrophe and pattern in closes_apostrophe),
+                )
+                next_counts[key] = next_counts.get(key, 0) + count * letters
+                next_chances[key] = (
+                    next_chances.get(key, Fraction(0)) + chances[(last, seen)] * chance
+                )
+        counts, chances = next_counts, next_chances
+
+    def with_final_consonant(last: str | None) -> int:
+        return 1 if last == "vc" else 1 + consonant_count
+
+    total = sum(
+        count * with_final_consonant(last) for (last, _), count in counts.items()
+    )
+    with_slot = sum(
+        count * with_final_consonant(last)
+        for (last, seen), count in counts.items()
+        if seen
+    )
+    slot_chance = float(sum(chance for (_, seen), chance in chances.items() if seen))
+
+    count = total + (with_slot if component.allow_apostrophe else 0)
+    bits = component.syllable_count * (
+        _distribution_entropy(float(chance) for _, chance, _ in patterns)
+        + 0.85 * (consonant_bits + vowel_bits)
+        + 0.15 * vowel_bits
+    )
+    bits += 0.80 * (_binary_entropy(0.4) + 0.4 * consonant_bits)
+    if component.allow_apostrophe:
+        bits += slot_chance
+
+    if component.syllable_count > 3 and component.allow_hyphen:
+        positions = component.syllable_count - 3
+        count *= 1 + positions
+        bits += _binary_entropy(0.25) + 0.25 * math.log2(positions)
+    return count, bits
+
+
+@lru_cache(maxsize=None)
+def _weird_name_space(component: WeirdName) -> tuple[int, float]:
+    """Closed-form derivation count and entropy for ``WeirdName``."""
+    syllables = _string_distribution([(1.0, WeirdName._open_ended_syllables)])
+    endings = _string_distribution([(1.0, WeirdName._ending_sounds)])
+    count_syllables = component.syllable_count
+
+    # Hyphen and apostrophe each appear with probability 1/2 after a uniform
+    # syllable; an apostrophe after the same syllable replaces the hyphen.
+    markers: dict[tuple[int, int], Fraction] = {(0, 0): Fraction(1)}
+    if count_syllables > 2:
+        slots = range(1, count_syllables)
+
+        def placements(allowed: bool) -> list[tuple[int, Fraction]]:
+            if not allowed:
+                return [(0, Fraction(1))]
+            share = Fraction(1, 2 * len(slots))
+            return [(0, Fraction(1, 2))] + [(slot, share) for slot in slots]
+
+        markers = {}
+        for hyphen, hyphen_chance in placements(component.allow_hyphen):
+            for apostrophe, apostrophe_chance in placements(component.allow_apostrophe):
+                key = (0 if hyphen == apostrophe else hyphen, apostrophe)
+                markers[key] = (
+                    markers.get(key, Fraction(0)) + hyphen_chance * apostrophe_chance
+                )
+
+    count = len(markers) * len(syllables) ** count_syllables * (1 + len(endings))
+    bits = _distribution_entropy(float(chance) for chance in markers.values())
+    bits += count_syllables * _distribution_entropy(syllables.values())
+    bits += 1.0 + 0.5 * _distribution_entropy(endings.values())
+    return count, bits
@@ -0,0 +1,674 @@
+"""Length- and word-count-constrained generation.
+
+``constrained(component, max_len=24)`` renders only texts that fit a window
+of lengths and word counts. Instead of looping over ``make_text`` until a
+text fits, it bounds the length and word count of every subtree, drops
+word-list entries and choice branches that cannot fit before drawing, and
+rejects only the remaining misses. Word lists are filtered through an index
+of their entries sorted by length.
+
+Pruned choices are reweighted by the probability their branch keeps, so
+output follows the component's own distribution conditioned on fitting,
+exactly as a rejection loop would. Subtrees without bounds, such as
+recursive grammars and components with a custom ``make_text``, are kept
+whole and left to rejection.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+import math
+import random
+from typing import Callable, TypeVar
+
+from wordsmith.analysis import _choices, _leaf_distribution
+from wordsmith.core.base import Component, GrammarComponent, Renderer
+from wordsmith.core.components import (
+    Capitalized,
+    Empty,
+    FirstUppercased,
+    Literal,
+    LiteralChoice,
+    PossessiveForm,
+    PrefixedByArticle,
+    PrefixedByDeterminer,
+    Text,
+    TitleCased,
+    WeightedOneOf,
+)
+from wordsmith.core.optimizer import optimize
+from wordsmith.names.ancient_name import AncientName
+from wordsmith.names.given_name import GivenName
+from wordsmith.names.weird_name import WeirdName
+from wordsmith.ranking import _ancient_name_tree, _weird_name_tree
+from wordsmith.util.samplers import CumulativeSampler
+from wordsmith.words.articles import Article, Determiner
+from wordsmith.words.base import Pronoun, WordList
+
+T = TypeVar("T")
+
+MAX_ATTEMPTS = 100_000
+"""Draws of the pruned tree a constrained component makes per text before
+giving up."""
+
+TEXT_PASSES = 4
+"""Times ``Text`` parts are re-pruned as their siblings' bounds tighten."""
+
+_CASINGS = (Capitalized, FirstUppercased, TitleCased)
+_LEAVES = (
+    Literal,
+    Empty,
+    LiteralChoice,
+    WordList,
+    GivenName,
+    Pronoun,
+    Article,
+    Determiner,
+)
+_MAX_EXPANSION = 3
+"""Most characters a single character can become under case mapping."""
+
+
+def constrained(
+    component: Component,
+    *,
+    max_len: int | None = None,
+    min_len: int = 0,
+    max_words: int | None = None,
+) -> Constrained:
+    """Return a component that renders only texts within the given limits.
+
+    Lengths count characters and words count ``str.split()`` tokens.
+    """
+    return Constrained(
+        component, min_len=min_len, max_len=max_len, max_words=max_words
+    )
+
+
+@dataclass(frozen=True)
+class Constrained(Component):
+    """Render ``wrapped`` conditioned on its text fitting length and word limits.
+
+    The pruned tree is built on first render. Raises ``ValueError`` when no
+    output can fit, or when ``MAX_ATTEMPTS`` draws in a row miss.
+    """
+
+    wrapped: Component
+    min_len: int = 0
+    max_len: int | None = None
+    max_words: int | None = None
+    _tree: Component | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.min_len < 0:
+            raise ValueError("Minimum length must be non-negative.")
+        if self.max_len is not None and self.max_len < self.min_len:
+            raise ValueError("Maximum length must be at least the minimum length.")
+        if self.max_words is not None and self.max_words < 0:
+            raise ValueError("Maximum word count must be non-negative.")
+
+    def accepts(self, text: str) -> bool:
+        """Return whether ``text`` fits the limits."""
+        if len(text) < self.min_len:
+            return False
+        if self.max_len is not None and len(text) > self.max_len:
+            return False
+        return self.max_words is None or _word_count(text) <= self.max_words
+
+    def pruned(self) -> Component:
+        """Return the tree that draws replace ``wrapped`` with."""
+        if self._tree is None:
+            object.__setattr__(self, "_tree", _pruned_tree(self))
+        return self._tree  # type: ignore[return-value]
+
+    def make_text(self, rng: random.Random) -> str:
+        return self._draw(self.pruned().make_text, rng)
+
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        tree = self.pruned()
+        accepts = self.accepts
+        texts: list[str] = []
+        for _ in range(MAX_ATTEMPTS):
+            if len(texts) >= n:
+                return texts[:n]
+            texts.extend(
+                text for text in tree.make_many(rng, n - len(texts)) if accepts(text)
+            )
+        raise self._exhausted()
+
+    def _compile(self, compile_child: Callable[[Component], Renderer]) -> Renderer:
+        render_tree = self.pruned().compile()
+        draw = self._draw
+
+        def render(rng: random.Random) -> str:
+            return draw(render_tree, rng)
+
+        return render
+
+    def _draw(self, render: Renderer, rng: random.Random) -> str:
+        accepts = self.accepts
+        for _ in range(MAX_ATTEMPTS):
+            text = render(rng)
+            if accepts(text):
+                return text
+        raise self._exhausted()
+
+    def _exhausted(self) -> ValueError:
+        return ValueError(
+            f"No output of {self.wrapped!r} fit the constraints in {MAX_ATTEMPTS} "
+            "draws."
+        )
+
+
+@lru_cache(maxsize=128)
+def _pruned_tree(component: Constrained) -> Component:
+    window = _Window(
+        component.min_len,
+        math.inf if component.max_len is None else component.max_len,
+        0,
+        math.inf if component.max_words is None else component.max_words,
+    )
+    result = _Pruner().prune(optimize(component.wrapped), window)
+    if result is None:
+        raise ValueError(f"No output of {component.wrapped!r} fits the constraints.")
+    return result[0]
+
+
+@dataclass(frozen=True)
+class _Bounds:
+    """Lengths and word counts every output of a subtree falls within.
+
+    ``stable`` means casing cannot change the length of any output: every
+    character keeps its length under case mapping, and there are no leading,
+    trailing or doubled spaces for title casing to drop.
+    """
+
+    min_len: float
+    max_len: float
+    min_words: float
+    max_words: float
+    stable: bool
+
+
+_UNKNOWN = _Bounds(0, math.inf, 0, math.inf, False)
+
+
+@dataclass(frozen=True)
+class _Window:
+    """Lengths and word counts a subtree's output must fall within."""
+
+    min_len: float
+    max_len: float
+    min_words: float
+    max_words: float
+
+    def admits(self, bounds: _Bounds) -> bool:
+        return (
+            bounds.min_len <= self.max_len
+            and self.min_len <= bounds.max_len
+            and bounds.min_words <= self.max_words
+            and self.min_words <= bounds.max_words
+        )
+
+    def covers(self, bounds: _Bounds) -> bool:
+        return (
+            self.min_len <= bounds.min_len
+            and bounds.max_len <= self.max_len
+            and self.min_words <= bounds.min_words
+            and bounds.max_words <= self.max_words
+        )
+
+
+def _is_stable(text: str) -> bool:
+    return (
+        len(text.upper()) == len(text.lower()) == len(text.title()) == len(text)
+        and text == text.strip(" ")
+        and "  " not in text
+    )
+
+
+def _word_count(text: str) -> int:
+    return len(text.split())
+
+
+class _LeafTable:
+    """A leaf's distinct outputs and their weights, sorted by length.
+
+    Subsets of a table are contiguous length ranges filtered by word count,
+    so they stay sorted and reuse the per-entry word counts. Weighted tables
+    draw through cumulative weights, built once a table is drawn from, since
+    pruning makes many short-lived subsets.
+    """
+
+    def __init__(
+        self,
+        values: tuple[str, ...],
+        weights: tuple[float, ...],
+        lengths: tuple[int, ...],
+        words: tuple[int, ...],
+        stable: tuple[bool, ...],
+    ) -> None:
+        self.values = values
+        self.weights = weights
+        self.lengths = lengths
+        self.words = words
+        self.stable = stable
+        self.bounds = _Bounds(
+            lengths[0], lengths[-1], min(words), max(words), all(stable)
+        )
+        self._uniform = max(weights) - min(weights) <= 1e-12 * max(weights)
+        self._sampler: CumulativeSampler | None = None
+
+    @classmethod
+    def from_distribution(cls, distribution: dict[str, float]) -> _LeafTable:
+        items = sorted(distribution.items(), key=lambda item: len(item[0]))
+        values = tuple(value for value, _ in items)
+        return cls(
+            values,
+            tuple(weight for _, weight in items),
+            tuple(len(value) for value in values),
+            tuple(_word_count(value) for value in values),
+            tuple(_is_stable(value) for value in values),
+        )
+
+    def _sample(self) -> CumulativeSampler:
+        if self._sampler is None:
+            self._sampler = CumulativeSampler(self.weights)
+        return self._sampler
+
+    def draw(self, rng: random.Random) -> str:
+        if self._uniform:
+            return rng.choice(self.values)
+        return self.values[self._sample().sample(rng)]
+
+    def draw_many(self, rng: random.Random, n: int) -> list[str]:
+        if self._uniform:
+            return rng.choices(self.values, k=n)
+        values = self.values
+        return [values[index] for index in self._sample().sample_many(rng, n)]
+
+    def subset(self, window: _Window) -> tuple[Component, float] | None:
+        """Return a leaf over the entries inside ``window`` and their mass."""
+        start = bisect_left(self.lengths, window.min_len)
+        stop = bisect_right(self.lengths, window.max_len)
+        kept: slice | list[int]
+        if window.min_words <= self.bounds.min_words and (
+            self.bounds.max_words <= window.max_words
+        ):
+            kept = slice(start, stop)
+        else:
+            words = self.words
+            kept = [
+                index
+                for index in range(start, stop)
+                if window.min_words <= words[index] <= window.max_words
+            ]
+        weights = _take(self.weights, kept)
+        if not weights:
+            return None
+        table = _LeafTable(
+            _take(self.values, kept),
+            weights,
+            _take(self.lengths, kept),
+            _take(self.words, kept),
+            _take(self.stable, kept),
+        )
+        return _TableLeaf(table), math.fsum(weights) / math.fsum(self.weights)
+
+
+def _take(column: tuple[T, ...], kept: slice | list[int]) -> tuple[T, ...]:
+    if isinstance(kept, slice):
+        return column[kept]
+    return tuple(column[index] for index in kept)
+
+
+@dataclass(frozen=True, eq=False)
+class _TableLeaf(Component):
+    """A leaf restricted to the table entries that fit a window."""
+
+    table: _LeafTable
+
+    def make_text(self, rng: random.Random) -> str:
+        return self.table.draw(rng)
+
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        return self.table.draw_many(rng, n)
+
+    def _compile(self, compile_child: Callable[[Component], Renderer]) -> Renderer:
+        return self.table.draw
+
+
+def _leaf_table(node: Component) -> _LeafTable | None:
+    if isinstance(node, _TableLeaf):
+        return node.table
+    if isinstance(node, _LEAVES):
+        return _cached_leaf_table(node)
+    return None
+
+
+@lru_cache(maxsize=256)
+def _cached_leaf_table(node: Component) -> _LeafTable | None:
+    if isinstance(node, (Article, Determiner)):
+        values = _article_values(node._options, node.is_before_vowel)
+        distribution = {value: values.count(value) / len(values) for value in values}
+    else:
+        distribution = _leaf_distribution(node)
+        if not distribution:
+            return None
+    return _LeafTable.from_distribution(distribution)
+
+
+def _article_values(
+    options: tuple[str, ...], is_before_vowel: bool
+) -> tuple[str, ...]:
+    """Return an article's options as rendered, with "a" as "an" before vowels."""
+    if not is_before_vowel:
+        return options
+    return tuple("an" if value == "a" else value for value in options)
+
+
+def _prefixes(node: Component) -> tuple[str, ...] | None:
+    if isinstance(node, PrefixedByArticle):
+        options = Article._options
+    elif isinstance(node, PrefixedByDeterminer):
+        options = Determiner._options
+    else:
+        return None
+    return options + _article_values(options, True)
+
+
+def _separator_words(sep: str) -> tuple[int, int]:
+    """Return the words ``sep`` adds at a join and the most it can merge.
+
+    Joining without whitespace on a side of ``sep`` can fuse the words on
+    either side of it into one.
+    """
+    if not sep:
+        return 0, 1
+    merges = (not sep[0].isspace()) + (not sep[-1].isspace())
+    return _word_count(sep), merges
+
+
+class _Pruner:
+    """Bounds and prunes one tree, keeping results for shared subtrees."""
+
+    def __init__(self) -> None:
+        self._bounds: dict[int, tuple[Component, _Bounds]] = {}
+        self._pruned: dict[
+            tuple[int, _Window], tuple[Component, tuple[Component, float] | None]
+        ] = {}
+        self._active: set[int] = set()
+
+    def bounds(self, node: Component) -> _Bounds:
+        entry = self._bounds.get(id(node))
+        if entry is not None:
+            return entry[1]
+        if isinstance(node, GrammarComponent):
+            if id(node) in self._active:
+                return _UNKNOWN
+            self._active.add(id(node))
+            try:
+                bounds = self.bounds(node.grammar())
+            finally:
+                self._active.discard(id(node))
+        else:
+            bounds = self._compute_bounds(node)
+        self._bounds[id(node)] = (node, bounds)
+        return bounds
+
+    def _compute_bounds(self, node: Component) -> _Bounds:
+        table = _leaf_table(node)
+        if table is not None:
+            return table.bounds
+        if isinstance(node, Text):
+            return self._text_bounds(node)
+
+        choices = _choices(node)
+        if choices is not None:
+            options = [self.bounds(option) for p, option in choices if p > 0]
+            return _Bounds(
+                min(bounds.min_len for bounds in options),
+                max(bounds.max_len for bounds in options),
+                min(bounds.min_words for bounds in options),
+                max(bounds.max_words for bounds in options),
+                all(bounds.stable for bounds in options),
+            )
+
+        if isinstance(node, _CASINGS):
+            inner = self.bounds(node.wrapped)
+            if inner.stable:
+                return inner
+            return _Bounds(
+                0 if isinstance(node, TitleCased) else inner.min_len,
+                _MAX_EXPANSION * inner.max_len,
+                inner.min_words,
+                inner.max_words,
+                False,
+            )
+        if isinstance(node, PossessiveForm):
+            inner = self.bounds(node.wrapped)
+            # A trailing space would leave the suffix as a word of its own.
+            return _Bounds(
+                inner.min_len + 1,
+                inner.max_len + 2,
+                max(inner.min_words, 1),
+                max(inner.max_words, 1) if inner.stable else inner.max_words + 1,
+                inner.stable,
+            )
+        prefixes = _prefixes(node)
+        if prefixes is not None:
+            inner = self.bounds(node.wrapped)  # type: ignore[attr-defined]
+            lengths = [len(prefix) + 1 for prefix in prefixes]
+            words = [_word_count(prefix) for prefix in prefixes]
+            return _Bounds(
+                inner.min_len + min(lengths),
+                inner.max_len + max(lengths),
+                inner.min_words + min(words),
+                inner.max_words + max(words),
+                inner.stable and inner.min_len > 0,
+            )
+
+        # The ranking trees render the same outputs, so they share bounds.
+        if isinstance(node, AncientName):
+            return self.bounds(_ancient_name_tree(node))
+        if isinstance(node, WeirdName):
+            return self.bounds(_weird_name_tree(node))
+        return _UNKNOWN
+
+    def _text_bounds(self, node: Text) -> _Bounds:
+        parts = [self.bounds(part) for part in node.parts]
+        if not parts:
+            return _Bounds(0, 0, 0, 0, True)
+        sep = node.sep
+        # Empty parts are skipped, so only parts that render text get a join.
+        fewest = max(0, sum(bounds.min_len > 0 for bounds in parts) - 1)
+        most = max(0, sum(bounds.max_len > 0 for bounds in parts) - 1)
+        sep_words, merges = _separator_words(sep)
+        joined_words = min(fewest * (sep_words - merges), most * (sep_words - merges))
+        min_words = sum(bounds.min_words for bounds in parts) + joined_words
+        return _Bounds(
+            sum(bounds.min_len for bounds in parts) + len(sep) * fewest,
+            sum(bounds.max_len for bounds in parts) + len(sep) * most,
+            max(min_words, 1 if any(bounds.min_words for bounds in parts) else 0),
+            sum(bounds.max_words for bounds in parts) + most * sep_words,
+            all(bounds.stable for bounds in parts)
+            and (not sep or _is_stable(sep.strip(" ")))
+            and "  " not in sep,
+        )
+
+    def prune(
+        self,
+        node: Component,
+        window: _Window,
+    ) -> tuple[Component, float] | None:
+        """Return ``node`` restricted to outputs that may fit ``window``.
+
+        The result renders ``node``'s distribution conditioned on the outputs
+        it keeps, and comes with their probability. ``None`` means nothing
+        fits.
+        """
+        bounds = self.bounds(node)
+        if not window.admits(bounds):
+            return None
+        if window.covers(bounds):
+            return node, 1.0
+        key = (id(node), window)
+        entry = self._pruned.get(key)
+        if entry is None:
+            entry = (node, self._prune(node, window))
+            self._pruned[key] = entry
+        return entry[1]
+
+    def _prune(
+        self,
+        node: Component,
+        window: _Window,
+    ) -> tuple[Component, float] | None:
+        table = _leaf_table(node)
+        if table is not None:
+            return table.subset(window)
+
+        if isinstance(node, GrammarComponent):
+            if id(node) in self._active:
+                return node, 1.0
+            self._active.add(id(node))
+            try:
+                return self.prune(node.grammar(), window)
+            finally:
+                self._active.discard(id(node))
+        if isinstance(node, Text):
+            return self._prune_text(node, window)
+
+        choices = _choices(node)
+        if choices is not None:
+            return self._prune_choice(node, choices, window)
+
+        if isinstance(node, _CASINGS):
+            if self.bounds(node.wrapped).stable:
+                inner = window
+            else:
+                inner = _Window(
+                    window.min_len / _MAX_EXPANSION,
+                    math.inf if isinstance(node, TitleCased) else window.max_len,
+                    window.min_words,
+                    window.max_words,
+                )
+            return self._prune_wrapped(node, inner)
+        if isinstance(node, PossessiveForm):
+            inner = _Window(
+                window.min_len - 2,
+                window.max_len - 1,
+                window.min_words - 1,
+                window.max_words,
+            )
+            return self._prune_wrapped(node, inner)
+        prefixes = _prefixes(node)
+        if prefixes is not None:
+            lengths = [len(prefix) + 1 for prefix in prefixes]
+            words = [_word_count(prefix) for prefix in prefixes]
+            inner = _Window(
+                window.min_len - max(lengths),
+                window.max_len - min(lengths),
+                window.min_words - max(words),
+                window.max_words - min(words),
+            )
+            return self._prune_wrapped(node, inner)
+        return node, 1.0
+
+    def _prune_wrapped(
+        self,
+        node: Component,
+        window: _Window,
+    ) -> tuple[Component, float] | None:
+        wrapped = node.wrapped  # type: ignore[attr-defined]
+        result = self.prune(wrapped, window)
+        if result is None:
+            return None
+        inner, mass = result
+        return (node if inner is wrapped else replace(node, wrapped=inner)), mass
+
+    def _prune_choice(
+        self,
+        node: Component,
+        choices: list[tuple[float, Component]],
+        window: _Window,
+    ) -> tuple[Component, float] | None:
+        kept: list[tuple[float, Component]] = []
+        changed = False
+        for probability, option in choices:
+            result = self.prune(option, window) if probability > 0 else None
+            if result is None:
+                changed = True
+                continue
+            pruned, mass = result
+            changed = changed or pruned is not option or mass != 1.0
+            kept.append((probability * mass, pruned))
+        if not kept:
+            return None
+        if not changed:
+            return node, 1.0
+        total = math.fsum(probability for probability, _ in choices)
+        mass = math.fsum(weight for weight, _ in kept) / total
+        if len(kept) == 1:
+            return kept[0][1], mass
+        return (
+            WeightedOneOf(
+                options=tuple(option for _, option in kept),
+                weights=tuple(weight for weight, _ in kept),
+            ),
+            mass,
+        )
+
+    def _prune_text(
+        self,
+        node: Text,
+        window: _Window,
+    ) -> tuple[Component, float] | None:
+        parts = list(node.parts)
+        bounds = [self.bounds(part) for part in parts]
+        sep_len = len(node.sep)
+        sep_words, merges = _separator_words(node.sep)
+        joins = len(parts) - 1
+        # Words the joins add or merge away, at the extremes.
+        fewest_join_words = min(0, joins * (sep_words - merges))
+        most_join_words = joins * sep_words
+        mass = 1.0
+
+        for _ in range(TEXT_PASSES):
+            changed = False
+            for index, part in enumerate(parts):
+                others = bounds[:index] + bounds[index + 1 :]
+                guaranteed = sum(other.min_len > 0 for other in others)
+                part_window = _Window(
+                    window.min_len
+                    - sum(other.max_len for other in others)
+                    - sep_len * joins,
+                    window.max_len
+                    - sum(other.min_len for other in others)
+                    - sep_len * max(0, guaranteed - 1),
+                    window.min_words
+                    - sum(other.max_words for other in others)
+                    - most_join_words,
+                    window.max_words
+                    - sum(other.min_words for other in others)
+                    - fewest_join_words,
+                )
+                result = self.prune(part, part_window)
+                if result is None:
+                    return None
+                pruned, part_mass = result
+                if pruned is not part:
+                    changed = True
+                    parts[index] = pruned
+                    bounds[index] = self.bounds(pruned)
+                mass *= part_mass
+            if not changed:
+                break
+
+        if all(part is original for part, original in zip(parts, node.parts)):
+            return node, mass
+        return Text(parts=tuple(parts), sep=node.sep), mass
@@ -1,45 +1,108 @@
 """Core DSL components and combinators."""
 
-from .base import Component
-from .components import (
-    Capitalized,
-    Either,
-    Empty,
-    FirstUppercased,
-    Literal,
-    Maybe,
-    OneOf,
-    PossessiveForm,
-    PrefixedByArticle,
-    PrefixedByDeterminer,
-    Text,
-    TitleCased,
-    WeightedOneOf,
-    either,
-    maybe,
-    one_of,
-    text,
-    weighted_one_of,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import Component, GrammarComponent
+    from .components import (
+        Capitalized,
+        CoinFlips,
+        Either,
+        Empty,
+        FirstUppercased,
+        Literal,
+        LiteralChoice,
+        Maybe,
+        OneOf,
+        PossessiveForm,
+        PrefixedByArticle,
+        PrefixedByDeterminer,
+        RolledOneOf,
+        Text,
+        TitleCased,
+        WeightedOneOf,
+        coin_flips,
+        either,
+        maybe,
+        one_of,
+        rolled_one_of,
+        text,
+        weighted_one_of,
+    )
+    from .optimizer import optimize
+
+# Resolved on first access (PEP 562). Word modules import ``core.base`` while
+# ``core.components`` imports articles, so eager imports here would cycle.
+_LAZY_IMPORTS: dict[str, str] = {
+    "Component": ".base",
+    "GrammarComponent": ".base",
+    "Capitalized": ".components",
+    "CoinFlips": ".components",
+    "Either": ".components",
+    "Empty": ".components",
+    "FirstUppercased": ".components",
+    "Literal": ".components",
+    "LiteralChoice": ".components",
+    "Maybe": ".components",
+    "OneOf": ".components",
+    "PossessiveForm": ".components",
+    "PrefixedByArticle": ".components",
+    "PrefixedByDeterminer": ".components",
+    "RolledOneOf": ".components",
+    "Text": ".components",
+    "TitleCased": ".components",
+    "WeightedOneOf": ".components",
+    "coin_flips": ".components",
+    "either": ".components",
+    "maybe": ".components",
+    "one_of": ".components",
+    "rolled_one_of": ".components",
+    "text": ".components",
+    "weighted_one_of": ".components",
+    "optimize": ".optimizer",
+}
 
 __all__ = [
     "Capitalized",
+    "CoinFlips",
     "Component",
     "Either",
     "Empty",
     "FirstUppercased",
+    "GrammarComponent",
     "Literal",
+    "LiteralChoice",
     "Maybe",
     "OneOf",
     "PossessiveForm",
     "PrefixedByArticle",
     "PrefixedByDeterminer",
+    "RolledOneOf",
     "Text",
     "TitleCased",
     "WeightedOneOf",
+    "coin_flips",
     "either",
     "maybe",
     "one_of",
+    "optimize",
+    "rolled_one_of",
     "text",
     "weighted_one_of",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -3,7 +3,14 @@
 from __future__ import annotations
 
 import abc
+from functools import lru_cache
 import random
+from typing import Callable, Iterator
+
+from wordsmith.util.randoms import default_rng
+
+Renderer = Callable[[random.Random], str]
+"""A compiled render function, as returned by :meth:`Component.compile`."""
 
 
 class Component(abc.ABC):
@@ -14,11 +21,105 @@ class Component(abc.ABC):
         """Render text using the provided random number generator."""
 
     def __call__(self, rng: random.Random | None = None) -> str:
-        """Render text, using a system RNG when none is provided."""
+        """Render text, using the default RNG policy when none is provided."""
         if rng is None:
-            rng = random.SystemRandom()
+            rng = default_rng()
         return self.make_text(rng)
 
+    def make_many(self, rng: random.Random, n: int) -> list[str]:
+        """Render ``n`` texts in one batch.
+
+        Batches are drawn column-wise: each node makes its random choices for
+        every row before its children render, and each child renders only the
+        rows routed to it. Output is deterministic for a given seed and ``n``
+        and follows the same distribution as ``n`` calls to ``make_text``, but
+        it is not the same sequence of strings.
+        """
+        if n < 0:
+            raise ValueError("Batch size must be non-negative.")
+        return self._make_many(rng, n)
+
+    def iter_many(
+        self,
+        rng: random.Random,
+        n: int | None = None,
+        batch_size: int = 1024,
+    ) -> Iterator[str]:
+        """Yield rendered texts batch by batch, forever when ``n`` is None.
+
+        Each batch follows the ``make_many`` stream contract, so output depends
+        on ``batch_size`` as well as the seed.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1.")
+        remaining = n
+        while remaining is None or remaining > 0:
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            yield from self.make_many(rng, size)
+            if remaining is not None:
+                remaining -= size
+
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        """Render a batch of ``n`` texts; subclasses override to draw column-wise."""
+        return [self.make_text(rng) for _ in range(n)]
+
+    def compile(self) -> Renderer:
+        """Return a flat render function equivalent to ``make_text``.
+
+        The returned callable consumes the RNG exactly as ``make_text`` does, so
+        a seeded ``random.Random`` produces identical output either way.
+        """
+        from .compiler import compile_component
+
+        return compile_component(self)
+
+    def _compile(self, compile_child: Callable[[Component], Renderer]) -> Renderer:
+        """Lower this component to a renderer, compiling children via callback."""
+        return self.make_text
+
+    def optimize(self, exact_stream: bool = False) -> Component:
+        """Return a cheaper tree that renders the same distribution of texts.
+
+        With ``exact_stream=True`` only rewrites that also keep a seeded RNG
+        stream identical are applied.
+        """
+        from .optimizer import optimize
+
+        return optimize(self, exact_stream=exact_stream)
+
+    def unrank(self, index: int) -> str:
+        """Render derivation ``index`` without an RNG; see :mod:`wordsmith.ranking`."""
+        from wordsmith.ranking import unrank
+
+        return unrank(self, index)
+
+    def rank(self, text: str) -> int:
+        """Return the derivation index that renders ``text``.
+
+        Raises ``ValueError`` when ``text`` is not an output or is ambiguous.
+        """
+        from wordsmith.ranking import rank
+
+        return rank(self, text)
+
+    def constrained(
+        self,
+        *,
+        max_len: int | None = None,
+        min_len: int = 0,
+        max_words: int | None = None,
+    ) -> Component:
+        """Return a component that renders only texts within the given limits.
+
+        Infeasible word-list entries and branches are pruned before drawing;
+        see :mod:`wordsmith.constrained`.
+        """
+        from wordsmith.constrained import constrained
+
+        return constrained(
+            self, max_len=max_len, min_len=min_len, max_words=max_words
+        )
+
     def capitalized(self) -> Component:
         """Return a component that capitalizes each word of this component."""
         from .components import Capitalized
@@ -86,3 +187,29 @@ class Component(abc.ABC):
         from .components import text
 
         return text(other, self)
+
+
+class GrammarComponent(Component):
+    """Component rendered by a static grammar tree that is built once."""
+
+    @abc.abstractmethod
+    def build_grammar(self) -> Component:
+        """Build the grammar tree that renders this component."""
+
+    def grammar(self) -> Component:
+        """Return the grammar tree, building and caching it on first use."""
+        return _cached_grammar(self)
+
+    def make_text(self, rng: random.Random) -> str:
+        return self.grammar().make_text(rng)
+
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        return self.grammar().make_many(rng, n)
+
+    def _compile(self, compile_child: Callable[[Component], Renderer]) -> Renderer:
+        return compile_child(self.grammar())
+
+
+@lru_cache(maxsize=None)
+def _cached_grammar(component: GrammarComponent) -> Component:
+    return component.build_grammar()
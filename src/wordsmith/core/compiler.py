@@ -0,0 +1,37 @@
+"""Lower component trees into flat render functions."""
+
+from __future__ import annotations
+
+import random
+
+from wordsmith.core.base import Component, Renderer
+
+
+def compile_component(component: Component) -> Renderer:
+    """Compile a component tree into a single render function.
+
+    Each node is lowered once through its ``_compile`` hook. Nodes that appear
+    more than once in the tree share one renderer, and recursive grammars are
+    tied together through a late-bound trampoline.
+    """
+    compiled: dict[int, tuple[Component, list[Renderer | None]]] = {}
+
+    def compile_child(child: Component) -> Renderer:
+        entry = compiled.get(id(child))
+        if entry is not None:
+            pending = entry[1]
+            if pending[0] is not None:
+                return pending[0]
+
+            def render_later(rng: random.Random) -> str:
+                return pending[0](rng)  # type: ignore[misc]
+
+            return render_later
+
+        cell: list[Renderer | None] = [None]
+        compiled[id(child)] = (child, cell)
+        renderer = child._compile(compile_child)
+        cell[0] = renderer
+        return renderer
+
+    return compile_child(component)
@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import accumulate, product
 import random
-from typing import Iterable
+from typing import Callable, Iterable, Sequence
 
-from wordsmith.core.base import Component
-from wordsmith.util.strings import first_upper, starts_with_vowel, title_case
+from wordsmith.core.base import Component, Renderer
+from wordsmith.util.samplers import WeightedSampler, make_sampler
+from wordsmith.util.casing import Casing, first_upper, title_case, title_case_many
+from wordsmith.util.strings import starts_with_vowel
 from wordsmith.words.articles import Article, Determiner
+from wordsmith.words.base import CasedWordList, WordList
 
 ComponentLike = Component | str
+ChildCompiler = Callable[[Component], Renderer]
+
+# rng.choice((0, 1)) consumes the RNG exactly like rng.choice([True, False]).
+_COIN_BITS = (0, 1)
 
 
 def _coerce_component(value: ComponentLike) -> Component:
@@ -25,6 +35,24 @@ def _normalize_components(values: Iterable[ComponentLike]) -> tuple[Component, .
     return tuple(_coerce_component(value) for value in values)
 
 
+def _render_grouped(
+    rng: random.Random,
+    options: Sequence[Component],
+    indices: Sequence[int],
+) -> list[str]:
+    """Render ``options[index]`` for each row, one batch per option."""
+    rows_by_option: list[list[int]] = [[] for _ in options]
+    for row, index in enumerate(indices):
+        rows_by_option[index].append(row)
+
+    results = [""] * len(indices)
+    for option, rows in zip(options, rows_by_option):
+        if rows:
+            for row, rendered in zip(rows, option.make_many(rng, len(rows))):
+                results[row] = rendered
+    return results
+
+
 def _roll_probability(rng: random.Random, probability: float) -> bool:
     if not 0.0 <= probability <= 1.0:
         raise ValueError("Probability must be in the range 0.0 to 1.0.")
@@ -40,6 +68,17 @@ class Literal(Component):
     def make_text(self, rng: random.Random) -> str:
         return self.text
 
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        return [self.text] * n
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        value = self.text
+
+        def render(rng: random.Random) -> str:
+            return value
+
+        return render
+
 
 @dataclass(frozen=True)
 class Empty(Component):
@@ -48,6 +87,12 @@ class Empty(Component):
     def make_text(self, rng: random.Random) -> str:
         return ""
 
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        return [""] * n
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        return Literal("")._compile(compile_child)
+
 
 @dataclass(frozen=True)
 class Text(Component):
@@ -65,6 +110,67 @@ class Text(Component):
             rendered_parts.append(rendered)
         return self.sep.join(rendered_parts)
 
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        sep = self.sep
+        columns = [part.make_many(rng, n) for part in self.parts]
+        return [sep.join([value for value in row if value]) for row in zip(*columns)]
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        sep = self.sep
+        parts = self.parts
+        texts = [part.text for part in parts if isinstance(part, Literal)]
+        if len(texts) == len(parts):
+            return Literal(sep.join(value for value in texts if value))._compile(
+                compile_child
+            )
+        if len(parts) == 1:
+            return compile_child(parts[0])
+
+        if len(parts) == 2:
+            first, second = parts
+            if isinstance(first, Literal) and first.text:
+                head = first.text
+                prefix = head + sep
+                render_second = compile_child(second)
+
+                def render_prefixed(rng: random.Random) -> str:
+                    rendered = render_second(rng)
+                    return prefix + rendered if rendered else head
+
+                return render_prefixed
+
+            if isinstance(second, Literal) and second.text:
+                tail = second.text
+                suffix = sep + tail
+                render_first = compile_child(first)
+
+                def render_suffixed(rng: random.Random) -> str:
+                    rendered = render_first(rng)
+                    return rendered + suffix if rendered else tail
+
+                return render_suffixed
+
+            render_first = compile_child(first)
+            render_second = compile_child(second)
+
+            def render_pair(rng: random.Random) -> str:
+                left = render_first(rng)
+                right = render_second(rng)
+                if left and right:
+                    return left + sep + right
+                return left or right
+
+            return render_pair
+
+        renderers = tuple(compile_child(part) for part in parts)
+
+        def render(rng: random.Random) -> str:
+            return sep.join(
+                [rendered for part in renderers if (rendered := part(rng))]
+            )
+
+        return render
+
 
 @dataclass(frozen=True)
 class OneOf(Component):
@@ -79,13 +185,70 @@ class OneOf(Component):
     def make_text(self, rng: random.Random) -> str:
         return rng.choice(self.options).make_text(rng)
 
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        indices = rng.choices(range(len(self.options)), k=n)
+        return _render_grouped(rng, self.options, indices)
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        values = tuple(
+            option.text for option in self.options if isinstance(option, Literal)
+        )
+        if len(values) == len(self.options):
+
+            def render_literal(rng: random.Random) -> str:
+                return rng.choice(values)
+
+            return render_literal
+
+        renderers = tuple(compile_child(option) for option in self.options)
+
+        def render(rng: random.Random) -> str:
+            return rng.choice(renderers)(rng)
+
+        return render
+
+
+@dataclass(frozen=True)
+class LiteralChoice(Component):
+    """Pick one of a tuple of fixed strings uniformly at random.
+
+    Consumes the RNG exactly like a ``OneOf`` of the same literals.
+    """
+
+    values: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        if not self.values:
+            raise ValueError("LiteralChoice requires at least one value.")
+
+    def make_text(self, rng: random.Random) -> str:
+        return rng.choice(self.values)
+
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        return rng.choices(self.values, k=n)
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        values = self.values
+
+        def render(rng: random.Random) -> str:
+            return rng.choice(values)
+
+        return render
+
 
 @dataclass(frozen=True)
 class WeightedOneOf(Component):
-    """Choose one of the provided components using weighted probabilities."""
+    """Choose one of the provided components using weighted probabilities.
+
+    Draws use a precomputed alias table. Set ``legacy_stream`` to consume the
+    RNG exactly like ``rng.choices``, as releases before samplers did; left as
+    ``None``, the choice follows ``set_default_sampler_policy``.
+    """
 
     options: tuple[Component, ...]
     weights: tuple[float, ...]
+    legacy_stream: bool | None = None
+    _sampler: WeightedSampler = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.options:
@@ -96,10 +259,110 @@ class WeightedOneOf(Component):
             raise ValueError("WeightedOneOf requires non-negative weights.")
         if not any(weight > 0.0 for weight in self.weights):
             raise ValueError("WeightedOneOf requires at least one positive weight.")
+        object.__setattr__(
+            self,
+            "_sampler",
+            make_sampler(self.weights, legacy_stream=self.legacy_stream),
+        )
 
     def make_text(self, rng: random.Random) -> str:
-        choice = rng.choices(self.options, weights=self.weights, k=1)[0]
-        return choice.make_text(rng)
+        return self.options[self._sampler.sample(rng)].make_text(rng)
+
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        return _render_grouped(rng, self.options, self._sampler.sample_many(rng, n))
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        renderers = tuple(compile_child(option) for option in self.options)
+        sample = self._sampler.sample
+
+        def render(rng: random.Random) -> str:
+            return renderers[sample(rng)](rng)
+
+        return render
+
+
+@dataclass(frozen=True)
+class RolledOneOf(Component):
+    """Choose an option by rolling a die across integer weights.
+
+    A single ``rng.randint(1, total)`` roll picks the option whose range of
+    faces contains the result, matching hand-written ``randint`` tables.
+    """
+
+    options: tuple[Component, ...]
+    weights: tuple[int, ...]
+    _bounds: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.options:
+            raise ValueError("RolledOneOf requires at least one option.")
+        if len(self.options) != len(self.weights):
+            raise ValueError("RolledOneOf requires matching options and weights.")
+        if any(weight < 1 for weight in self.weights):
+            raise ValueError("RolledOneOf requires positive integer weights.")
+        object.__setattr__(self, "_bounds", tuple(accumulate(self.weights)))
+
+    def make_text(self, rng: random.Random) -> str:
+        bounds = self._bounds
+        roll = rng.randint(1, bounds[-1])
+        return self.options[bisect_left(bounds, roll)].make_text(rng)
+
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        bounds = self._bounds
+        total = bounds[-1]
+        indices = [bisect_left(bounds, rng.randint(1, total)) for _ in range(n)]
+        return _render_grouped(rng, self.options, indices)
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        renderers = tuple(compile_child(option) for option in self.options)
+        bounds = self._bounds
+        total = bounds[-1]
+
+        def render(rng: random.Random) -> str:
+            return renderers[bisect_left(bounds, rng.randint(1, total))](rng)
+
+        return render
+
+
+@dataclass(frozen=True)
+class CoinFlips(Component):
+    """Flip fair coins up front, then render the option built for the outcome.
+
+    Options are indexed in ``itertools.product((True, False), repeat=flips)``
+    order. Each flip is drawn with ``rng.choice`` so grammars that used to bake
+    ``rng.choice([True, False])`` flags into a per-call tree keep their stream.
+    """
+
+    options: tuple[Component, ...]
+    flips: int
+
+    def __post_init__(self) -> None:
+        if self.flips < 0:
+            raise ValueError("CoinFlips requires a non-negative flip count.")
+        if len(self.options) != 2**self.flips:
+            raise ValueError("CoinFlips requires one option per flip outcome.")
+
+    def make_text(self, rng: random.Random) -> str:
+        index = 0
+        for _ in range(self.flips):
+            index = index * 2 + rng.choice(_COIN_BITS)
+        return self.options[index].make_text(rng)
+
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        indices = rng.choices(range(len(self.options)), k=n)
+        return _render_grouped(rng, self.options, indices)
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        renderers = tuple(compile_child(option) for option in self.options)
+        flips = range(self.flips)
+
+        def render(rng: random.Random) -> str:
+            index = 0
+            for _ in flips:
+                index = index * 2 + rng.choice(_COIN_BITS)
+            return renderers[index](rng)
+
+        return render
 
 
 @dataclass(frozen=True)
@@ -124,6 +387,23 @@ class Either(Component):
         )
         return choice.make_text(rng)
 
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        probability = self.first_probability
+        indices = [0 if rng.random() < probability else 1 for _ in range(n)]
+        return _render_grouped(rng, (self.first, self.second), indices)
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        render_first = compile_child(self.first)
+        render_second = compile_child(self.second)
+        probability = self.first_probability
+
+        def render(rng: random.Random) -> str:
+            if rng.random() < probability:
+                return render_first(rng)
+            return render_second(rng)
+
+        return render
+
 
 @dataclass(frozen=True)
 class Maybe(Component):
@@ -143,6 +423,55 @@ class Maybe(Component):
             else ""
         )
 
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        probability = self.probability
+        indices = [0 if rng.random() < probability else 1 for _ in range(n)]
+        return _render_grouped(rng, (self.option, Empty()), indices)
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        render_option = compile_child(self.option)
+        probability = self.probability
+
+        def render(rng: random.Random) -> str:
+            return render_option(rng) if rng.random() < probability else ""
+
+        return render
+
+
+def _precased(component: Component, casing: Casing) -> Component | None:
+    """Return a copy of a fixed-table leaf with ``casing`` applied up front.
+
+    Word lists and literal choices draw exactly as before, so the copy can
+    replace a casing wrapper around them. Other components return ``None``.
+    """
+    if isinstance(component, WordList):
+        return CasedWordList(
+            source=component, casing=casing, weighted=component.weighted
+        )
+    if isinstance(component, Literal):
+        return Literal(casing.apply(component.text))
+    if isinstance(component, LiteralChoice):
+        return LiteralChoice(tuple(casing.apply(value) for value in component.values))
+    return None
+
+
+def _compile_cased(
+    wrapped: Component,
+    casing: Casing,
+    compile_child: ChildCompiler,
+) -> Renderer:
+    precased = _precased(wrapped, casing)
+    if precased is not None:
+        return compile_child(precased)
+
+    render_wrapped = compile_child(wrapped)
+    apply = casing.transform
+
+    def render(rng: random.Random) -> str:
+        return apply(render_wrapped(rng))
+
+    return render
+
 
 @dataclass(frozen=True)
 class Capitalized(Component):
@@ -153,6 +482,12 @@ class Capitalized(Component):
     def make_text(self, rng: random.Random) -> str:
         return self.wrapped.make_text(rng).title()
 
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        return [value.title() for value in self.wrapped.make_many(rng, n)]
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        return _compile_cased(self.wrapped, Casing.CAPITALIZED, compile_child)
+
 
 @dataclass(frozen=True)
 class FirstUppercased(Component):
@@ -163,6 +498,12 @@ class FirstUppercased(Component):
     def make_text(self, rng: random.Random) -> str:
         return first_upper(self.wrapped.make_text(rng))
 
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        return [first_upper(value) for value in self.wrapped.make_many(rng, n)]
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        return _compile_cased(self.wrapped, Casing.FIRST_UPPER, compile_child)
+
 
 @dataclass(frozen=True)
 class TitleCased(Component):
@@ -173,6 +514,12 @@ class TitleCased(Component):
     def make_text(self, rng: random.Random) -> str:
         return title_case(self.wrapped.make_text(rng))
 
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        return title_case_many(self.wrapped.make_many(rng, n))
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        return _compile_cased(self.wrapped, Casing.TITLE, compile_child)
+
 
 @dataclass(frozen=True)
 class PrefixedByArticle(Component):
@@ -181,10 +528,26 @@ class PrefixedByArticle(Component):
     wrapped: Component
 
     def make_text(self, rng: random.Random) -> str:
+        if isinstance(self.wrapped, WordList):
+            return _word_list_prefixer(self.wrapped, Article)(rng)
         text = self.wrapped.make_text(rng)
         article = Article(is_before_vowel=starts_with_vowel(text)).make_text(rng)
         return f"{article} {text}"
 
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        if isinstance(self.wrapped, WordList):
+            return _prefix_word_list_many(rng, n, self.wrapped, Article())
+        return _prefix_many(self.wrapped.make_many(rng, n), Article().make_many(rng, n))
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        if isinstance(self.wrapped, WordList):
+            return _word_list_prefixer(self.wrapped, Article)
+        return _compile_prefixed(
+            compile_child(self.wrapped),
+            compile_child(Article(is_before_vowel=True)),
+            compile_child(Article(is_before_vowel=False)),
+        )
+
 
 @dataclass(frozen=True)
 class PrefixedByDeterminer(Component):
@@ -193,10 +556,29 @@ class PrefixedByDeterminer(Component):
     wrapped: Component
 
     def make_text(self, rng: random.Random) -> str:
+        if isinstance(self.wrapped, WordList):
+            return _word_list_prefixer(self.wrapped, Determiner)(rng)
         text = self.wrapped.make_text(rng)
         determiner = Determiner(is_before_vowel=starts_with_vowel(text)).make_text(rng)
         return f"{determiner} {text}"
 
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        if isinstance(self.wrapped, WordList):
+            return _prefix_word_list_many(rng, n, self.wrapped, Determiner())
+        return _prefix_many(
+            self.wrapped.make_many(rng, n),
+            Determiner().make_many(rng, n),
+        )
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        if isinstance(self.wrapped, WordList):
+            return _word_list_prefixer(self.wrapped, Determiner)
+        return _compile_prefixed(
+            compile_child(self.wrapped),
+            compile_child(Determiner(is_before_vowel=True)),
+            compile_child(Determiner(is_before_vowel=False)),
+        )
+
 
 @dataclass(frozen=True)
 class PossessiveForm(Component):
@@ -210,6 +592,90 @@ class PossessiveForm(Component):
             return f"{text}'"
         return f"{text}'s"
 
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        return [
+            f"{text}'" if text.endswith("s") else f"{text}'s"
+            for text in self.wrapped.make_many(rng, n)
+        ]
+
+    def _compile(self, compile_child: ChildCompiler) -> Renderer:
+        render_wrapped = compile_child(self.wrapped)
+
+        def render(rng: random.Random) -> str:
+            text = render_wrapped(rng)
+            return text + "'" if text.endswith("s") else text + "'s"
+
+        return render
+
+
+def _prefix_many(texts: list[str], prefixes: list[str]) -> list[str]:
+    return [
+        f"{'an' if prefix == 'a' and starts_with_vowel(text) else prefix} {text}"
+        for text, prefix in zip(texts, prefixes)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _word_list_prefixer(
+    word_list: WordList,
+    prefix_type: type[Article] | type[Determiner],
+) -> Renderer:
+    """Prefix a word list leaf using its precomputed vowel-sound index.
+
+    Drawing an index from ``range(len(table))`` consumes the RNG exactly like
+    ``rng.choice(table)``, so output matches the generic path.
+    """
+    table = word_list.word_table()
+    is_vowel = word_list.vowel_index()
+    indices = range(len(table))
+    before_vowel = prefix_type(is_before_vowel=True)._vowel_options()
+    before_consonant = prefix_type(is_before_vowel=False)._vowel_options()
+    sampler = word_list.weight_sampler()
+    draw = sampler.sample if sampler is not None else (
+        lambda rng: rng.choice(indices)
+    )
+
+    def render(rng: random.Random) -> str:
+        index = draw(rng)
+        if is_vowel[index]:
+            return f"{rng.choice(before_vowel)} {table[index]}"
+        return f"{rng.choice(before_consonant)} {table[index]}"
+
+    return render
+
+
+def _prefix_word_list_many(
+    rng: random.Random,
+    n: int,
+    word_list: WordList,
+    prefix: Component,
+) -> list[str]:
+    table = word_list.word_table()
+    is_vowel = word_list.vowel_index()
+    sampler = word_list.weight_sampler()
+    if sampler is not None:
+        indices = sampler.sample_many(rng, n)
+    else:
+        indices = rng.choices(range(len(table)), k=n)
+    return [
+        f"{'an' if value == 'a' and is_vowel[index] else value} {table[index]}"
+        for index, value in zip(indices, prefix.make_many(rng, n))
+    ]
+
+
+def _compile_prefixed(
+    render_wrapped: Renderer,
+    render_before_vowel: Renderer,
+    render_before_consonant: Renderer,
+) -> Renderer:
+    def render(rng: random.Random) -> str:
+        text = render_wrapped(rng)
+        if starts_with_vowel(text):
+            return f"{render_before_vowel(rng)} {text}"
+        return f"{render_before_consonant(rng)} {text}"
+
+    return render
+
 
 def text(*parts: ComponentLike, sep: str = "") -> Text:
     """Build a Text component from parts."""
@@ -221,7 +687,10 @@ def one_of(*options: ComponentLike) -> OneOf:
     return OneOf(options=_normalize_components(options))
 
 
-def weighted_one_of(*pairs: tuple[float, ComponentLike]) -> WeightedOneOf:
+def weighted_one_of(
+    *pairs: tuple[float, ComponentLike],
+    legacy_stream: bool | None = None,
+) -> WeightedOneOf:
     """Build a WeightedOneOf component from weighted pairs."""
     if not pairs:
         raise ValueError("WeightedOneOf requires at least one option.")
@@ -229,6 +698,29 @@ def weighted_one_of(*pairs: tuple[float, ComponentLike]) -> WeightedOneOf:
     return WeightedOneOf(
         options=_normalize_components(options),
         weights=tuple(float(weight) for weight in weights),
+        legacy_stream=legacy_stream,
+    )
+
+
+def rolled_one_of(*pairs: tuple[int, ComponentLike]) -> RolledOneOf:
+    """Build a RolledOneOf component from integer-weighted pairs."""
+    if not pairs:
+        raise ValueError("RolledOneOf requires at least one option.")
+    weights, options = zip(*pairs)
+    return RolledOneOf(
+        options=_normalize_components(options),
+        weights=tuple(int(weight) for weight in weights),
+    )
+
+
+def coin_flips(flips: int, build: Callable[..., ComponentLike]) -> CoinFlips:
+    """Build a CoinFlips component by calling ``build`` once per flip outcome."""
+    return CoinFlips(
+        options=tuple(
+            _coerce_component(build(*outcome))
+            for outcome in product((True, False), repeat=flips)
+        ),
+        flips=flips,
     )
 
 
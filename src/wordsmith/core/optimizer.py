@@ -0,0 +1,287 @@
+"""Rewrite component trees into cheaper equivalent trees."""
+
+from __future__ import annotations
+
+from dataclasses import fields, is_dataclass, replace
+from fractions import Fraction
+from typing import Any, Callable
+
+from wordsmith.core.base import Component, GrammarComponent
+from wordsmith.core.components import (
+    Capitalized,
+    CoinFlips,
+    Either,
+    Empty,
+    FirstUppercased,
+    Literal,
+    LiteralChoice,
+    Maybe,
+    OneOf,
+    PossessiveForm,
+    RolledOneOf,
+    Text,
+    TitleCased,
+    WeightedOneOf,
+    _precased,
+)
+from wordsmith.names.ancient_name import AncientName
+from wordsmith.util.casing import Casing
+
+_CASING_WRAPPERS: dict[type[Component], Casing] = {
+    Capitalized: Casing.CAPITALIZED,
+    FirstUppercased: Casing.FIRST_UPPER,
+    TitleCased: Casing.TITLE,
+}
+
+
+def optimize(component: Component, exact_stream: bool = False) -> Component:
+    """Return a cheaper tree that renders the same distribution of texts.
+
+    Rewrites applied in every mode, which keep the RNG stream identical:
+
+    - grammar components are inlined into their grammar trees;
+    - ``Text`` parts with the same separator are flattened into their parent,
+      empty literals are dropped and adjacent literals are merged;
+    - casing wrappers are pushed down through choices (and, for
+      ``Capitalized``, through ``Text`` joined by an uncased separator) onto
+      word lists and literals, which are replaced by pre-cased copies;
+    - possessive wrappers around a literal are folded;
+    - a ``OneOf`` of literals becomes a ``LiteralChoice``.
+
+    Unless ``exact_stream`` is set, nested ``OneOf``/``WeightedOneOf`` nodes
+    are also collapsed into one categorical draw with multiplied-through
+    weights, duplicate literal options are merged, ``Maybe``/``Either``
+    nodes with probability 0 or 1 are folded away, and ``AncientName`` draws
+    whole syllables from its precomputed table. These keep the output
+    distribution but consume the RNG differently.
+
+    Components the optimizer does not know are kept, with their children
+    optimized when they are dataclass fields.
+    """
+    optimized: dict[int, tuple[Component, Component]] = {}
+    inlining: set[GrammarComponent] = set()
+
+    def visit(node: Component) -> Component:
+        entry = optimized.get(id(node))
+        if entry is not None:
+            return entry[1]
+
+        if isinstance(node, GrammarComponent):
+            # Recursive grammars reach themselves again; keep that reference.
+            if node in inlining:
+                return node
+            inlining.add(node)
+            try:
+                result = visit(node.grammar())
+            finally:
+                inlining.discard(node)
+        else:
+            result = _simplify(_with_optimized_children(node, visit), exact_stream)
+
+        optimized[id(node)] = (node, result)
+        return result
+
+    return visit(component)
+
+
+def _with_optimized_children(
+    node: Component,
+    visit: Callable[[Component], Component],
+) -> Component:
+    if not is_dataclass(node):
+        return node
+
+    changes: dict[str, Any] = {}
+    for spec in fields(node):
+        if not spec.init:
+            continue
+        value = getattr(node, spec.name)
+        if isinstance(value, Component):
+            new_value: Any = visit(value)
+        elif (
+            isinstance(value, tuple)
+            and value
+            and all(isinstance(item, Component) for item in value)
+        ):
+            new_value = tuple(visit(item) for item in value)
+            if all(new is old for new, old in zip(new_value, value)):
+                continue
+        else:
+            continue
+        if new_value is not value:
+            changes[spec.name] = new_value
+    return replace(node, **changes) if changes else node
+
+
+def _simplify(node: Component, exact_stream: bool) -> Component:
+    if isinstance(node, Text):
+        return _simplify_text(node)
+
+    casing = _CASING_WRAPPERS.get(type(node))
+    if casing is not None:
+        pushed = _push_casing(type(node), casing, getattr(node, "wrapped"))
+        return node if pushed is None else pushed
+
+    if isinstance(node, PossessiveForm) and isinstance(node.wrapped, Literal):
+        value = node.wrapped.text
+        return Literal(f"{value}'" if value.endswith("s") else f"{value}'s")
+
+    if isinstance(node, OneOf) and all(
+        isinstance(option, Literal) for option in node.options
+    ):
+        node = LiteralChoice(tuple(option.text for option in node.options))
+
+    if exact_stream:
+        return node
+
+    if isinstance(node, (OneOf, WeightedOneOf, LiteralChoice)):
+        return _simplify_choice(node)
+    if isinstance(node, Maybe):
+        if node.probability == 0.0:
+            return Literal("")
+        if node.probability == 1.0:
+            return node.option
+    if isinstance(node, Either):
+        if node.first_probability == 1.0:
+            return node.first
+        if node.first_probability == 0.0:
+            return node.second
+    if isinstance(node, AncientName) and node.exact_stream:
+        return replace(node, exact_stream=False)
+    return node
+
+
+def _push_casing(
+    wrapper: type[Component],
+    casing: Casing,
+    node: Component,
+) -> Component | None:
+    """Apply ``casing`` below ``node`` without changing the RNG stream.
+
+    Returns ``None`` when no pre-cased leaf can be reached.
+    """
+    precased = _precased(node, casing)
+    if precased is not None:
+        return precased
+
+    if isinstance(node, (OneOf, WeightedOneOf, RolledOneOf, CoinFlips)):
+        options = _push_casing_into(wrapper, casing, node.options)
+        return None if options is None else replace(node, options=options)
+    if isinstance(node, Either):
+        pair = _push_casing_into(wrapper, casing, (node.first, node.second))
+        return None if pair is None else replace(node, first=pair[0], second=pair[1])
+    if isinstance(node, Maybe):
+        option = _push_casing(wrapper, casing, node.option)
+        return None if option is None else replace(node, option=option)
+    if (
+        isinstance(node, Text)
+        and casing is Casing.CAPITALIZED
+        and _is_uncased(node.sep)
+    ):
+        parts = _push_casing_into(wrapper, casing, node.parts)
+        return None if parts is None else replace(node, parts=parts)
+    return None
+
+
+def _push_casing_into(
+    wrapper: type[Component],
+    casing: Casing,
+    children: tuple[Component, ...],
+) -> tuple[Component, ...] | None:
+    pushed = [_push_casing(wrapper, casing, child) for child in children]
+    if all(result is None for result in pushed):
+        return None
+    return tuple(
+        wrapper(child) if result is None else result  # type: ignore[call-arg]
+        for child, result in zip(children, pushed)
+    )
+
+
+def _is_uncased(sep: str) -> bool:
+    # str.title() starts a new word after any uncased character, so it can be
+    # applied to each part separately when the separator has no letters.
+    return bool(sep) and sep.lower() == sep.upper() and not any(
+        char.isalpha() for char in sep
+    )
+
+
+def _simplify_text(node: Text) -> Component:
+    sep = node.sep
+    parts: list[Component] = []
+    for part in node.parts:
+        nested = part.parts if isinstance(part, Text) and part.sep == sep else (part,)
+        for item in nested:
+            if isinstance(item, Empty) or (isinstance(item, Literal) and not item.text):
+                continue
+            if isinstance(item, Literal) and parts and isinstance(parts[-1], Literal):
+                parts[-1] = Literal(f"{parts[-1].text}{sep}{item.text}")
+            else:
+                parts.append(item)
+
+    if not parts:
+        return Literal("")
+    if len(parts) == 1:
+        return parts[0]
+    if tuple(parts) == node.parts:
+        return node
+    return Text(parts=tuple(parts), sep=sep)
+
+
+def _categorical(node: Component) -> list[tuple[Fraction, Component]]:
+    """Return ``(probability, option)`` pairs, expanding nested choices."""
+    if isinstance(node, LiteralChoice):
+        share = Fraction(1, len(node.values))
+        return [(share, Literal(value)) for value in node.values]
+    if isinstance(node, OneOf):
+        share = Fraction(1, len(node.options))
+        pairs = [(share, option) for option in node.options]
+    elif isinstance(node, WeightedOneOf):
+        total = sum(Fraction(weight) for weight in node.weights)
+        pairs = [
+            (Fraction(weight) / total, option)
+            for weight, option in zip(node.weights, node.options)
+        ]
+    else:
+        return [(Fraction(1), node)]
+
+    expanded: list[tuple[Fraction, Component]] = []
+    for probability, option in pairs:
+        if probability == 0:
+            continue
+        for inner, leaf in _categorical(option):
+            expanded.append((probability * inner, leaf))
+    return expanded
+
+
+def _simplify_choice(node: OneOf | WeightedOneOf | LiteralChoice) -> Component:
+    pairs = _categorical(node)
+
+    merged: dict[Any, list[Any]] = {}
+    for probability, option in pairs:
+        key = ("literal", option.text) if isinstance(option, Literal) else id(option)
+        if key in merged:
+            merged[key][0] += probability
+        else:
+            merged[key] = [probability, option]
+    entries = list(merged.values())
+
+    if len(entries) == 1:
+        return entries[0][1]
+
+    options = tuple(option for _, option in entries)
+    probabilities = [probability for probability, _ in entries]
+    if isinstance(node, WeightedOneOf) and options == node.options:
+        return node
+    if len(set(probabilities)) == 1:
+        if all(isinstance(option, Literal) for option in options):
+            values = tuple(option.text for option in options)
+            if isinstance(node, LiteralChoice) and values == node.values:
+                return node
+            return LiteralChoice(values)
+        if isinstance(node, OneOf) and options == node.options:
+            return node
+        return OneOf(options=options)
+    return WeightedOneOf(
+        options=options,
+        weights=tuple(float(probability) for probability in probabilities),
+    )
@@ -3,12 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import random
 
-from wordsmith.core.base import Component
+from wordsmith.core.base import Component, GrammarComponent
 from wordsmith.core.components import either, one_of
 from wordsmith.names.given_name import GivenName
-from wordsmith.util import random_bool
 from wordsmith.words.base import (
     Adjective,
     MartialSocialConcept,
@@ -19,34 +17,29 @@ from wordsmith.generators.town_name import TownName
 
 
 @dataclass(frozen=True)
-class CriminalGangName(Component):
+class CriminalGangName(GrammarComponent):
     """Generate a criminal gang name."""
 
-    def make_text(self, rng: random.Random) -> str:
-        begins_with_person_name = random_bool(rng, 0.25)
-
-        if begins_with_person_name:
-            component = (
-                GivenName().possessive_form()
-                | either(
-                    VillainousPersonNoun(is_plural=True),
-                    PrimitiveWeapon(is_plural=True),
-                )
-            ).title_case()
-        else:
-            component = (
-                "the"
-                | one_of(
-                    MartialSocialConcept() | VillainousPersonNoun(is_plural=True),
-                    PrimitiveWeapon() | VillainousPersonNoun(is_plural=True),
-                    VillainousPersonNoun(is_plural=True) | "of" | TownName(),
-                    TownName() | VillainousPersonNoun(is_plural=True),
-                    Adjective() | VillainousPersonNoun(is_plural=True),
-                    Adjective()
-                    | VillainousPersonNoun(is_plural=True)
-                    | "of"
-                    | TownName(),
-                ).title_case()
+    def build_grammar(self) -> Component:
+        begins_with_person_name = (
+            GivenName().possessive_form()
+            | either(
+                VillainousPersonNoun(is_plural=True),
+                PrimitiveWeapon(is_plural=True),
             )
-
-        return component.make_text(rng)
+        ).title_case()
+
+        begins_with_article = "the" | one_of(
+            MartialSocialConcept() | VillainousPersonNoun(is_plural=True),
+            PrimitiveWeapon() | VillainousPersonNoun(is_plural=True),
+            VillainousPersonNoun(is_plural=True) | "of" | TownName(),
+            TownName() | VillainousPersonNoun(is_plural=True),
+            Adjective() | VillainousPersonNoun(is_plural=True),
+            Adjective() | VillainousPersonNoun(is_plural=True) | "of" | TownName(),
+        ).title_case()
+
+        return either(
+            begins_with_person_name,
+            begins_with_article,
+            first_probability=0.25,
+        )
@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import random
 
-from wordsmith.core.base import Component
+from wordsmith.core.base import Component, GrammarComponent
 from wordsmith.core.components import either, weighted_one_of
 from wordsmith.names.ancient_name import AncientName
 from wordsmith.names.gender import BinaryGender
@@ -23,10 +22,10 @@ from wordsmith.generators.town_name import TownName
 
 
 @dataclass(frozen=True)
-class NauticalShipName(Component):
+class NauticalShipName(GrammarComponent):
     """Generate a nautical ship name."""
 
-    def make_text(self, rng: random.Random) -> str:
+    def build_grammar(self) -> Component:
         possessive_name = (
             either(
                 MartialSocialConcept().first_upper(),
@@ -95,4 +94,4 @@ class NauticalShipName(Component):
             (1, possessive_name),
         )
 
-        return component.title_case().make_text(rng)
+        return component.title_case()
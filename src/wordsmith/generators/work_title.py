@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import random
 
-from wordsmith.core.base import Component
-from wordsmith.core.components import either, maybe, one_of
+from wordsmith.core.base import Component, GrammarComponent
+from wordsmith.core.components import coin_flips, either, maybe, one_of
 from wordsmith.generators.criminal_gang_name import CriminalGangName
 from wordsmith.generators.nautical_ship_name import NauticalShipName
 from wordsmith.generators.town_name import TownName
@@ -25,27 +24,31 @@ from wordsmith.words.base import (
 
 
 @dataclass(frozen=True)
-class WorkTitle(Component):
+class WorkTitle(GrammarComponent):
     """Top-level work title generator."""
 
-    def make_text(self, rng: random.Random) -> str:
+    def build_grammar(self) -> Component:
         return either(
             SimpleWorkTitle(),
             UnusualWorkTitle(),
             first_probability=0.85,
-        ).make_text(rng)
+        )
 
 
 @dataclass(frozen=True)
-class SimpleWorkTitle(Component):
+class SimpleWorkTitle(GrammarComponent):
     """Generate a straightforward work title."""
 
-    def make_text(self, rng: random.Random) -> str:
-        noun_plural_1 = rng.choice([True, False])
-        noun_plural_2 = rng.choice([True, False])
-        noun_plural_3 = rng.choice([True, False])
-        noun_plural_4 = rng.choice([True, False])
+    def build_grammar(self) -> Component:
+        return coin_flips(4, self._build_variant)
 
+    @staticmethod
+    def _build_variant(
+        noun_plural_1: bool,
+        noun_plural_2: bool,
+        noun_plural_3: bool,
+        noun_plural_4: bool,
+    ) -> Component:
         component = one_of(
             Noun(is_plural=noun_plural_1),
             Noun().prefixed_by_article(),
@@ -99,14 +102,22 @@ class SimpleWorkTitle(Component):
             | TownName(),
         )
 
-        return component.title_case().make_text(rng)
+        return component.title_case()
 
 
 @dataclass(frozen=True)
-class UnusualWorkTitle(Component):
+class UnusualWorkTitle(GrammarComponent):
     """Generate a more unusual work title."""
 
-    def make_text(self, rng: random.Random) -> str:
+    def build_grammar(self) -> Component:
+        return coin_flips(3, self._build_variant)
+
+    @staticmethod
+    def _build_variant(
+        plural_is_third_person: bool,
+        past_is_singular: bool,
+        past_is_third_person: bool,
+    ) -> Component:
         component = one_of(
             UCBerkeleyEmotion() | Adverb() | Verb(tense=VerbTense.PRESENT),
             UCBerkeleyEmotion() | "and" | UCBerkeleyEmotion(),
@@ -132,7 +143,7 @@ class UnusualWorkTitle(Component):
                 one_of(
                     Pronoun(
                         is_singular=False,
-                        is_third_person=rng.choice([True, False]),
+                        is_third_person=plural_is_third_person,
                     )
                     | Verb(tense=VerbTense.BASE),
                     Pronoun(is_singular=True, is_third_person=False)
@@ -141,8 +152,8 @@ class UnusualWorkTitle(Component):
                     | Verb(tense=VerbTense.PRESENT),
                 ),
                 Pronoun(
-                    is_singular=rng.choice([True, False]),
-                    is_third_person=rng.choice([True, False]),
+                    is_singular=past_is_singular,
+                    is_third_person=past_is_third_person,
                 )
                 | Verb(tense=VerbTense.PAST),
             ),
@@ -163,4 +174,4 @@ class UnusualWorkTitle(Component):
             (MartialSocialConcept() + ":") | UnusualWorkTitle(),
         )
 
-        return component.title_case().make_text(rng)
+        return component.title_case()
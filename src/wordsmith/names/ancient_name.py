@@ -2,28 +2,37 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
+from functools import lru_cache
 import random
-from typing import ClassVar
+from typing import ClassVar, Sequence
 
 from wordsmith.core.base import Component
+from wordsmith.names.syllables import COIN, SyllablePattern, SyllableTable
 from wordsmith.util import first_upper, random_bool
 
-
-class _SyllablePattern(Enum):
-    CONSONANT_VOWEL = "consonant_vowel"
-    VOWEL_CONSONANT = "vowel_consonant"
-    VOWEL_ONLY = "vowel_only"
+_OPENS_APOSTROPHE = frozenset(
+    {SyllablePattern.CONSONANT_VOWEL, SyllablePattern.VOWEL_ONLY}
+)
+_CLOSES_APOSTROPHE = frozenset(
+    {SyllablePattern.VOWEL_CONSONANT, SyllablePattern.VOWEL_ONLY}
+)
 
 
 @dataclass(frozen=True)
 class AncientName(Component):
-    """Generate ancient-style names with phonetic patterns."""
+    """Generate ancient-style names with phonetic patterns.
+
+    With ``exact_stream=False``, ``make_text`` draws each syllable from the
+    precomputed syllable table instead of rolling its pattern, consonant and
+    vowel separately. Names follow the same distribution at a fraction of the
+    cost, but seeded output differs from the default stream.
+    """
 
     syllable_count: int
     allow_hyphen: bool = True
     allow_apostrophe: bool = True
+    exact_stream: bool = field(default=True, kw_only=True)
 
     _single_consonants: ClassVar[list[str]] = ["t", "m", "k", "h", "l", "p", "w"]
     _double_consonants: ClassVar[list[str]] = ["ph", "ch", "th"]
@@ -47,58 +56,143 @@ class AncientName(Component):
         return rng.choice(AncientName._double_vowels)
 
     def make_text(self, rng: random.Random) -> str:
+        if not self.exact_stream:
+            syllables, _ = _syllable_tables()
+            return self._table_name(
+                rng, syllables.sample_many(rng, self.syllable_count)
+            )
+
         will_use_hyphen = (
             self.syllable_count > 3
             and self.allow_hyphen
             and random_bool(rng, 0.25)
         )
-        will_try_apostrophe = self.allow_apostrophe and rng.choice([True, False])
+        will_try_apostrophe = self.allow_apostrophe and rng.choice(COIN)
 
         hyphen_syllable = (
             rng.randrange(3, self.syllable_count) if will_use_hyphen else 0
         )
 
-        text = ""
-        previous_pattern: _SyllablePattern | None = None
+        parts: list[str] = []
+        previous_pattern: SyllablePattern | None = None
 
         for current_syllable in range(1, self.syllable_count + 1):
             roll = rng.randint(1, 100)
             if roll <= 65:
-                pattern = _SyllablePattern.CONSONANT_VOWEL
+                pattern = SyllablePattern.CONSONANT_VOWEL
             elif roll <= 85:
-                pattern = _SyllablePattern.VOWEL_CONSONANT
+                pattern = SyllablePattern.VOWEL_CONSONANT
             else:
-                pattern = _SyllablePattern.VOWEL_ONLY
+                pattern = SyllablePattern.VOWEL_ONLY
 
             consonant = self._random_consonant(rng)
             vowel = self._random_vowel(rng)
 
-            if will_try_apostrophe and previous_pattern in {
-                _SyllablePattern.CONSONANT_VOWEL,
-                _SyllablePattern.VOWEL_ONLY,
-            } and pattern in {
-                _SyllablePattern.VOWEL_CONSONANT,
-                _SyllablePattern.VOWEL_ONLY,
-            }:
-                text += "'"
+            if (
+                will_try_apostrophe
+                and previous_pattern in _OPENS_APOSTROPHE
+                and pattern in _CLOSES_APOSTROPHE
+            ):
+                parts.append("'")
                 will_try_apostrophe = False
 
-            if pattern == _SyllablePattern.CONSONANT_VOWEL:
-                text += consonant + vowel
-            elif pattern == _SyllablePattern.VOWEL_CONSONANT:
-                text += vowel + consonant
+            if pattern == SyllablePattern.CONSONANT_VOWEL:
+                parts.append(consonant + vowel)
+            elif pattern == SyllablePattern.VOWEL_CONSONANT:
+                parts.append(vowel + consonant)
             else:
-                text += vowel
+                parts.append(vowel)
 
             previous_pattern = pattern
 
             if current_syllable == hyphen_syllable:
-                text += "-"
+                parts.append("-")
 
-        if previous_pattern != _SyllablePattern.VOWEL_CONSONANT and random_bool(
+        if previous_pattern != SyllablePattern.VOWEL_CONSONANT and random_bool(
             rng,
             0.4,
         ):
-            text += self._random_consonant(rng)
+            parts.append(self._random_consonant(rng))
+
+        return first_upper("".join(parts))
+
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        # Batches draw each syllable from the precomputed pattern x consonant x
+        # vowel table: one alias lookup instead of three draws.
+        syllables, _ = _syllable_tables()
+        count = self.syllable_count
+        indices = syllables.sample_many(rng, n * count)
+        table_name = self._table_name
+        return [
+            table_name(rng, indices[start : start + count])
+            for start in range(0, n * count, count)
+        ]
+
+    def _table_name(self, rng: random.Random, indices: Sequence[int]) -> str:
+        """Assemble a name from syllable-table ``indices``, drawing its marks."""
+        syllables, final_consonants = _syllable_tables()
+        texts = syllables.texts
+        patterns = syllables.tags
+        count = self.syllable_count
+        random_ = rng.random
+        hyphen_syllable = (
+            rng.randrange(3, count)
+            if count > 3 and self.allow_hyphen and random_() < 0.25
+            else 0
+        )
+        will_try_apostrophe = self.allow_apostrophe and random_() < 0.5
+
+        parts: list[str] = []
+        previous_pattern: SyllablePattern | None = None
+        for current_syllable, index in enumerate(indices, 1):
+            pattern = patterns[index]
+            if (
+                will_try_apostrophe
+                and previous_pattern in _OPENS_APOSTROPHE
+                and pattern in _CLOSES_APOSTROPHE
+            ):
+                parts.append("'")
+                will_try_apostrophe = False
+            parts.append(texts[index])
+            previous_pattern = pattern
+            if current_syllable == hyphen_syllable:
+                parts.append("-")
 
-        return first_upper(text)
+        if previous_pattern is not SyllablePattern.VOWEL_CONSONANT and (
+            random_() < 0.4
+        ):
+            parts.append(final_consonants.texts[final_consonants.sample(rng)])
+        return first_upper("".join(parts))
+
+
+@lru_cache(maxsize=None)
+def _syllable_tables() -> tuple[
+    SyllableTable[SyllablePattern],
+    SyllableTable[None],
+]:
+    """Build the weighted syllable table and the final-consonant table."""
+    consonants = SyllableTable.mixture(
+        [
+            (0.90, AncientName._single_consonants),
+            (0.10, AncientName._double_consonants),
+        ]
+    )
+    vowels = SyllableTable.mixture(
+        [(0.95, AncientName._single_vowels), (0.05, AncientName._double_vowels)]
+    )
+    consonant_weights = consonants.weights
+    vowel_weights = vowels.weights
+
+    entries: list[tuple[str, SyllablePattern, float]] = []
+    for consonant, consonant_weight in zip(consonants.texts, consonant_weights):
+        for vowel, vowel_weight in zip(vowels.texts, vowel_weights):
+            weight = consonant_weight * vowel_weight
+            entries.append(
+                (consonant + vowel, SyllablePattern.CONSONANT_VOWEL, 0.65 * weight)
+            )
+            entries.append(
+                (vowel + consonant, SyllablePattern.VOWEL_CONSONANT, 0.20 * weight)
+            )
+    for vowel, vowel_weight in zip(vowels.texts, vowel_weights):
+        entries.append((vowel, SyllablePattern.VOWEL_ONLY, 0.15 * vowel_weight))
+    return SyllableTable(entries), consonants
@@ -2,33 +2,87 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import random
-from typing import ClassVar
+from typing import Callable
 
-from wordsmith.core.base import Component
+from wordsmith.core.base import Component, Renderer
+from wordsmith.core.components import one_of
 from wordsmith.names.gender import BinaryGender
-from wordsmith.util import load_json
+from wordsmith.util import LazyAsset
+from wordsmith.words.base import WordList
+
+
+@dataclass(frozen=True)
+class _MaleGivenNames(WordList):
+    _options = LazyAsset[list[str]]("Common Male Given Names.json")
+
+
+@dataclass(frozen=True)
+class _FemaleGivenNames(WordList):
+    _options = LazyAsset[list[str]]("Common Female Given Names.json")
 
 
 @dataclass(frozen=True)
 class GivenName(Component):
-    """Random given name with optional gender selection."""
+    """Random given name with optional gender selection.
+
+    Each gender draws from its own ``WordList``, so ``weighted=True`` works as
+    it does for word lists and raises ``ValueError`` when a list has no
+    weights.
+    """
 
     gender: BinaryGender | None = None
+    weighted: bool = field(default=False, kw_only=True)
+
+    _male_options = LazyAsset[list[str]]("Common Male Given Names.json")
+    _female_options = LazyAsset[list[str]]("Common Female Given Names.json")
 
-    _male_options: ClassVar[list[str]] = load_json(
-        "Common Male Given Names.json"
-    )
-    _female_options: ClassVar[list[str]] = load_json(
-        "Common Female Given Names.json"
-    )
+    def __post_init__(self) -> None:
+        if not self.weighted:
+            return
+        genders = (self.gender,) if self.gender else tuple(BinaryGender)
+        try:
+            for gender in genders:
+                self._names(gender)
+        except ValueError:
+            raise ValueError("GivenName has no frequency weights to draw by.") from None
+
+    def _names(self, gender: BinaryGender) -> WordList:
+        """Return the word list drawn for ``gender``."""
+        return _given_names(gender, self.weighted)
 
     def make_text(self, rng: random.Random) -> str:
         gender = self.gender or (
             BinaryGender.MALE if rng.choice([True, False]) else BinaryGender.FEMALE
         )
+        return self._names(gender).make_text(rng)
+
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        if self.gender is None:
+            return one_of(
+                self._names(BinaryGender.MALE), self._names(BinaryGender.FEMALE)
+            ).make_many(rng, n)
+        return self._names(self.gender).make_many(rng, n)
+
+    def _compile(self, compile_child: Callable[[Component], Renderer]) -> Renderer:
+        if self.gender is not None:
+            return compile_child(self._names(self.gender))
+
+        renderers = (
+            compile_child(self._names(BinaryGender.MALE)),
+            compile_child(self._names(BinaryGender.FEMALE)),
+        )
+
+        def render_any(rng: random.Random) -> str:
+            return rng.choice(renderers)(rng)
+
+        return render_any
+
 
-        if gender == BinaryGender.MALE:
-            return rng.choice(self._male_options)
-        return rng.choice(self._female_options)
+@lru_cache(maxsize=None)
+def _given_names(gender: BinaryGender, weighted: bool) -> WordList:
+    if gender == BinaryGender.MALE:
+        return _MaleGivenNames(weighted=weighted)
+    return _FemaleGivenNames(weighted=weighted)
@@ -3,18 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import random
-from typing import ClassVar
 
-from wordsmith.core.base import Component
-from wordsmith.util import load_json
+from wordsmith.util import LazyAsset
+from wordsmith.words.base import WordList
 
 
 @dataclass(frozen=True)
-class Surname(Component):
+class Surname(WordList):
     """Random surname from the asset list."""
 
-    _options: ClassVar[list[str]] = load_json("Common Surnames.json")
-
-    def make_text(self, rng: random.Random) -> str:
-        return rng.choice(self._options)
+    _options = LazyAsset[list[str]]("Common Surnames.json")
@@ -0,0 +1,57 @@
+"""Precomputed syllable tables shared by the procedural name generators."""
+
+from __future__ import annotations
+
+from enum import Enum
+import random
+from typing import Generic, Sequence, TypeVar
+
+from wordsmith.util.samplers import AliasSampler
+
+COIN = (True, False)
+"""Coin for ``rng.choice``; draws exactly like ``rng.choice([True, False])``."""
+
+TagT = TypeVar("TagT")
+
+
+class SyllablePattern(Enum):
+    CONSONANT_VOWEL = "consonant_vowel"
+    VOWEL_CONSONANT = "vowel_consonant"
+    VOWEL_ONLY = "vowel_only"
+
+
+class SyllableTable(Generic[TagT]):
+    """Weighted table of whole syllables, drawn with one alias lookup each.
+
+    Every entry is a rendered syllable plus a tag, such as its pattern, that
+    the generator needs while assembling a name.
+    """
+
+    def __init__(self, entries: Sequence[tuple[str, TagT, float]]) -> None:
+        self.texts = [text for text, _, _ in entries]
+        self.tags = [tag for _, tag, _ in entries]
+        self.weights = [weight for _, _, weight in entries]
+        self._sampler = AliasSampler(self.weights)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def sample(self, rng: random.Random) -> int:
+        """Return the index of one weighted syllable."""
+        return self._sampler.sample(rng)
+
+    def sample_many(self, rng: random.Random, n: int) -> list[int]:
+        """Return the indexes of ``n`` weighted syllables."""
+        return self._sampler.sample_many(rng, n)
+
+    @classmethod
+    def mixture(
+        cls: type[SyllableTable[None]],
+        groups: Sequence[tuple[float, Sequence[str]]],
+    ) -> SyllableTable[None]:
+        """Build a table that picks a group by weight, then a member uniformly."""
+        weights: dict[str, float] = {}
+        for weight, members in groups:
+            for member in members:
+                weights[member] = weights.get(member, 0.0) + weight / len(members)
+        return cls([(text, None, weight) for text, weight in weights.items()])
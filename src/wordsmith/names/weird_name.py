@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import random
 from typing import ClassVar
 
 from wordsmith.core.base import Component
+from wordsmith.names.syllables import COIN, SyllableTable
 from wordsmith.util import first_upper
 
 
@@ -178,12 +180,12 @@ class WeirdName(Component):
         will_use_hyphen = (
             self.syllable_count > 2
             and self.allow_hyphen
-            and rng.choice([True, False])
+            and rng.choice(COIN)
         )
         will_use_apostrophe = (
             self.syllable_count > 2
             and self.allow_apostrophe
-            and rng.choice([True, False])
+            and rng.choice(COIN)
         )
 
         hyphen_syllable = (
@@ -193,16 +195,62 @@ class WeirdName(Component):
             rng.randrange(1, self.syllable_count) if will_use_apostrophe else 0
         )
 
-        text = ""
+        parts: list[str] = []
         for current_syllable in range(1, self.syllable_count + 1):
-            text += rng.choice(self._open_ended_syllables)
+            parts.append(rng.choice(self._open_ended_syllables))
 
             if current_syllable == apostrophe_syllable:
-                text += "'"
+                parts.append("'")
             elif current_syllable == hyphen_syllable:
-                text += "-"
+                parts.append("-")
 
-        if rng.choice([True, False]):
-            text += rng.choice(self._ending_sounds)
+        if rng.choice(COIN):
+            parts.append(rng.choice(self._ending_sounds))
 
-        return first_upper(text)
+        return first_upper("".join(parts))
+
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        syllables, endings = _syllable_tables()
+        texts = syllables.texts
+        count = self.syllable_count
+        indices = syllables.sample_many(rng, n * count)
+        random_ = rng.random
+        can_mark = count > 2
+
+        names = []
+        for row in range(n):
+            hyphen_syllable = (
+                rng.randrange(1, count)
+                if can_mark and self.allow_hyphen and random_() < 0.5
+                else 0
+            )
+            apostrophe_syllable = (
+                rng.randrange(1, count)
+                if can_mark and self.allow_apostrophe and random_() < 0.5
+                else 0
+            )
+
+            parts: list[str] = []
+            start = row * count
+            for current_syllable, index in enumerate(
+                indices[start : start + count], 1
+            ):
+                parts.append(texts[index])
+                if current_syllable == apostrophe_syllable:
+                    parts.append("'")
+                elif current_syllable == hyphen_syllable:
+                    parts.append("-")
+
+            if random_() < 0.5:
+                parts.append(endings.texts[endings.sample(rng)])
+            names.append(first_upper("".join(parts)))
+        return names
+
+
+@lru_cache(maxsize=None)
+def _syllable_tables() -> tuple[SyllableTable[None], SyllableTable[None]]:
+    """Build the uniform syllable and ending tables."""
+    return (
+        SyllableTable.mixture([(1.0, WeirdName._open_ended_syllables)]),
+        SyllableTable.mixture([(1.0, WeirdName._ending_sounds)]),
+    )
@@ -0,0 +1,147 @@
+"""Process-pool generation with reproducible, worker-independent seeding."""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+import hashlib
+from multiprocessing.context import BaseContext
+import os
+import random
+from typing import Iterator
+
+from wordsmith.core.base import Component
+from wordsmith.util.randoms import (
+    RngPolicy,
+    get_default_rng_policy,
+    set_default_rng_policy,
+)
+from wordsmith.util.samplers import (
+    SamplerPolicy,
+    get_default_sampler_policy,
+    set_default_sampler_policy,
+)
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def chunk_seed(seed: int, index: int) -> int:
+    """Derive the RNG seed for chunk ``index`` from the master ``seed``."""
+    digest = hashlib.blake2b(f"{seed}:{index}".encode(), digest_size=16).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _render_chunk(component: Component, seed: int, index: int, count: int) -> list[str]:
+    return component.make_many(random.Random(chunk_seed(seed, index)), count)
+
+
+def _render_chunk_in_worker(
+    component: Component,
+    seed: int,
+    index: int,
+    count: int,
+    rng_policy: RngPolicy,
+    sampler_policy: SamplerPolicy,
+) -> list[str]:
+    # Spawned and forkserver workers start from the module defaults, so apply
+    # the caller's policies before every chunk.
+    set_default_rng_policy(rng_policy)
+    set_default_sampler_policy(sampler_policy)
+    return _render_chunk(component, seed, index, count)
+
+
+def _chunk_counts(n: int, chunk_size: int) -> list[int]:
+    full, rest = divmod(n, chunk_size)
+    return [chunk_size] * full + ([rest] if rest else [])
+
+
+def generate(
+    component: Component,
+    n: int,
+    seed: int,
+    workers: int | None = None,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+    mp_context: BaseContext | None = None,
+) -> Iterator[str]:
+    """Stream ``n`` texts rendered across a pool of worker processes.
+
+    The output is split into chunks of ``chunk_size`` texts. Chunk ``i`` is
+    rendered with ``make_many`` from ``random.Random(chunk_seed(seed, i))``,
+    so the full output depends only on ``seed`` and ``chunk_size``, never on
+    the number of workers. With ``ordered=False`` chunks are yielded as soon
+    as they finish; each chunk keeps its internal order.
+
+    ``workers`` defaults to ``os.cpu_count()``; ``workers=1`` renders in the
+    calling process. The component must be picklable. Workers render under
+    the RNG and sampler policies active when ``generate`` is called, whatever
+    their start method; ``mp_context`` picks that start method.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive.")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be positive.")
+    policies = (get_default_rng_policy(), get_default_sampler_policy())
+    return _generate(
+        component, n, seed, workers, chunk_size, ordered, mp_context, policies
+    )
+
+
+def _generate(
+    component: Component,
+    n: int,
+    seed: int,
+    workers: int | None,
+    chunk_size: int,
+    ordered: bool,
+    mp_context: BaseContext | None,
+    policies: tuple[RngPolicy, SamplerPolicy],
+) -> Iterator[str]:
+    counts = _chunk_counts(n, chunk_size)
+    workers = min(workers or os.cpu_count() or 1, max(len(counts), 1))
+
+    if workers == 1:
+        for index, count in enumerate(counts):
+            yield from _render_chunk(component, seed, index, count)
+        return
+
+    # Keep a bounded number of chunks in flight so huge runs stream instead
+    # of piling finished chunks up in memory.
+    pending = iter(enumerate(counts))
+    window = 2 * workers
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+
+        def submit_next() -> Future[list[str]] | None:
+            chunk = next(pending, None)
+            if chunk is None:
+                return None
+            index, count = chunk
+            return executor.submit(
+                _render_chunk_in_worker, component, seed, index, count, *policies
+            )
+
+        try:
+            if ordered:
+                in_order: deque[Future[list[str]]] = deque()
+                while len(in_order) < window and (future := submit_next()) is not None:
+                    in_order.append(future)
+                while in_order:
+                    texts = in_order.popleft().result()
+                    if (future := submit_next()) is not None:
+                        in_order.append(future)
+                    yield from texts
+            else:
+                running: set[Future[list[str]]] = set()
+                while len(running) < window and (future := submit_next()) is not None:
+                    running.add(future)
+                while running:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for finished in done:
+                        if (future := submit_next()) is not None:
+                            running.add(future)
+                        yield from finished.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
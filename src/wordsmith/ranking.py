@@ -0,0 +1,536 @@
+"""Index-addressed generation: map integers to outputs and back.
+
+Every rankable component has a finite space of derivations, numbered
+``0 .. cardinality - 1`` in the same way :mod:`wordsmith.analysis` counts
+them. ``unrank(component, index)`` renders derivation ``index`` without an
+RNG, so a name space can be split across machines by index range, and
+``rank(component, text)`` recovers the index of a rendered text when only one
+derivation produces it.
+
+Numbering is mixed-radix: ``Text`` parts are digits with the first part most
+significant, choices lay their reachable options out one after another, and
+word lists number their distinct words in table order. The numbering changes
+when a grammar or word list changes.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+
+from wordsmith.analysis import (
+    _choices,
+    _leaf_distribution,
+    _prefix_options,
+)
+from wordsmith.core.base import Component, GrammarComponent
+from wordsmith.core.components import (
+    Capitalized,
+    CoinFlips,
+    Empty,
+    FirstUppercased,
+    Literal,
+    LiteralChoice,
+    OneOf,
+    PossessiveForm,
+    PrefixedByArticle,
+    Text,
+    TitleCased,
+)
+from wordsmith.names.ancient_name import AncientName
+from wordsmith.names.weird_name import WeirdName
+from wordsmith.util.casing import Casing
+from wordsmith.util.strings import starts_with_vowel
+from wordsmith.words.articles import Article, Determiner
+
+_CASINGS: dict[type[Component], Casing] = {
+    Capitalized: Casing.CAPITALIZED,
+    FirstUppercased: Casing.FIRST_UPPER,
+    TitleCased: Casing.TITLE,
+}
+
+_Matches = list[tuple[int, int]]
+"""``(end position, local index)`` pairs for one node at one position."""
+
+_Starts = tuple[frozenset[str], bool]
+"""Folded first characters a node's outputs can start with, and whether one
+of its outputs is empty."""
+
+
+def unrank(component: Component, index: int) -> str:
+    """Render derivation ``index`` of ``component`` without drawing randomness.
+
+    Raises ``IndexError`` when ``index`` is outside ``[0, cardinality)`` and
+    ``TypeError`` when the component is not rankable.
+    """
+    ranker = _ranker(component)
+    if not 0 <= index < ranker.size:
+        raise IndexError(
+            f"Index {index} is out of range for {ranker.size} derivations."
+        )
+    return ranker.unrank(ranker.root, index)
+
+
+def rank(component: Component, text: str) -> int:
+    """Return the derivation index that renders ``text``.
+
+    Text is matched case-insensitively against the grammar, and every
+    candidate is confirmed by rendering it with :func:`unrank`. Raises
+    ``ValueError`` when no derivation renders ``text`` or when more than one
+    does, and ``TypeError`` when the component is not rankable.
+    """
+    candidates = _ranker(component).derivations(text)
+    if not candidates:
+        raise ValueError(f"{text!r} is not an output of {component!r}.")
+    if len(candidates) > 1:
+        raise ValueError(
+            f"{text!r} is ambiguous: {len(candidates)} derivations of "
+            f"{component!r} render it."
+        )
+    return candidates[0]
+
+
+@dataclass(frozen=True)
+class _Leaf:
+    values: tuple[str, ...]
+    lookup: dict[str, tuple[int, ...]]
+    lengths: tuple[int, ...]
+    starts: _Starts
+
+
+def _fold(text: str) -> str:
+    """Lowercase ``text`` character by character, keeping its length.
+
+    Characters whose lowercase form is longer, such as "İ", are kept as they
+    are, so positions in the folded text line up with the original.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(
+        lower if len(lower := char.lower()) == 1 else char for char in text
+    )
+
+
+@lru_cache(maxsize=None)
+def _leaf(component: Component) -> _Leaf:
+    values = tuple(_leaf_distribution(component) or ())
+    lookup: dict[str, list[int]] = {}
+    for position, value in enumerate(values):
+        lookup.setdefault(_fold(value), []).append(position)
+    return _Leaf(
+        values=values,
+        lookup={key: tuple(positions) for key, positions in lookup.items()},
+        lengths=tuple(sorted({len(key) for key in lookup})),
+        starts=(frozenset(key[0] for key in lookup if key), "" in lookup),
+    )
+
+
+@lru_cache(maxsize=128)
+def _ranker(component: Component, merge_coin_flips: bool = False) -> _Ranker:
+    return _Ranker(component, merge_coin_flips)
+
+
+class _Ranker:
+    """Derivation counts for one component tree, computed once.
+
+    With ``merge_coin_flips`` each ``CoinFlips`` node is ranked as
+    :func:`_merged_coin_flips` of it, which renders the same texts through
+    fewer derivations; indexes then no longer match ``cardinality``.
+    """
+
+    def __init__(self, component: Component, merge_coin_flips: bool = False) -> None:
+        self._root_component = component
+        self._merge_coin_flips = merge_coin_flips
+        self._nodes: dict[int, Component] = {}
+        self._interned: dict[Component, Component] = {}
+        self._sizes: dict[int, int] = {}
+        self._options: dict[int, tuple[tuple[Component, ...], list[int]]] = {}
+        self._starts: dict[int, _Starts] = {}
+        self.root = self._resolve(component, set())
+        self.size = self._sizes[id(self.root)]
+
+    def _resolve(self, node: Component, active: set[GrammarComponent]) -> Component:
+        """Expand grammars and procedural names, then size the plain tree."""
+        grammars: list[GrammarComponent] = []
+        try:
+            while isinstance(node, GrammarComponent):
+                if node in active:
+                    raise TypeError(
+                        f"{self._root_component!r} is not rankable: {node!r} is "
+                        "recursive, so its output space is infinite."
+                    )
+                grammars.append(node)
+                active.add(node)
+                node = node.grammar()
+            if isinstance(node, AncientName):
+                node = _ancient_name_tree(node)
+            elif isinstance(node, WeirdName):
+                node = _weird_name_tree(node)
+            elif isinstance(node, CoinFlips) and self._merge_coin_flips:
+                node = _merged_coin_flips(node)
+            # Equal subtrees, such as the options CoinFlips variants share,
+            # become one node so parsing memoizes them once.
+            node = self._interned.setdefault(node, node)
+            if id(node) not in self._sizes:
+                self._size(node, active)
+        finally:
+            active.difference_update(grammars)
+        return node
+
+    def _size(self, node: Component, active: set[GrammarComponent]) -> None:
+        def resolve(child: Component) -> Component:
+            return self._resolve(child, active)
+
+        starts: _Starts
+        if _leaf_distribution(node) is not None:
+            leaf = _leaf(node)
+            size = len(leaf.values)
+            starts = leaf.starts
+        elif isinstance(node, Text):
+            parts = tuple(resolve(part) for part in node.parts)
+            sizes = [self._sizes[id(part)] for part in parts]
+            self._options[id(node)] = (parts, sizes)
+            size = 1
+            for part_size in sizes:
+                size *= part_size
+            # Empty parts are skipped without a separator, so the text starts
+            # with the first part that renders something.
+            initials: set[str] = set()
+            empty = True
+            for part in parts:
+                part_initials, part_empty = self._starts[id(part)]
+                initials |= part_initials
+                if not part_empty:
+                    empty = False
+                    break
+            starts = (frozenset(initials), empty)
+        elif (choices := _choices(node)) is not None:
+            options = tuple(resolve(option) for p, option in choices if p)
+            offsets = list(
+                accumulate((self._sizes[id(option)] for option in options), initial=0)
+            )
+            self._options[id(node)] = (options, offsets)
+            size = offsets[-1]
+            option_starts = [self._starts[id(option)] for option in options]
+            starts = (
+                frozenset().union(*(initials for initials, _ in option_starts)),
+                any(empty for _, empty in option_starts),
+            )
+        elif isinstance(node, (*_CASINGS, PossessiveForm)):
+            wrapped = resolve(node.wrapped)  # type: ignore[attr-defined]
+            self._options[id(node)] = ((wrapped,), [])
+            size = self._sizes[id(wrapped)]
+            starts = self._starts[id(wrapped)]
+            if isinstance(node, PossessiveForm):
+                initials, empty = starts
+                starts = (initials | {"'"} if empty else initials, False)
+        elif (prefixes := _prefix_options(node)) is not None:
+            wrapped = resolve(node.wrapped)  # type: ignore[attr-defined]
+            self._options[id(node)] = ((wrapped,), [])
+            size = prefixes * self._sizes[id(wrapped)]
+            # "an" shares its initial with "a".
+            initials = {_fold(prefix)[0] for prefix in _prefix_values(node)}
+            starts = (frozenset(initials), False)
+        else:
+            raise TypeError(
+                f"{self._root_component!r} is not rankable: "
+                f"{type(node).__name__} renders through a custom make_text rather "
+                "than a component tree."
+            )
+
+        # Keep nodes alive so their ids stay unique for the ranker's lifetime.
+        self._nodes[id(node)] = node
+        self._sizes[id(node)] = size
+        self._starts[id(node)] = starts
+
+    def unrank(self, node: Component, index: int) -> str:
+        entry = self._options.get(id(node))
+        if entry is None:
+            return _leaf(node).values[index]
+        children, table = entry
+
+        if isinstance(node, Text):
+            digits = []
+            for size in reversed(table):
+                index, digit = divmod(index, size)
+                digits.append(digit)
+            rendered = [
+                self.unrank(part, digit)
+                for part, digit in zip(children, reversed(digits))
+            ]
+            return node.sep.join(value for value in rendered if value)
+
+        if len(table) > 1:
+            position = bisect_right(table, index) - 1
+            return self.unrank(children[position], index - table[position])
+
+        wrapped = children[0]
+        casing = _CASINGS.get(type(node))
+        if casing is not None:
+            return casing.apply(self.unrank(wrapped, index))
+        if isinstance(node, PossessiveForm):
+            value = self.unrank(wrapped, index)
+            return f"{value}'" if value.endswith("s") else f"{value}'s"
+
+        choice, index = divmod(index, self._sizes[id(wrapped)])
+        value = self.unrank(wrapped, index)
+        prefix = _prefix_values(node)[choice]
+        if prefix == "a" and starts_with_vowel(value):
+            prefix = "an"
+        return f"{prefix} {value}"
+
+    def derivations(self, text: str, limit: int | None = None) -> list[int]:
+        """Return the sorted indexes of every derivation that renders ``text``.
+
+        With ``limit``, only indexes below it are confirmed and returned.
+        """
+        matches = self.parse(self.root, _fold(text), 0, {})
+        return sorted(
+            {
+                index
+                for end, index in matches
+                if end == len(text)
+                and (limit is None or index < limit)
+                and self.unrank(self.root, index) == text
+            }
+        )
+
+    def parse(
+        self,
+        node: Component,
+        text: str,
+        start: int,
+        memo: dict[tuple[int, int], _Matches],
+    ) -> _Matches:
+        """Return every ``(end, index)`` a derivation of ``node`` could match.
+
+        Matching ignores case and possessive spelling; callers confirm
+        candidates with :meth:`unrank`.
+        """
+        key = (id(node), start)
+        cached = memo.get(key)
+        if cached is not None:
+            return cached
+
+        matches: _Matches = []
+        initials, empty = self._starts[id(node)]
+        if not empty and text[start : start + 1] not in initials:
+            memo[key] = matches
+            return matches
+        if id(node) not in self._options:
+            leaf = _leaf(node)
+            for length in leaf.lengths:
+                for position in leaf.lookup.get(text[start : start + length], ()):
+                    matches.append((start + length, position))
+        elif isinstance(node, Text):
+            matches = self._parse_text(node, text, start, memo)
+        else:
+            children, table = self._options[id(node)]
+            if len(table) > 1:
+                for option, offset in zip(children, table):
+                    matches.extend(
+                        (end, offset + index)
+                        for end, index in self.parse(option, text, start, memo)
+                    )
+            elif isinstance(node, PossessiveForm):
+                for end, index in self.parse(children[0], text, start, memo):
+                    for suffix in ("'s", "'"):
+                        if text.startswith(suffix, end):
+                            matches.append((end + len(suffix), index))
+            elif type(node) in _CASINGS:
+                matches = self.parse(children[0], text, start, memo)
+            else:
+                wrapped = children[0]
+                size = self._sizes[id(wrapped)]
+                for choice, prefix in enumerate(_prefix_values(node)):
+                    for spelling in {prefix, "an" if prefix == "a" else prefix}:
+                        if not text.startswith(f"{spelling} ", start):
+                            continue
+                        after = start + len(spelling) + 1
+                        matches.extend(
+                            (end, choice * size + index)
+                            for end, index in self.parse(wrapped, text, after, memo)
+                        )
+        memo[key] = matches
+        return matches
+
+    def _parse_text(
+        self,
+        node: Text,
+        text: str,
+        start: int,
+        memo: dict[tuple[int, int], _Matches],
+    ) -> _Matches:
+        sep = _fold(node.sep)
+        parts, sizes = self._options[id(node)]
+        # States are (position, whether any part rendered text, index so far).
+        states = [(start, False, 0)]
+        for part, size in zip(parts, sizes):
+            next_states = []
+            for position, emitted, index in states:
+                for end, local in self.parse(part, text, position, memo):
+                    if end == position:
+                        next_states.append((position, emitted, index * size + local))
+                if emitted:
+                    if not text.startswith(sep, position):
+                        continue
+                    after = position + len(sep)
+                else:
+                    after = position
+                for end, local in self.parse(part, text, after, memo):
+                    if end > after:
+                        next_states.append((end, True, index * size + local))
+            states = next_states
+        return [(position, index) for position, _, index in states]
+
+
+def _prefix_values(node: Component) -> tuple[str, ...]:
+    return Article._options if isinstance(node, PrefixedByArticle) else (
+        Determiner._options
+    )
+
+
+@lru_cache(maxsize=None)
+def _merged_coin_flips(component: CoinFlips) -> Component:
+    """Merge the variants of ``component`` option by option.
+
+    Variants built from coin flips usually share most of their options. When
+    every variant is a ``OneOf`` with the same number of options, under the
+    same casing wrapper, the merged tree picks an option position first and
+    then one of that position's distinct variants, so flips the chosen option
+    does not depend on no longer multiply its derivations. Other trees become
+    a ``OneOf`` of the distinct variants.
+    """
+    variants = tuple(dict.fromkeys(component.options))
+    if len(variants) == 1:
+        return variants[0]
+    wrapper: type[Component] | None = type(variants[0])
+    if wrapper in _CASINGS and all(type(variant) is wrapper for variant in variants):
+        choices = [variant.wrapped for variant in variants]  # type: ignore[attr-defined]
+    else:
+        wrapper, choices = None, list(variants)
+    if not all(
+        isinstance(choice, OneOf) and len(choice.options) == len(choices[0].options)
+        for choice in choices
+    ):
+        return OneOf(options=variants)
+
+    columns = (
+        tuple(dict.fromkeys(column))
+        for column in zip(*(choice.options for choice in choices))
+    )
+    merged = OneOf(
+        options=tuple(
+            column[0] if len(column) == 1 else OneOf(options=column)
+            for column in columns
+        )
+    )
+    return merged if wrapper is None else wrapper(merged)  # type: ignore[call-arg]
+
+
+@lru_cache(maxsize=None)
+def _ancient_name_tree(component: AncientName) -> Component:
+    """Build a tree with the same derivations as ``AncientName.make_text``."""
+    consonant = LiteralChoice(
+        tuple(
+            dict.fromkeys(
+                AncientName._single_consonants + AncientName._double_consonants
+            )
+        )
+    )
+    vowel = LiteralChoice(
+        tuple(dict.fromkeys(AncientName._single_vowels + AncientName._double_vowels))
+    )
+    syllables = {
+        "cv": Text(parts=(consonant, vowel)),
+        "vc": Text(parts=(vowel, consonant)),
+        "v": vowel,
+    }
+    final_consonant = OneOf(options=(Empty(), consonant))
+    count = component.syllable_count
+
+    def sequence(hyphen: int, apostrophe: bool) -> Component | None:
+        built: dict[tuple[int, str | None, bool], Component | None] = {}
+
+        # ``pending`` is set while a requested apostrophe has not been placed;
+        # those derivations only count once it has been.
+        def rest(number: int, last: str | None, pending: bool) -> Component | None:
+            key = (number, last, pending)
+            if key in built:
+                return built[key]
+            node: Component | None
+            if number > count:
+                if pending:
+                    node = None
+                else:
+                    node = Empty() if last == "vc" else final_consonant
+            else:
+                options = []
+                for pattern, syllable in syllables.items():
+                    placed = (
+                        pending and last in ("cv", "v") and pattern in ("vc", "v")
+                    )
+                    tail = rest(number + 1, pattern, pending and not placed)
+                    if tail is None:
+                        continue
+                    parts = [syllable, tail]
+                    if number == hyphen:
+                        parts.insert(1, Literal("-"))
+                    if placed:
+                        parts.insert(0, Literal("'"))
+                    options.append(Text(parts=tuple(parts)))
+                node = OneOf(options=tuple(options)) if options else None
+            built[key] = node
+            return node
+
+        return rest(1, None, apostrophe)
+
+    hyphens = [0]
+    if count > 3 and component.allow_hyphen:
+        hyphens.extend(range(3, count))
+    apostrophes = [False, True] if component.allow_apostrophe else [False]
+    variants = [
+        tree
+        for hyphen in hyphens
+        for apostrophe in apostrophes
+        if (tree := sequence(hyphen, apostrophe)) is not None
+    ]
+    return FirstUppercased(OneOf(options=tuple(variants)))
+
+
+@lru_cache(maxsize=None)
+def _weird_name_tree(component: WeirdName) -> Component:
+    """Build a tree with the same derivations as ``WeirdName.make_text``."""
+    syllable = LiteralChoice(tuple(dict.fromkeys(WeirdName._open_ended_syllables)))
+    ending = OneOf(
+        options=(Empty(), LiteralChoice(tuple(dict.fromkeys(WeirdName._ending_sounds))))
+    )
+    count = component.syllable_count
+
+    # An apostrophe after the same syllable as the hyphen replaces it.
+    slots = range(1, count) if count > 2 else range(0)
+    hyphens = [0, *slots] if component.allow_hyphen else [0]
+    apostrophes = [0, *slots] if component.allow_apostrophe else [0]
+    markers = dict.fromkeys(
+        (0 if hyphen == apostrophe else hyphen, apostrophe)
+        for hyphen in hyphens
+        for apostrophe in apostrophes
+    )
+
+    def marked(hyphen: int, apostrophe: int) -> Component:
+        parts: list[Component] = []
+        for number in range(1, count + 1):
+            parts.append(syllable)
+            if number == apostrophe:
+                parts.append(Literal("'"))
+            elif number == hyphen:
+                parts.append(Literal("-"))
+        parts.append(ending)
+        return Text(parts=tuple(parts))
+
+    options = tuple(marked(hyphen, apostrophe) for hyphen, apostrophe in markers)
+    return FirstUppercased(OneOf(options=options))
+
@@ -1,9 +1,17 @@
 """Special-case generators and helpers."""
 
 from .exotic_character import ExoticCharacter
-from .readable_unique_identifier import ReadableUniqueIdentifier
+from .readable_unique_identifier import (
+    DecodedIdentifier,
+    IdentifierLayout,
+    IdentifierMinter,
+    ReadableUniqueIdentifier,
+)
 
 __all__ = [
+    "DecodedIdentifier",
     "ExoticCharacter",
+    "IdentifierLayout",
+    "IdentifierMinter",
     "ReadableUniqueIdentifier",
 ]
@@ -3,27 +3,55 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import random
-from typing import ClassVar
 
-from wordsmith.util import load_json
+from wordsmith.util import LazyAsset, default_rng
+from wordsmith.util.samplers import AliasSampler
+
+
+@dataclass(frozen=True)
+class _CharacterTables:
+    sets: tuple[tuple[str, ...], ...]
+    by_name: dict[str, tuple[str, ...]]
+    flat: tuple[str, ...]
+    set_weighted: AliasSampler
+    """Draws from ``flat`` like picking a set, then a character in it."""
+
+
+@lru_cache(maxsize=None)
+def _character_tables() -> _CharacterTables:
+    by_name = {
+        name: tuple(characters)
+        for name, characters in ExoticCharacter._character_sets.items()
+    }
+    sets = tuple(by_name.values())
+    return _CharacterTables(
+        sets=sets,
+        by_name=by_name,
+        flat=tuple(character for characters in sets for character in characters),
+        set_weighted=AliasSampler(
+            [
+                1 / (len(sets) * len(characters))
+                for characters in sets
+                for _ in characters
+            ]
+        ),
+    )
 
 
 @dataclass(frozen=True)
 class ExoticCharacter:
     """Pick random exotic characters."""
 
-    _character_sets: ClassVar[dict[str, list[str]]] = load_json(
-        "Exotic Character Sets.json"
-    )
+    _character_sets = LazyAsset[dict[str, list[str]]]("Exotic Character Sets.json")
 
     @classmethod
     def random_character(cls, rng: random.Random | None = None) -> str:
         if rng is None:
-            rng = random.SystemRandom()
+            rng = default_rng()
 
-        character_set = rng.choice(list(cls._character_sets.values()))
-        return rng.choice(character_set)
+        return rng.choice(rng.choice(_character_tables().sets))
 
     @classmethod
     def random_character_from_set(
@@ -32,8 +60,44 @@ class ExoticCharacter:
         rng: random.Random | None = None,
     ) -> str:
         if rng is None:
-            rng = random.SystemRandom()
+            rng = default_rng()
+
+        return rng.choice(cls._characters_in(set_name))
+
+    @classmethod
+    def random_string(
+        cls,
+        length: int,
+        set_name: str | None = None,
+        rng: random.Random | None = None,
+        *,
+        uniform: bool = False,
+    ) -> str:
+        """Return ``length`` random characters joined into one string.
+
+        With ``set_name`` every character comes from that set. Otherwise each
+        character is drawn like ``random_character``, picking a set first, or
+        with ``uniform=True`` evenly over every character of every set, so
+        large sets such as cuneiform dominate.
+        """
+        if length < 0:
+            raise ValueError("String length must be non-negative.")
+        if rng is None:
+            rng = default_rng()
+
+        if set_name is not None:
+            return "".join(rng.choices(cls._characters_in(set_name), k=length))
+        tables = _character_tables()
+        if uniform:
+            return "".join(rng.choices(tables.flat, k=length))
+        flat = tables.flat
+        return "".join(
+            [flat[index] for index in tables.set_weighted.sample_many(rng, length)]
+        )
 
-        if set_name not in cls._character_sets:
+    @staticmethod
+    def _characters_in(set_name: str) -> tuple[str, ...]:
+        characters = _character_tables().by_name.get(set_name)
+        if characters is None:
             raise ValueError(f"Invalid character set requested: {set_name}")
-        return rng.choice(cls._character_sets[set_name])
+        return characters
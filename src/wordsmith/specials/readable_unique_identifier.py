@@ -3,23 +3,246 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from functools import lru_cache
+import os
 import random
+import threading
+import time
+from typing import Callable
 
+from wordsmith.core.base import Component, Renderer
 from wordsmith.core.components import either
 from wordsmith.words.base import Adjective, Adverb, Noun, Verb, VerbTense
 
+_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_DIGIT_PAIRS = tuple(high + low for high in _DIGITS for low in _DIGITS)
+
+EPOCH_NS = 978_307_200 * 1_000_000_000
+"""2001-01-01T00:00:00Z in nanoseconds since the Unix epoch."""
+
+SEQUENCE_BITS = 12
+"""Identifiers a minter can issue within one microsecond before borrowing the next."""
+
+NODE_BITS = 10
+"""Width of the node/worker ID that keeps concurrent processes apart."""
+
+SORTABLE_WIDTH = 15
+"""Base36 digits in a time-first suffix; enough for stamps past the year 3000."""
+
+_EPOCH = datetime(2001, 1, 1, tzinfo=timezone.utc)
+_system_rng = random.SystemRandom()
+_SEQUENCE_MASK = (1 << SEQUENCE_BITS) - 1
+_NODE_MASK = (1 << NODE_BITS) - 1
+
+
+class IdentifierLayout(Enum):
+    """Where the time-ordered suffix goes in a minted identifier."""
+
+    WORDS_FIRST = "words_first"
+    """``dusty_lighting_K0KBTE71RFG4XV``: the words lead, so keys scatter."""
+
+    TIME_FIRST = "time_first"
+    """``0K0KBTE71RFG4XV_dusty_lighting``: a fixed-width suffix leads, so keys
+    sort by mint time and database inserts append to the end of the index."""
+
+
+@dataclass(frozen=True)
+class DecodedIdentifier:
+    """Fields recovered from a minted identifier."""
+
+    prefix: str
+    minted_at: datetime
+    sequence: int
+    node_id: int
+    layout: IdentifierLayout
+
 
 def _to_base36(value: int) -> str:
-    digits = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
     if value == 0:
         return "0"
 
-    result = ""
-    while value > 0:
-        value, remainder = divmod(value, 36)
-        result = digits[remainder] + result
-    return result
+    # Two digits per divmod; the pairs come out least significant first.
+    pairs = _DIGIT_PAIRS
+    chunks = []
+    while value:
+        value, remainder = divmod(value, 1296)
+        chunks.append(pairs[remainder])
+    return "".join(reversed(chunks)).lstrip("0")
+
+
+@lru_cache(maxsize=None)
+def _prefix_grammar() -> Component:
+    return either(
+        Adjective() + "_" + Noun(),
+        Adverb() + "_" + Verb(tense=VerbTense.PRESENT_PERFECT),
+    )
+
+
+@lru_cache(maxsize=None)
+def _prefix_renderer() -> Renderer:
+    return _prefix_grammar().compile()
+
+
+class _SequenceState:
+    """Last stamp issued for one node and clock, shared by all its minters."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.last_micros = -1
+        self.sequence = 0
+
+
+_sequence_states: dict[tuple[int, Callable[[], int]], _SequenceState] = {}
+_sequence_states_lock = threading.Lock()
+
+
+def _sequence_state(node: int, clock: Callable[[], int]) -> _SequenceState:
+    key = (node, clock)
+    state = _sequence_states.get(key)
+    if state is None:
+        with _sequence_states_lock:
+            state = _sequence_states.setdefault(key, _SequenceState())
+    return state
+
+
+class IdentifierMinter:
+    """Thread-safe source of readable identifiers that never repeat.
+
+    Each identifier ends in the base36 encoding of
+    ``(microseconds since 2001, sequence, node ID)``. The sequence counts
+    identifiers minted in the same microsecond; when it runs out, the minter
+    borrows the next microsecond, so suffixes strictly increase even if the
+    wall clock stalls or steps back. Minters in one process that share a node
+    ID and clock share this sequence, so they never collide with each other.
+    Give every concurrently minting process its own ``node_id`` in
+    ``range(2**NODE_BITS)`` to rule out collisions between them; without
+    one, the node ID is taken from the process ID, which keeps forked workers
+    apart but is not guaranteed unique.
+
+    Prefixes are drawn from ``random.SystemRandom`` unless an RNG is passed,
+    so they cannot be predicted from earlier identifiers.
+    """
+
+    def __init__(
+        self,
+        node_id: int | None = None,
+        *,
+        layout: IdentifierLayout = IdentifierLayout.WORDS_FIRST,
+        clock: Callable[[], int] = time.time_ns,
+    ) -> None:
+        if node_id is not None and not 0 <= node_id < 1 << NODE_BITS:
+            raise ValueError(f"Node ID must be in range(2**{NODE_BITS}).")
+        self.node_id = node_id
+        self.layout = IdentifierLayout(layout)
+        self._clock = clock
+
+    def _node(self) -> int:
+        if self.node_id is not None:
+            return self.node_id
+        return os.getpid() & _NODE_MASK
+
+    def _reserve(self, node: int, n: int) -> list[int]:
+        """Return ``n`` increasing ``micros << SEQUENCE_BITS | sequence`` stamps."""
+        limit = 1 << SEQUENCE_BITS
+        state = _sequence_state(node, self._clock)
+        with state.lock:
+            now = (self._clock() - EPOCH_NS) // 1_000
+            if now > state.last_micros:
+                micros, sequence = now, 0
+            else:
+                micros, sequence = state.last_micros, state.sequence + 1
+            stamps = []
+            for _ in range(n):
+                if sequence == limit:
+                    micros, sequence = micros + 1, 0
+                stamps.append(micros << SEQUENCE_BITS | sequence)
+                sequence += 1
+            if stamps:
+                state.last_micros, state.sequence = micros, sequence - 1
+        return stamps
+
+    def mint(
+        self,
+        rng: random.Random | None = None,
+        *,
+        layout: IdentifierLayout | None = None,
+    ) -> str:
+        """Return one identifier such as ``brave_otter_K0KBTE71RFG4XV``.
+
+        ``layout`` overrides the minter's layout for this call.
+        """
+        if rng is None:
+            rng = _system_rng
+        node = self._node()
+        (stamp,) = self._reserve(node, 1)
+        return _assemble(
+            _prefix_renderer()(rng),
+            stamp << NODE_BITS | node,
+            layout or self.layout,
+        )
+
+    def mint_many(
+        self,
+        n: int,
+        rng: random.Random | None = None,
+        *,
+        layout: IdentifierLayout | None = None,
+    ) -> list[str]:
+        """Return ``n`` identifiers, reserving their suffixes under one lock."""
+        if n < 0:
+            raise ValueError("Batch size must be non-negative.")
+        if rng is None:
+            rng = _system_rng
+        node = self._node()
+        layout = layout or self.layout
+        prefixes = _prefix_grammar().make_many(rng, n)
+        return [
+            _assemble(prefix, stamp << NODE_BITS | node, layout)
+            for prefix, stamp in zip(prefixes, self._reserve(node, n))
+        ]
+
+    @staticmethod
+    def decode(identifier: str) -> DecodedIdentifier:
+        """Recover the prefix, mint time, sequence and node ID of an identifier.
+
+        Both layouts are recognized. Raises ``ValueError`` for text that was
+        not minted by an ``IdentifierMinter``, including suffixes that are
+        not uppercase base36 or are wider than ``SORTABLE_WIDTH`` digits.
+        """
+        head, sep, tail = identifier.partition("_")
+        if sep and len(head) == SORTABLE_WIDTH and (head.isupper() or head.isdigit()):
+            suffix, prefix, layout = head, tail, IdentifierLayout.TIME_FIRST
+        else:
+            prefix, sep, suffix = identifier.rpartition("_")
+            layout = IdentifierLayout.WORDS_FIRST
+        if (
+            not sep
+            or not prefix
+            or not 0 < len(suffix) <= SORTABLE_WIDTH
+            or suffix.strip(_DIGITS)
+        ):
+            raise ValueError(f"Not a minted identifier: {identifier!r}")
+
+        value = int(suffix, 36)
+        micros = value >> (SEQUENCE_BITS + NODE_BITS)
+        return DecodedIdentifier(
+            prefix=prefix,
+            minted_at=_EPOCH + timedelta(microseconds=micros),
+            sequence=(value >> NODE_BITS) & _SEQUENCE_MASK,
+            node_id=value & _NODE_MASK,
+            layout=layout,
+        )
+
+
+def _assemble(prefix: str, value: int, layout: IdentifierLayout) -> str:
+    if layout is IdentifierLayout.TIME_FIRST:
+        return f"{_to_base36(value).rjust(SORTABLE_WIDTH, '0')}_{prefix}"
+    return f"{prefix}_{_to_base36(value)}"
+
+
+_default_minter = IdentifierMinter()
 
 
 @dataclass(frozen=True)
@@ -27,18 +250,13 @@ class ReadableUniqueIdentifier:
     """Readable identifiers with a timestamp suffix."""
 
     @staticmethod
-    def make_identifier(rng: random.Random | None = None) -> str:
-        if rng is None:
-            rng = random.SystemRandom()
+    def make_identifier(
+        rng: random.Random | None = None,
+        layout: IdentifierLayout = IdentifierLayout.WORDS_FIRST,
+    ) -> str:
+        return _default_minter.mint(rng, layout=layout)
 
-        prefix = either(
-            Adjective() + "_" + Noun(),
-            Adverb() + "_" + Verb(tense=VerbTense.PRESENT_PERFECT),
-        ).make_text(rng)
-
-        reference = datetime(2001, 1, 1, tzinfo=timezone.utc)
-        micros = int(
-            (datetime.now(tz=timezone.utc) - reference).total_seconds() * 1_000_000
-        )
-        suffix = _to_base36(micros)
-        return f"{prefix}_{suffix}"
+    @staticmethod
+    def decode(identifier: str) -> DecodedIdentifier:
+        """Recover the mint time and node ID; see :meth:`IdentifierMinter.decode`."""
+        return IdentifierMinter.decode(identifier)
@@ -0,0 +1,143 @@
+"""Sampling without replacement by permuting a component's rank space.
+
+A :class:`UniqueSampler` walks a keyed pseudo-random permutation of the
+derivation indexes of :mod:`wordsmith.ranking` and unranks each one, so no
+output repeats and nothing already issued has to be remembered. The whole
+state is the seed and a cursor integer.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Iterator
+
+from wordsmith.core.base import Component
+from wordsmith.ranking import _ranker
+
+FEISTEL_ROUNDS = 6
+
+
+class FeistelPermutation:
+    """Keyed bijection on ``range(size)`` from a balanced Feistel network.
+
+    Indexes are split into two halves of equal bit width, mixed for
+    ``rounds`` rounds with a keyed BLAKE2b round function, and cycle-walked
+    until they land back inside ``range(size)``. The network's domain is
+    less than four times ``size``, so a lookup takes fewer than four
+    encryptions on average.
+    """
+
+    def __init__(self, size: int, seed: int, rounds: int = FEISTEL_ROUNDS) -> None:
+        if size < 1:
+            raise ValueError("Permutation size must be positive.")
+        if rounds < 1:
+            raise ValueError("Feistel networks need at least one round.")
+        self.size = size
+        self._half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self._mask = (1 << self._half_bits) - 1
+        self._half_bytes = (self._half_bits + 7) // 8
+        key = hashlib.blake2b(f"wordsmith:{seed}".encode(), digest_size=32).digest()
+        self._rounds = [
+            hashlib.blake2b(
+                key=key,
+                digest_size=max(8, self._half_bytes),
+                person=round_number.to_bytes(16, "little"),
+            )
+            for round_number in range(rounds)
+        ]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _encrypt(self, value: int) -> int:
+        half_bits = self._half_bits
+        mask = self._mask
+        half_bytes = self._half_bytes
+        left, right = value >> half_bits, value & mask
+        for round_hash in self._rounds:
+            mixer = round_hash.copy()
+            mixer.update(right.to_bytes(half_bytes, "little"))
+            left, right = right, left ^ (
+                int.from_bytes(mixer.digest(), "little") & mask
+            )
+        return (left << half_bits) | right
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self.size:
+            raise IndexError("Permutation index out of range")
+        value = self._encrypt(index)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+
+class UniqueSampler:
+    """Draw outputs of a rankable component without ever repeating one.
+
+    Draw ``i`` unranks position ``i`` of a permutation keyed by ``seed``, so
+    a draw costs the same however many outputs were issued, and memory stays
+    constant. ``cursor`` counts the permutation positions consumed; pass it
+    back in to resume a sampler where it stopped.
+
+    Draws are uniform over derivations: choice weights, such as those of
+    ``WeightedOneOf``, are ignored. ``CoinFlips`` variants are merged option
+    by option first, so flips an option does not depend on add no copies.
+
+    When several derivations still render the same text, only the lowest
+    index is issued, so texts, not just derivations, are unique. Checking
+    this parses each output, which costs several unranks. Each repeat also
+    consumes a permutation position. Pass ``skip_duplicates=False`` for
+    components whose derivations are known to render distinct texts.
+    """
+
+    def __init__(
+        self,
+        component: Component,
+        seed: int,
+        cursor: int = 0,
+        *,
+        skip_duplicates: bool = True,
+    ) -> None:
+        self._ranker = _ranker(component, merge_coin_flips=True)
+        if not 0 <= cursor <= self._ranker.size:
+            raise ValueError("Cursor must be within the component's rank space.")
+        self.component = component
+        self.seed = seed
+        self.skip_duplicates = skip_duplicates
+        self._permutation = FeistelPermutation(self._ranker.size, seed)
+        self._cursor = cursor
+
+    @property
+    def cursor(self) -> int:
+        """Number of permutation positions consumed so far."""
+        return self._cursor
+
+    @property
+    def size(self) -> int:
+        """Number of derivations in the sampled rank space."""
+        return self._ranker.size
+
+    def draw(self) -> str:
+        """Return the next unique output; raise ``IndexError`` when exhausted."""
+        ranker = self._ranker
+        permutation = self._permutation
+        while self._cursor < ranker.size:
+            index = permutation[self._cursor]
+            self._cursor += 1
+            text = ranker.unrank(ranker.root, index)
+            if not self.skip_duplicates or not ranker.derivations(text, index):
+                return text
+        raise IndexError(f"All outputs of {self.component!r} have been drawn.")
+
+    def draw_many(self, n: int) -> list[str]:
+        """Return the next ``n`` unique outputs."""
+        if n < 0:
+            raise ValueError("Batch size must be non-negative.")
+        return [self.draw() for _ in range(n)]
+
+    def __iter__(self) -> Iterator[str]:
+        while True:
+            try:
+                yield self.draw()
+            except IndexError:
+                return
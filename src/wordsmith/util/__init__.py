@@ -1,13 +1,52 @@
 """Utility helpers for Wordsmith."""
 
-from .randoms import random_bool
-from .resources import load_json
-from .strings import first_upper, starts_with_vowel, title_case
+from .randoms import (
+    CounterRandom,
+    RngPolicy,
+    default_rng,
+    get_default_rng_policy,
+    random_bool,
+    set_default_rng_policy,
+)
+from .resources import LazyAsset, WeightedList, load_asset, load_json, preload
+from .samplers import (
+    AliasSampler,
+    CumulativeSampler,
+    PolicySampler,
+    SamplerPolicy,
+    WeightedSampler,
+    get_default_sampler_policy,
+    make_sampler,
+    set_default_sampler_policy,
+)
+from .casing import Casing, first_upper, title_case, title_case_many
+from .strings import IRREGULAR_PLURALS, pluralize, starts_with_vowel
 
 __all__ = [
+    "AliasSampler",
+    "Casing",
+    "CounterRandom",
+    "IRREGULAR_PLURALS",
+    "CumulativeSampler",
+    "LazyAsset",
+    "PolicySampler",
+    "RngPolicy",
+    "SamplerPolicy",
+    "WeightedList",
+    "WeightedSampler",
+    "default_rng",
+    "load_asset",
     "load_json",
     "first_upper",
+    "get_default_rng_policy",
+    "get_default_sampler_policy",
+    "make_sampler",
+    "pluralize",
+    "preload",
     "random_bool",
+    "set_default_rng_policy",
+    "set_default_sampler_policy",
     "starts_with_vowel",
     "title_case",
+    "title_case_many",
 ]
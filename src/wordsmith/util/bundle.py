@@ -0,0 +1,337 @@
+"""Precompiled binary bundle of the word list assets.
+
+The bundle packs every list-shaped JSON asset into one file that is read
+through ``mmap``, so forked or parallel worker processes share a single copy
+in the page cache and never parse JSON. Strings are decoded one at a time, on
+access.
+
+Layout (all integers little-endian)::
+
+    magic          4 bytes   b"WSB2"
+    table count    uint32
+    directory      per table: uint16 name length, UTF-8 name,
+                   uint32 rows, uint32 width, uint64 offsets position,
+                   uint64 blob position, uint64 weights position
+    tables         per table: uint32 offsets[rows * width + 1] relative to the
+                   blob position, then the concatenated UTF-8 blob, then, for
+                   weighted lists, float64 weights[rows] 8-byte aligned
+
+``width`` is 1 for lists of strings and the row length for lists of rows such
+as ``Verbs.json``. Weighted lists, whose rows end in a number, store the
+strings before it and a weights column; unweighted tables have weights
+position 0. Rebuild the bundle after editing an asset with::
+
+    python -m wordsmith.util.bundle
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from functools import lru_cache
+import json
+import mmap
+from pathlib import Path
+import struct
+import sys
+from typing import Any, overload
+
+from wordsmith.util.resources import weighted_rows
+
+BUNDLE_FILENAME = "Word Lists.bin"
+
+_MAGIC = b"WSB2"
+_COUNT = struct.Struct("<I")
+_NAME_LENGTH = struct.Struct("<H")
+_ENTRY = struct.Struct("<IIQQQ")
+
+
+class StringTable(Sequence[str]):
+    """Read-only sequence of strings decoded lazily from a bundle buffer.
+
+    ``weights`` holds one weight per entry for weighted lists, else ``None``.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_base",
+        "_offsets",
+        "_length",
+        "_start",
+        "_step",
+        "weights",
+    )
+
+    def __init__(
+        self,
+        buffer: Any,
+        base: int,
+        offsets: Sequence[int],
+        length: int,
+        start: int = 0,
+        step: int = 1,
+        weights: Sequence[float] | None = None,
+    ) -> None:
+        self._buffer = buffer
+        self._base = base
+        self._offsets = offsets
+        self._length = length
+        self._start = start
+        self._step = step
+        self.weights = weights
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("StringTable index out of range")
+        slot = self._start + index * self._step
+        base = self._base
+        offsets = self._offsets
+        return str(
+            self._buffer[base + offsets[slot] : base + offsets[slot + 1]], "utf-8"
+        )
+
+    def __repr__(self) -> str:
+        return f"StringTable(<{self._length} strings>)"
+
+
+class RowTable(Sequence[tuple[str, ...]]):
+    """Read-only sequence of fixed-width string rows from a bundle buffer.
+
+    ``weights`` holds one weight per row for weighted lists, else ``None``.
+    """
+
+    __slots__ = ("_buffer", "_base", "_offsets", "_length", "width", "weights")
+
+    def __init__(
+        self,
+        buffer: Any,
+        base: int,
+        offsets: Sequence[int],
+        length: int,
+        width: int,
+        weights: Sequence[float] | None = None,
+    ) -> None:
+        self._buffer = buffer
+        self._base = base
+        self._offsets = offsets
+        self._length = length
+        self.width = width
+        self.weights = weights
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[str, ...]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[tuple[str, ...]]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> tuple[str, ...] | list[tuple[str, ...]]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("RowTable index out of range")
+        buffer = self._buffer
+        base = self._base
+        offsets = self._offsets
+        first = index * self.width
+        return tuple(
+            str(buffer[base + offsets[slot] : base + offsets[slot + 1]], "utf-8")
+            for slot in range(first, first + self.width)
+        )
+
+    def column(self, index: int) -> StringTable:
+        """Return a lazy view over one column of every row."""
+        if not 0 <= index < self.width:
+            raise IndexError("RowTable column out of range")
+        return StringTable(
+            self._buffer,
+            self._base,
+            self._offsets,
+            self._length,
+            start=index,
+            step=self.width,
+            weights=self.weights,
+        )
+
+    def __repr__(self) -> str:
+        return f"RowTable(<{self._length} rows of {self.width}>)"
+
+
+def _table_shape(value: Any) -> tuple[int, list[str], list[float] | None] | None:
+    """Return ``(width, flat strings, weights)`` for list-shaped assets.
+
+    ``weights`` is ``None`` for unweighted lists; non-list assets give ``None``.
+    """
+    split = weighted_rows(value)
+    if split is not None:
+        entries, weights = split
+        shape = _table_shape(entries)
+        return None if shape is None else (shape[0], shape[1], weights)
+    if not isinstance(value, list) or not value:
+        return None
+    if all(isinstance(item, str) for item in value):
+        return 1, value, None
+    if all(isinstance(item, list) for item in value):
+        width = len(value[0])
+        if width and all(
+            len(row) == width and all(isinstance(item, str) for item in row)
+            for row in value
+        ):
+            return width, [item for row in value for item in row], None
+    return None
+
+
+def build_bundle(source_dir: Path, output_path: Path) -> list[str]:
+    """Pack the list-shaped JSON assets in ``source_dir`` into ``output_path``.
+
+    Returns the names of the bundled assets. Other assets, such as mappings,
+    are left to the JSON loader.
+    """
+    tables: list[tuple[bytes, int, int, bytes, bytes, bytes]] = []
+    for path in sorted(source_dir.glob("*.json")):
+        shape = _table_shape(json.loads(path.read_text(encoding="utf-8")))
+        if shape is None:
+            continue
+        width, strings, weights = shape
+        offsets = array("I", [0])
+        blob = bytearray()
+        for value in strings:
+            blob += value.encode("utf-8")
+            offsets.append(len(blob))
+        weight_array = array("d", weights or ())
+        if sys.byteorder != "little":
+            offsets.byteswap()
+            weight_array.byteswap()
+        tables.append(
+            (
+                path.name.encode("utf-8"),
+                len(strings) // width,
+                width,
+                offsets.tobytes(),
+                bytes(blob),
+                weight_array.tobytes(),
+            )
+        )
+
+    directory_size = sum(
+        _NAME_LENGTH.size + len(name) + _ENTRY.size for name, *_ in tables
+    )
+    position = len(_MAGIC) + _COUNT.size + directory_size
+    directory = bytearray()
+    body = bytearray()
+    for name, rows, width, offsets, blob, weights in tables:
+        padding = -position % 4
+        body += bytes(padding)
+        position += padding
+        offsets_position = position
+        blob_position = offsets_position + len(offsets)
+        body += offsets + blob
+        position = blob_position + len(blob)
+        weights_position = 0
+        if weights:
+            padding = -position % 8
+            body += bytes(padding) + weights
+            weights_position = position + padding
+            position = weights_position + len(weights)
+        directory += _NAME_LENGTH.pack(len(name)) + name
+        directory += _ENTRY.pack(
+            rows, width, offsets_position, blob_position, weights_position
+        )
+
+    output_path.write_bytes(
+        _MAGIC + _COUNT.pack(len(tables)) + bytes(directory) + bytes(body)
+    )
+    return [name.decode("utf-8") for name, *_ in tables]
+
+
+def read_bundle(buffer: Any) -> dict[str, StringTable | RowTable]:
+    """Return lazy views over every table in a bundle buffer."""
+    view = memoryview(buffer)
+    if bytes(view[: len(_MAGIC)]) != _MAGIC:
+        raise ValueError("Not a Wordsmith asset bundle.")
+    position = len(_MAGIC)
+    (count,) = _COUNT.unpack_from(view, position)
+    position += _COUNT.size
+
+    tables: dict[str, StringTable | RowTable] = {}
+    for _ in range(count):
+        (name_length,) = _NAME_LENGTH.unpack_from(view, position)
+        position += _NAME_LENGTH.size
+        name = str(view[position : position + name_length], "utf-8")
+        position += name_length
+        rows, width, offsets_position, blob_position, weights_position = (
+            _ENTRY.unpack_from(view, position)
+        )
+        position += _ENTRY.size
+
+        offsets = _array_view(view[offsets_position:blob_position], "I")
+        weights = None
+        if weights_position:
+            weights_view = view[weights_position : weights_position + 8 * rows]
+            weights = _array_view(weights_view, "d")
+
+        if width == 1:
+            tables[name] = StringTable(
+                buffer, blob_position, offsets, rows, weights=weights
+            )
+        else:
+            tables[name] = RowTable(
+                buffer, blob_position, offsets, rows, width, weights=weights
+            )
+    return tables
+
+
+def _array_view(view: memoryview, typecode: str) -> Sequence[Any]:
+    """Read little-endian numbers in place, or a swapped copy on big-endian."""
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    swapped = array(typecode, view)
+    swapped.byteswap()
+    return swapped
+
+
+@lru_cache(maxsize=None)
+def load_bundle() -> dict[str, StringTable | RowTable]:
+    """Map the packaged bundle, or return no tables if it is not installed."""
+    from importlib import resources
+
+    entry = resources.files("wordsmith.assets").joinpath(BUNDLE_FILENAME)
+    if not entry.is_file():
+        return {}
+    if isinstance(entry, Path):
+        with entry.open("rb") as handle:
+            buffer: Any = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    else:
+        # Zipped installs have no file to map; fall back to one private copy.
+        buffer = entry.read_bytes()
+    return read_bundle(buffer)
+
+
+def main() -> None:
+    """Rebuild the packaged bundle from the JSON assets next to it."""
+    assets_dir = Path(__file__).resolve().parent.parent / "assets"
+    names = build_bundle(assets_dir, assets_dir / BUNDLE_FILENAME)
+    print(f"Bundled {len(names)} assets into {BUNDLE_FILENAME}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Casing helpers with precomputed tables and per-word memoization."""
+
+from __future__ import annotations
+
+from enum import Enum
+from functools import lru_cache
+from typing import Callable, Iterable
+
+SMALL_WORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "as",
+        "at",
+        "but",
+        "by",
+        "for",
+        "in",
+        "nor",
+        "of",
+        "on",
+        "or",
+        "per",
+        "so",
+        "the",
+        "to",
+        "up",
+        "via",
+        "vs",
+        "with",
+        "yet",
+    }
+)
+"""Words kept lowercase by :func:`title_case` unless they open or close a title."""
+
+PUNCTUATION = "\"'“”‘’()[]{}.,;:!?/"
+"""Characters :func:`title_case` keeps around a word without casing them."""
+
+WORD_CACHE_SIZE = 8192
+"""Number of distinct ``(word, position)`` casings kept by :func:`title_case`."""
+
+
+@lru_cache(maxsize=WORD_CACHE_SIZE)
+def _title_case_word(word: str, is_edge: bool) -> str:
+    core = word.strip(PUNCTUATION)
+    if not core:
+        return word
+
+    start = len(word) - len(word.lstrip(PUNCTUATION))
+    core_lower = core.lower()
+    if is_edge or core_lower not in SMALL_WORDS:
+        core_lower = core_lower.capitalize()
+    return f"{word[:start]}{core_lower}{word[start + len(core):]}"
+
+
+def title_case(text: str) -> str:
+    """Apply title casing with basic English small-word rules."""
+    words = text.split(" ")
+    last_index = len(words) - 1
+    case_word = _title_case_word
+    return " ".join(
+        [
+            case_word(word, index == 0 or index == last_index)
+            for index, word in enumerate(words)
+            if word
+        ]
+    )
+
+
+def title_case_many(texts: Iterable[str]) -> list[str]:
+    """Apply :func:`title_case` to every text, sharing the per-word cache."""
+    return [title_case(text) for text in texts]
+
+
+def first_upper(text: str) -> str:
+    """Uppercase the first alphabetic character, leaving the rest untouched."""
+    if text[:1].isalpha():
+        return text[0].upper() + text[1:]
+    for index, char in enumerate(text):
+        if char.isalpha():
+            return f"{text[:index]}{char.upper()}{text[index + 1:]}"
+    return text
+
+
+class Casing(Enum):
+    """Casing transforms that can be applied ahead of time to fixed strings."""
+
+    CAPITALIZED = "capitalized"
+    FIRST_UPPER = "first_upper"
+    TITLE = "title"
+
+    @property
+    def transform(self) -> Callable[[str], str]:
+        """Return the function that applies this casing to a string."""
+        return _CASING_TRANSFORMS[self]
+
+    def apply(self, text: str) -> str:
+        """Return ``text`` with this casing applied."""
+        return _CASING_TRANSFORMS[self](text)
+
+
+_CASING_TRANSFORMS: dict[Casing, Callable[[str], str]] = {
+    Casing.CAPITALIZED: str.title,
+    Casing.FIRST_UPPER: first_upper,
+    Casing.TITLE: title_case,
+}
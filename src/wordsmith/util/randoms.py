@@ -2,7 +2,58 @@
 
 from __future__ import annotations
 
+from enum import Enum
+import hashlib
+import os
 import random
+import threading
+
+
+class RngPolicy(Enum):
+    """Where components draw from when no RNG is passed."""
+
+    FAST = "fast"
+    """A per-thread ``random.Random`` seeded once from the OS."""
+
+    SYSTEM = "system"
+    """``random.SystemRandom``, one OS call per draw, for unpredictable output."""
+
+
+_policy = RngPolicy.FAST
+_system_rng = random.SystemRandom()
+_thread_rngs = threading.local()
+
+
+def _reset_thread_rngs() -> None:
+    # A forked child must not replay its parent's stream.
+    global _thread_rngs
+    _thread_rngs = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_thread_rngs)
+
+
+def get_default_rng_policy() -> RngPolicy:
+    """Return the current default RNG policy."""
+    return _policy
+
+
+def set_default_rng_policy(policy: RngPolicy) -> None:
+    """Choose the RNG used by components called without one."""
+    global _policy
+    _policy = RngPolicy(policy)
+
+
+def default_rng() -> random.Random:
+    """Return the RNG used when a caller does not pass one."""
+    if _policy is RngPolicy.SYSTEM:
+        return _system_rng
+    try:
+        return _thread_rngs.rng
+    except AttributeError:
+        rng = _thread_rngs.rng = random.Random()
+        return rng
 
 
 def random_bool(rng: random.Random, probability: float = 0.5) -> bool:
@@ -10,3 +61,162 @@ def random_bool(rng: random.Random, probability: float = 0.5) -> bool:
     if not 0.0 <= probability <= 1.0:
         raise ValueError("Probability must be in the range 0.0 to 1.0.")
     return rng.random() < probability
+
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+_AT_SALT = 0x5851F42D4C957F2D
+_TWO_POW_64 = 1 << 64
+
+
+def _mix64(z: int) -> int:
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def _mix_gamma(z: int) -> int:
+    # SplittableRandom's gamma mixer: odd, with enough bit transitions to
+    # keep sequences from weak gammas apart.
+    z = ((z ^ (z >> 33)) * 0xFF51AFD7ED558CCD) & _MASK64
+    z = ((z ^ (z >> 33)) * 0xC4CEB9FE1A85EC53) & _MASK64
+    z = (z ^ (z >> 33)) | 1
+    if (z ^ (z >> 1)).bit_count() < 24:
+        z ^= 0xAAAAAAAAAAAAAAAA
+    return z
+
+
+class CounterRandom(random.Random):
+    """Counter-based SplitMix64 generator with random access to its stream.
+
+    Draw ``i`` is ``mix64(seed + (i + 1) * gamma)``, so the generator can
+    ``jump`` any distance in O(1), and ``at(index)`` derives an independent
+    stream per output index: rendering output ``i`` of a seeded run with
+    ``component.make_text(rng.at(i))`` needs none of the outputs before it.
+
+    ``random()``, ``getrandbits()`` and ``_randbelow()`` are implemented here,
+    so ``choice``, ``choices``, ``randrange`` and ``shuffle`` give the same
+    results on every Python version. The generator is written in pure Python
+    and is slower per draw than ``random.Random``.
+    """
+
+    VERSION = "splitmix64-1"
+
+    def __init__(self, seed: int | str | bytes | None = None) -> None:
+        self._seed = 0
+        self._gamma = _GOLDEN_GAMMA
+        self._counter = 0
+        super().__init__(seed)
+
+    @classmethod
+    def _from_stream(cls, seed: int, gamma: int) -> CounterRandom:
+        rng = cls(seed)
+        rng._gamma = gamma
+        return rng
+
+    def seed(self, a: object = None, version: int = 2) -> None:
+        """Restart the stream from ``a``: an int, str, bytes or ``None``."""
+        if a is None:
+            value = int.from_bytes(os.urandom(8), "little")
+        elif isinstance(a, int):
+            value = a & _MASK64
+        elif isinstance(a, (str, bytes, bytearray)):
+            data = a.encode() if isinstance(a, str) else bytes(a)
+            value = int.from_bytes(
+                hashlib.blake2b(data, digest_size=8).digest(), "little"
+            )
+        else:
+            raise TypeError(
+                "CounterRandom seeds must be int, str, bytes, or None, "
+                f"not {type(a).__name__}."
+            )
+        self._seed = value
+        self._gamma = _GOLDEN_GAMMA
+        self._counter = 0
+        self.gauss_next = None
+
+    @property
+    def counter(self) -> int:
+        """Number of 64-bit draws taken from the stream so far."""
+        return self._counter
+
+    def _next64(self) -> int:
+        self._counter += 1
+        return _mix64((self._seed + self._counter * self._gamma) & _MASK64)
+
+    def random(self) -> float:
+        return (self._next64() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("Number of bits must be non-negative.")
+        if k == 0:
+            return 0
+        if k <= 64:
+            return self._next64() >> (64 - k)
+        words = (k + 63) // 64
+        value = 0
+        for _ in range(words):
+            value = (value << 64) | self._next64()
+        return value >> (words * 64 - k)
+
+    def _randbelow(self, n: int) -> int:  # type: ignore[override]
+        if n <= 0:
+            raise ValueError("Upper bound must be positive.")
+        if n > _TWO_POW_64:
+            bits = n.bit_length()
+            value = self.getrandbits(bits)
+            while value >= n:
+                value = self.getrandbits(bits)
+            return value
+        # Lemire's multiply-and-shift: one draw unless it lands in the bias zone.
+        product = self._next64() * n
+        low = product & _MASK64
+        if low < n:
+            threshold = (_TWO_POW_64 - n) % n
+            while low < threshold:
+                product = self._next64() * n
+                low = product & _MASK64
+        return product >> 64
+
+    def getstate(self) -> tuple[object, ...]:
+        return (self.VERSION, self._seed, self._gamma, self._counter, self.gauss_next)
+
+    def setstate(self, state: tuple[object, ...]) -> None:
+        version, seed, gamma, counter, gauss_next = state
+        if version != self.VERSION:
+            raise ValueError(f"State is from {version!r}, not {self.VERSION!r}.")
+        self._seed = int(seed)  # type: ignore[call-overload]
+        self._gamma = int(gamma)  # type: ignore[call-overload]
+        self._counter = int(counter)  # type: ignore[call-overload]
+        self.gauss_next = gauss_next
+
+    def jump(self, n: int) -> None:
+        """Skip ``n`` 64-bit draws in O(1)."""
+        if n < 0:
+            raise ValueError("Cannot jump backwards.")
+        self._counter += n
+
+    def spawn(self, k: int) -> list[CounterRandom]:
+        """Split off ``k`` independent child generators.
+
+        Each child takes two draws from this generator for its own seed and
+        gamma, so spawning is reproducible and advances this stream.
+        """
+        if k < 0:
+            raise ValueError("Number of children must be non-negative.")
+        return [
+            CounterRandom._from_stream(self._next64(), _mix_gamma(self._next64()))
+            for _ in range(k)
+        ]
+
+    def at(self, index: int) -> CounterRandom:
+        """Return the independent stream for output ``index`` of this seed.
+
+        The result depends only on this generator's seed and gamma and on
+        ``index``, never on how far this generator has been drawn.
+        """
+        if index < 0:
+            raise ValueError("Index must be non-negative.")
+        base = ((self._seed ^ _AT_SALT) + (index + 1) * self._gamma) & _MASK64
+        return CounterRandom._from_stream(_mix64(base), _mix_gamma(base))
@@ -4,13 +4,64 @@ from __future__ import annotations
 
 from functools import lru_cache
 import json
-from importlib import resources
-from typing import Any
+from typing import Any, Generic, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class WeightedList(tuple[Any, ...]):
+    """List entries that carry one frequency weight each, in ``weights``.
+
+    Weighted list assets store each entry followed by its weight, such as
+    ``[["apple", 8], ["banana", 2]]``, or ``[base, past, ..., weight]`` for
+    rows. Loading one gives the entries without the weights, so it reads like
+    the plain list, and ``WordList(weighted=True)`` draws by ``weights``.
+    """
+
+    weights: tuple[float, ...]
+
+    def __new__(cls, entries: Iterable[Any], weights: Iterable[float]) -> WeightedList:
+        self = super().__new__(cls, entries)
+        self.weights = tuple(float(weight) for weight in weights)
+        if len(self.weights) != len(self):
+            raise ValueError("WeightedList needs one weight per entry.")
+        return self
+
+    def __reduce__(self) -> tuple[type[WeightedList], tuple[tuple[Any, ...], ...]]:
+        return type(self), (tuple(self), self.weights)
+
+
+def weighted_rows(value: Any) -> tuple[list[Any], list[float]] | None:
+    """Split a weighted list asset into entries and weights.
+
+    Returns ``None`` unless every item is a row of strings ending in a number.
+    Rows of one string and a weight become plain string entries.
+    """
+    if not isinstance(value, list) or not value:
+        return None
+    width = len(value[0]) if isinstance(value[0], list) else 0
+    if width < 2:
+        return None
+    entries: list[Any] = []
+    weights: list[float] = []
+    for row in value:
+        if not isinstance(row, list) or len(row) != width:
+            return None
+        *strings, weight = row
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)):
+            return None
+        if not all(isinstance(item, str) for item in strings):
+            return None
+        entries.append(strings[0] if width == 2 else strings)
+        weights.append(float(weight))
+    return entries, weights
 
 
 @lru_cache(maxsize=None)
 def load_json(filename: str) -> Any:
     """Load a JSON asset from the wordsmith package."""
+    from importlib import resources
+
     try:
         payload = (
             resources.files("wordsmith.assets")
@@ -20,3 +71,59 @@ def load_json(filename: str) -> Any:
     except FileNotFoundError:
         return []
     return json.loads(payload)
+
+
+def load_asset(filename: str) -> Any:
+    """Load an asset, preferring the memory-mapped bundle over JSON.
+
+    List-shaped assets come back as read-only sequences that decode entries on
+    access; anything missing from the bundle is parsed from JSON. Weighted
+    list assets load as their entries, with the weights in ``weights``.
+    """
+    from wordsmith.util.bundle import load_bundle
+
+    table = load_bundle().get(filename)
+    if table is not None:
+        return table
+    value = load_json(filename)
+    split = weighted_rows(value)
+    return value if split is None else WeightedList(*split)
+
+
+class LazyAsset(Generic[T]):
+    """Class attribute that loads an asset the first time it is read.
+
+    On first access the loaded value replaces the descriptor on the class that
+    declared it, so later reads are plain attribute lookups. Declare it without
+    an annotation inside dataclasses, which read annotated class attributes
+    while building the class::
+
+        _options = LazyAsset[list[str]]("Nouns.json")
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self._owner: type | None = None
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._owner = owner
+        self._name = name
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> T:
+        value = load_asset(self.filename)
+        if self._owner is not None:
+            setattr(self._owner, self._name, value)
+        return value
+
+
+def preload() -> None:
+    """Load every bundled asset now instead of on first render.
+
+    Useful for servers that want to warm up before forking worker processes.
+    """
+    from importlib import resources
+
+    for entry in resources.files("wordsmith.assets").iterdir():
+        if entry.name.endswith(".json"):
+            load_asset(entry.name)
@@ -0,0 +1,181 @@
+"""Precomputed weighted index samplers."""
+
+from __future__ import annotations
+
+import abc
+from bisect import bisect
+from enum import Enum
+from itertools import accumulate
+import random
+from typing import Sequence
+
+
+class SamplerPolicy(Enum):
+    """How weighted choices that do not pin a stream draw their options."""
+
+    ALIAS = "alias"
+    """Alias tables: one ``random()`` and O(1) work per draw."""
+
+    LEGACY = "legacy"
+    """Cumulative tables that consume the RNG exactly like ``rng.choices``,
+    reproducing seeded output recorded before samplers existed."""
+
+
+_policy = SamplerPolicy.ALIAS
+
+
+def get_default_sampler_policy() -> SamplerPolicy:
+    """Return the current default sampler policy."""
+    return _policy
+
+
+def set_default_sampler_policy(policy: SamplerPolicy) -> None:
+    """Choose how weighted choices without ``legacy_stream`` set draw."""
+    global _policy
+    _policy = SamplerPolicy(policy)
+
+
+def _validate_weights(weights: Sequence[float]) -> None:
+    if not weights:
+        raise ValueError("Sampler requires at least one weight.")
+    if any(weight < 0.0 for weight in weights):
+        raise ValueError("Sampler requires non-negative weights.")
+    if not any(weight > 0.0 for weight in weights):
+        raise ValueError("Sampler requires at least one positive weight.")
+
+
+class WeightedSampler(abc.ABC):
+    """Draw indices in proportion to a fixed list of weights."""
+
+    @abc.abstractmethod
+    def sample(self, rng: random.Random) -> int:
+        """Return one weighted index."""
+
+    @abc.abstractmethod
+    def sample_many(self, rng: random.Random, n: int) -> list[int]:
+        """Return ``n`` weighted indices."""
+
+
+class CumulativeSampler(WeightedSampler):
+    """Bisect over precomputed cumulative weights in O(log n) per draw.
+
+    Draws consume the RNG exactly like ``rng.choices(population, weights)``,
+    so this sampler reproduces streams recorded before samplers existed.
+    """
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        _validate_weights(weights)
+        self._cum_weights = list(accumulate(weights))
+        self._total = self._cum_weights[-1] + 0.0
+        self._hi = len(self._cum_weights) - 1
+
+    def sample(self, rng: random.Random) -> int:
+        return bisect(self._cum_weights, rng.random() * self._total, 0, self._hi)
+
+    def sample_many(self, rng: random.Random, n: int) -> list[int]:
+        cum_weights = self._cum_weights
+        total = self._total
+        hi = self._hi
+        random_ = rng.random
+        return [bisect(cum_weights, random_() * total, 0, hi) for _ in range(n)]
+
+
+class AliasSampler(WeightedSampler):
+    """Walker/Vose alias tables for O(1) draws using one ``random()`` each.
+
+    Tables are built with exact rational arithmetic, so options with zero
+    weight can never be drawn.
+    """
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        from fractions import Fraction
+
+        _validate_weights(weights)
+        size = len(weights)
+        total = sum(Fraction(weight) for weight in weights)
+        scaled = [Fraction(weight) * size / total for weight in weights]
+
+        probability = [1.0] * size
+        alias = list(range(size))
+        small = [index for index, value in enumerate(scaled) if value < 1]
+        large = [index for index, value in enumerate(scaled) if value >= 1]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            probability[less] = float(scaled[less])
+            alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1
+            if scaled[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+
+        self._size = size
+        self._probability = probability
+        self._alias = alias
+
+    def sample(self, rng: random.Random) -> int:
+        scaled = rng.random() * self._size
+        index = int(scaled)
+        if index == self._size:
+            index -= 1
+        if scaled - index < self._probability[index]:
+            return index
+        return self._alias[index]
+
+    def sample_many(self, rng: random.Random, n: int) -> list[int]:
+        size = self._size
+        probability = self._probability
+        alias = self._alias
+        random_ = rng.random
+        indices = []
+        for _ in range(n):
+            scaled = random_() * size
+            index = int(scaled)
+            if index == size:
+                index -= 1
+            indices.append(
+                index if scaled - index < probability[index] else alias[index]
+            )
+        return indices
+
+
+class PolicySampler(WeightedSampler):
+    """Follow the default sampler policy at draw time.
+
+    Both tables are built up front, so switching the policy takes effect for
+    trees and compiled renderers that already exist.
+    """
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        self._alias = AliasSampler(weights)
+        self._legacy = CumulativeSampler(weights)
+
+    def sample(self, rng: random.Random) -> int:
+        if _policy is SamplerPolicy.LEGACY:
+            return self._legacy.sample(rng)
+        return self._alias.sample(rng)
+
+    def sample_many(self, rng: random.Random, n: int) -> list[int]:
+        if _policy is SamplerPolicy.LEGACY:
+            return self._legacy.sample_many(rng, n)
+        return self._alias.sample_many(rng, n)
+
+
+def make_sampler(
+    weights: Sequence[float],
+    legacy_stream: bool | None = None,
+) -> WeightedSampler:
+    """Build the sampler for ``weights``.
+
+    Pass ``legacy_stream=True`` to keep the ``rng.choices`` consumption
+    pattern, at O(log n) per draw, or ``False`` for alias tables. By default
+    the sampler follows ``set_default_sampler_policy``, which uses alias
+    tables unless set to ``SamplerPolicy.LEGACY``.
+    """
+    if legacy_stream is None:
+        return PolicySampler(weights)
+    if legacy_stream:
+        return CumulativeSampler(weights)
+    return AliasSampler(weights)
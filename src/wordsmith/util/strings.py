@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+# Casing moved to ``wordsmith.util.casing``; these names stay importable here.
+from .casing import first_upper as first_upper
+from .casing import title_case as title_case
+
 VOWELS = {"a", "e", "i", "o", "u"}
 
 
@@ -28,71 +32,31 @@ def starts_with_vowel(text: str) -> bool:
     return word[0] in VOWELS
 
 
-def first_upper(text: str) -> str:
-    """Uppercase the first alphabetic character, leaving the rest untouched."""
-    for index, char in enumerate(text):
-        if char.isalpha():
-            return f"{text[:index]}{char.upper()}{text[index + 1:]}"
-    return text
-
-
-def title_case(text: str) -> str:
-    """Apply title casing with basic English small-word rules."""
-    small_words = {
-        "a",
-        "an",
-        "and",
-        "as",
-        "at",
-        "but",
-        "by",
-        "for",
-        "in",
-        "nor",
-        "of",
-        "on",
-        "or",
-        "per",
-        "so",
-        "the",
-        "to",
-        "up",
-        "via",
-        "vs",
-        "with",
-        "yet",
-    }
-    punctuation = "\"'“”‘’()[]{}.,;:!?/"
-
-    words = text.split(" ")
-    last_index = len(words) - 1
-    result: list[str] = []
-
-    for index, word in enumerate(words):
-        if word == "":
-            continue
-
-        leading = ""
-        trailing = ""
-        core = word
-
-        while core and core[0] in punctuation:
-            leading += core[0]
-            core = core[1:]
-        while core and core[-1] in punctuation:
-            trailing = core[-1] + trailing
-            core = core[:-1]
-
-        if not core:
-            result.append(word)
-            continue
-
-        core_lower = core.lower()
-        if index not in {0, last_index} and core_lower in small_words:
-            core_cased = core_lower
-        else:
-            core_cased = core_lower.capitalize()
-
-        result.append(f"{leading}{core_cased}{trailing}")
-
-    return " ".join(result)
+IRREGULAR_PLURALS = {
+    "human": "humans",
+    "lowlife": "lowlifes",
+    "thief": "thieves",
+}
+"""Plurals that the suffix rules in :func:`pluralize` get wrong."""
+
+
+def pluralize(word: str) -> str:
+    """Return the plural of an English noun using suffix rules and irregulars."""
+    irregular = IRREGULAR_PLURALS.get(word)
+    if irregular is not None:
+        return irregular
+    if word.endswith(("ay", "ey", "iy", "oy", "uy")):
+        return word + "s"
+    if word.endswith("y"):
+        return f"{word[:-1]}ies"
+    if word.endswith(("x", "ss", "sh", "ch")):
+        return word + "es"
+    if word.endswith("ife"):
+        return f"{word[:-2]}ves"
+    if word.endswith("rf"):
+        return f"{word[:-1]}ves"
+    if word.endswith("man"):
+        return f"{word[:-2]}en"
+    if word.endswith("s"):
+        return word
+    return word + "s"
@@ -0,0 +1,282 @@
+"""Optional NumPy backend that renders large batches with array operations.
+
+Word leaves draw whole index arrays from a ``numpy.random.Generator``,
+choices route rows with one vectorized draw, and ``Text`` joins its parts
+with ``numpy.strings``. Output follows the same distribution as
+``make_text`` but is a different stream from the pure-Python renderers,
+which stay the default.
+
+Requires NumPy 2, available as the ``numpy`` extra::
+
+    pip install "wordsmith-engine[numpy]"
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+import random
+from typing import Any, Callable, Sequence
+
+try:
+    import numpy as np
+    from numpy.dtypes import StringDType
+except ImportError as error:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "wordsmith.vectorized requires NumPy 2; install wordsmith-engine[numpy]."
+    ) from error
+
+from wordsmith.analysis import _choices
+from wordsmith.core.base import Component, GrammarComponent
+from wordsmith.core.components import (
+    Capitalized,
+    CoinFlips,
+    Empty,
+    FirstUppercased,
+    Literal,
+    LiteralChoice,
+    OneOf,
+    PossessiveForm,
+    PrefixedByArticle,
+    PrefixedByDeterminer,
+    Text,
+    TitleCased,
+)
+from wordsmith.core.optimizer import optimize
+from wordsmith.names.gender import BinaryGender
+from wordsmith.names.given_name import GivenName
+from wordsmith.util.casing import first_upper, title_case
+from wordsmith.util.strings import starts_with_vowel
+from wordsmith.words.articles import Article, Determiner
+from wordsmith.words.base import WordList
+
+_STRING = StringDType()
+
+SMALL_BATCH = 256
+"""Branches routed fewer rows than this render through ``make_many``, where
+per-call array overhead would outweigh the vectorized draw."""
+
+StringArray = Any
+"""A one-dimensional NumPy array with ``StringDType`` elements."""
+
+
+def render_array(
+    component: Component,
+    n: int,
+    rng: np.random.Generator | int | None = None,
+) -> StringArray:
+    """Render ``n`` texts into a NumPy string array.
+
+    ``rng`` is a ``numpy.random.Generator`` or a seed for one. The tree is
+    optimized first, so casing is applied to word tables once, and components
+    without a tree (such as ``AncientName``) render their rows through
+    ``make_many`` seeded from the generator. Call ``.tolist()`` on the result
+    for a list of ``str``.
+    """
+    if n < 0:
+        raise ValueError("Batch size must be non-negative.")
+    generator = rng if isinstance(rng, np.random.Generator) else (
+        np.random.default_rng(rng)
+    )
+    return _render(_optimized(component), n, generator)
+
+
+@lru_cache(maxsize=256)
+def _optimized(component: Component) -> Component:
+    return optimize(component)
+
+
+@lru_cache(maxsize=None)
+def _table(values: tuple[str, ...]) -> StringArray:
+    return np.array(values, dtype=_STRING)
+
+
+@lru_cache(maxsize=None)
+def _word_list_tables(component: WordList) -> tuple[StringArray, Any, Any]:
+    return (
+        _table(tuple(component.word_table())),
+        np.array(component.vowel_index(), dtype=bool),
+        _probabilities(component.word_weights()),
+    )
+
+
+def _probabilities(weights: Sequence[float] | None) -> Any:
+    if weights is None:
+        return None
+    array = np.asarray(weights, dtype=float)
+    return array / array.sum()
+
+
+Leaf = tuple[StringArray, Any]
+"""A word table and its draw probabilities, or ``None`` for uniform draws."""
+
+
+def _leaf_groups(component: Component) -> list[tuple[float, Leaf]] | None:
+    """Return ``(probability, leaf)`` groups for leaves drawn from tables."""
+    if isinstance(component, WordList):
+        table, _, probabilities = _word_list_tables(component)
+        return [(1.0, (table, probabilities))]
+    if isinstance(component, LiteralChoice):
+        return [(1.0, (_table(component.values), None))]
+    if isinstance(component, GivenName):
+        genders = (
+            [component.gender]
+            if component.gender is not None
+            else [BinaryGender.MALE, BinaryGender.FEMALE]
+        )
+        groups: list[tuple[float, Leaf]] = []
+        for gender in genders:
+            table, _, probabilities = _word_list_tables(component._names(gender))
+            groups.append((1.0 / len(genders), (table, probabilities)))
+        return groups
+    return None
+
+
+def _draw(leaf: Leaf, n: int, rng: np.random.Generator) -> Any:
+    """Return ``n`` indexes into the leaf's table."""
+    table, probabilities = leaf
+    if probabilities is None:
+        return rng.integers(0, len(table), size=n)
+    return rng.choice(len(table), size=n, p=probabilities)
+
+
+def _render(node: Component, n: int, rng: np.random.Generator) -> StringArray:
+    if n == 0:
+        return np.empty(0, dtype=_STRING)
+    if n < SMALL_BATCH and not isinstance(node, (Literal, Empty)):
+        return _render_python(node, n, rng)
+    if isinstance(node, GrammarComponent):
+        # Only recursive grammars survive optimization.
+        return _render(_optimized(node.grammar()), n, rng)
+    if isinstance(node, Literal):
+        return np.full(n, node.text, dtype=_STRING)
+    if isinstance(node, Empty):
+        return np.full(n, "", dtype=_STRING)
+
+    groups = _leaf_groups(node)
+    if groups is not None:
+        if len(groups) == 1:
+            leaf = groups[0][1]
+            return leaf[0][_draw(leaf, n, rng)]
+        return _route(
+            rng,
+            n,
+            [probability for probability, _ in groups],
+            [
+                lambda count, leaf=leaf: leaf[0][_draw(leaf, count, rng)]
+                for _, leaf in groups
+            ],
+        )
+
+    if isinstance(node, Text):
+        if not node.parts:
+            return np.full(n, "", dtype=_STRING)
+        return _join([_render(part, n, rng) for part in node.parts], node.sep)
+
+    choices = _choices(node)
+    if choices is not None:
+        uniform = isinstance(node, (OneOf, CoinFlips))
+        return _route(
+            rng,
+            n,
+            None if uniform else [probability for probability, _ in choices],
+            [
+                lambda count, option=option: _render(option, count, rng)
+                for _, option in choices
+            ],
+        )
+
+    if isinstance(node, Capitalized):
+        return np.strings.title(_render(node.wrapped, n, rng))
+    if isinstance(node, FirstUppercased):
+        return _first_upper(_render(node.wrapped, n, rng))
+    if isinstance(node, TitleCased):
+        return _map(title_case, _render(node.wrapped, n, rng))
+    if isinstance(node, PossessiveForm):
+        texts = _render(node.wrapped, n, rng)
+        return np.strings.add(
+            texts, np.where(np.strings.endswith(texts, "s"), "'", "'s")
+        )
+    if isinstance(node, PrefixedByArticle):
+        return _prefixed(node.wrapped, Article._options, n, rng)
+    if isinstance(node, PrefixedByDeterminer):
+        return _prefixed(node.wrapped, Determiner._options, n, rng)
+
+    return _render_python(node, n, rng)
+
+
+def _render_python(node: Component, n: int, rng: np.random.Generator) -> StringArray:
+    seed = int(rng.integers(0, 2**63))
+    return np.array(node.make_many(random.Random(seed), n), dtype=_STRING)
+
+
+def _route(
+    rng: np.random.Generator,
+    n: int,
+    probabilities: Sequence[float] | None,
+    branches: Sequence[Callable[[int], StringArray]],
+) -> StringArray:
+    """Draw a branch per row and fill each branch's rows in one call."""
+    if probabilities is None:
+        picks = rng.integers(0, len(branches), size=n)
+    else:
+        weights = np.asarray(probabilities, dtype=float)
+        picks = rng.choice(len(branches), size=n, p=weights / weights.sum())
+
+    order = np.argsort(picks, kind="stable")
+    counts = np.bincount(picks, minlength=len(branches))
+    bounds = np.concatenate(([0], np.cumsum(counts)))
+    out = np.empty(n, dtype=_STRING)
+    for branch, start, stop in zip(branches, bounds[:-1], bounds[1:]):
+        if stop > start:
+            out[order[start:stop]] = branch(int(stop - start))
+    return out
+
+
+def _join(parts: list[StringArray], sep: str) -> StringArray:
+    """Join part columns with ``sep``, skipping empty parts like ``Text``."""
+    joined = parts[0]
+    for part in parts[1:]:
+        if sep:
+            needs_sep = (joined != "") & (part != "")
+            seps = np.where(needs_sep, sep, "").astype(_STRING)
+            joined = np.strings.add(joined, seps)
+        joined = np.strings.add(joined, part)
+    return joined
+
+
+def _first_upper(texts: StringArray) -> StringArray:
+    first = np.strings.slice(texts, 0, 1)
+    cased = np.where(
+        np.strings.isalpha(first),
+        np.strings.add(np.strings.upper(first), np.strings.slice(texts, 1, None)),
+        texts,
+    )
+    # Rows that start with punctuation or a digit take the slow, exact path.
+    rest = np.flatnonzero((first != "") & ~np.strings.isalpha(first))
+    if rest.size:
+        cased[rest] = _map(first_upper, texts[rest])
+    return cased
+
+
+def _prefixed(
+    wrapped: Component,
+    options: tuple[str, ...],
+    n: int,
+    rng: np.random.Generator,
+) -> StringArray:
+    if isinstance(wrapped, WordList):
+        table, vowels, probabilities = _word_list_tables(wrapped)
+        picks = _draw((table, probabilities), n, rng)
+        texts, before_vowel = table[picks], vowels[picks]
+    else:
+        texts = _render(wrapped, n, rng)
+        before_vowel = np.array([starts_with_vowel(text) for text in texts.tolist()])
+    chosen = rng.integers(0, len(options), size=n)
+    prefixes = _table(options)[chosen]
+    if "a" in options:
+        prefixes[(chosen == options.index("a")) & before_vowel] = "an"
+    return np.strings.add(np.strings.add(prefixes, " "), texts)
+
+
+def _map(transform: Callable[[str], str], texts: StringArray) -> StringArray:
+    return np.array([transform(text) for text in texts.tolist()], dtype=_STRING)
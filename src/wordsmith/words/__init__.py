@@ -4,12 +4,14 @@ from .articles import Article, Determiner
 from .base import (
     Adjective,
     Adverb,
+    CasedWordList,
     ChemicalCompoundName,
     LocationAdjective,
     MartialSocialConcept,
     NauticalShipNameColor,
     NauticalShipNameObject,
     Noun,
+    PluralizableWordList,
     PrimitiveWeapon,
     Pronoun,
     ShipNameAdjective,
@@ -18,12 +20,14 @@ from .base import (
     Verb,
     VerbTense,
     VillainousPersonNoun,
+    WordList,
 )
 
 __all__ = [
     "Adjective",
     "Adverb",
     "Article",
+    "CasedWordList",
     "ChemicalCompoundName",
     "Determiner",
     "LocationAdjective",
@@ -31,6 +35,7 @@ __all__ = [
     "NauticalShipNameColor",
     "NauticalShipNameObject",
     "Noun",
+    "PluralizableWordList",
     "PrimitiveWeapon",
     "Pronoun",
     "ShipNameAdjective",
@@ -39,4 +44,5 @@ __all__ = [
     "Verb",
     "VerbTense",
     "VillainousPersonNoun",
+    "WordList",
 ]
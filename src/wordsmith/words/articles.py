@@ -4,31 +4,59 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import random
+from typing import Callable, ClassVar
 
-from wordsmith.core.base import Component
+from wordsmith.core.base import Component, Renderer
 
 
 @dataclass(frozen=True)
-class Article(Component):
-    """Choose between "a"/"an" and "the" based on context."""
+class _VowelAwareChoice(Component):
+    """Pick from a fixed list, turning "a" into "an" before a vowel sound."""
 
     is_before_vowel: bool = False
 
+    _options: ClassVar[tuple[str, ...]] = ()
+
+    def _vowel_options(self) -> tuple[str, ...]:
+        if not self.is_before_vowel:
+            return self._options
+        return tuple("an" if value == "a" else value for value in self._options)
+
     def make_text(self, rng: random.Random) -> str:
-        value = rng.choice(["a", "the"])
+        value = rng.choice(self._options)
         if value == "a" and self.is_before_vowel:
             value = "an"
         return value
 
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        return rng.choices(self._vowel_options(), k=n)
+
+    def _compile(self, compile_child: Callable[[Component], Renderer]) -> Renderer:
+        values = self._vowel_options()
+
+        def render(rng: random.Random) -> str:
+            return rng.choice(values)
+
+        return render
+
 
 @dataclass(frozen=True)
-class Determiner(Component):
-    """Choose a determiner, with vowel-aware "a"/"an" handling."""
+class Article(_VowelAwareChoice):
+    """Choose between "a"/"an" and "the" based on context."""
 
-    is_before_vowel: bool = False
+    _options: ClassVar[tuple[str, ...]] = ("a", "the")
 
-    def make_text(self, rng: random.Random) -> str:
-        value = rng.choice(["a", "the", "my", "your", "our", "her", "his"])
-        if value == "a" and self.is_before_vowel:
-            value = "an"
-        return value
+
+@dataclass(frozen=True)
+class Determiner(_VowelAwareChoice):
+    """Choose a determiner, with vowel-aware "a"/"an" handling."""
+
+    _options: ClassVar[tuple[str, ...]] = (
+        "a",
+        "the",
+        "my",
+        "your",
+        "our",
+        "her",
+        "his",
+    )
@@ -2,66 +2,203 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 import random
-from typing import ClassVar
+from typing import Callable, ClassVar, Sequence
 
-from wordsmith.core.base import Component
-from wordsmith.util import load_json
+from wordsmith.core.base import Component, Renderer
+from wordsmith.util import Casing, LazyAsset, pluralize, starts_with_vowel
+from wordsmith.util.bundle import RowTable
+from wordsmith.util.samplers import AliasSampler
 
 
 @dataclass(frozen=True)
-class Adjective(Component):
-    """Random adjective from the asset list."""
+class WordList(Component):
+    """Base class for components that pick a random entry from a word list.
+
+    ``make_text`` must draw like ``rng.choice(self.word_table())``, or through
+    ``weight_sampler()`` when it returns one; compiled, batched and pre-cased
+    renderers rely on it.
+
+    With ``weighted=True`` entries are drawn in proportion to the per-entry
+    weights that ``_options`` carries when it is a ``WeightedList`` or a
+    weighted asset. Asking for weights from a list without them raises
+    ``ValueError``.
+    """
+
+    weighted: bool = field(default=False, kw_only=True)
+
+    _options: ClassVar[Sequence[str]] = ()
+
+    def __post_init__(self) -> None:
+        if self.weighted:
+            self.word_weights()
 
-    _options: ClassVar[list[str]] = load_json("Adjectives.json")
+    def word_table(self) -> Sequence[str]:
+        """Return the rendered words this component picks from, in draw order."""
+        return _cached_word_table(self)
+
+    def _build_word_table(self) -> Sequence[str]:
+        return self._options
+
+    def word_weights(self) -> Sequence[float] | None:
+        """Return weights parallel to ``word_table()``, or ``None`` if uniform."""
+        return _cached_word_weights(self) if self.weighted else None
+
+    def _build_word_weights(self) -> Sequence[float] | None:
+        weights = getattr(self._options, "weights", None)
+        if weights is None:
+            raise ValueError(
+                f"{type(self).__name__} has no frequency weights to draw by."
+            )
+        return tuple(weights)
+
+    def weight_sampler(self) -> AliasSampler | None:
+        """Return the alias table for weighted draws, or ``None`` if uniform."""
+        return _cached_weight_sampler(self) if self.weighted else None
+
+    def vowel_index(self) -> Sequence[bool]:
+        """Return whether each ``word_table()`` entry starts with a vowel sound."""
+        return _cached_vowel_index(self)
 
     def make_text(self, rng: random.Random) -> str:
+        if self.weighted:
+            return _weighted_choice(self, rng)
         return rng.choice(self._options)
 
+    def _make_many(self, rng: random.Random, n: int) -> list[str]:
+        table = self.word_table()
+        sampler = self.weight_sampler()
+        if sampler is not None:
+            return [table[index] for index in sampler.sample_many(rng, n)]
+        return rng.choices(table, k=n)
+
+    def _compile(self, compile_child: Callable[[Component], Renderer]) -> Renderer:
+        table = self.word_table()
+        sampler = self.weight_sampler()
+
+        if sampler is not None:
+            sample = sampler.sample
+
+            def render_weighted(rng: random.Random) -> str:
+                return table[sample(rng)]
+
+            return render_weighted
+
+        def render(rng: random.Random) -> str:
+            return rng.choice(table)
+
+        return render
+
+
+@lru_cache(maxsize=None)
+def _cached_word_table(component: WordList) -> Sequence[str]:
+    return component._build_word_table()
+
+
+@lru_cache(maxsize=None)
+def _cached_word_weights(component: WordList) -> Sequence[float] | None:
+    return component._build_word_weights()
+
+
+@lru_cache(maxsize=None)
+def _cached_weight_sampler(component: WordList) -> AliasSampler | None:
+    weights = component.word_weights()
+    return AliasSampler(weights) if weights is not None else None
+
+
+def _weighted_choice(component: WordList, rng: random.Random) -> str:
+    """Draw one ``word_table()`` entry for a component with ``weighted=True``."""
+    sampler = _cached_weight_sampler(component)
+    if sampler is None:
+        return rng.choice(component.word_table())
+    return component.word_table()[sampler.sample(rng)]
+
 
 @dataclass(frozen=True)
-class Adverb(Component):
-    """Random adverb from the asset list."""
+class CasedWordList(WordList):
+    """A word list whose table is cased once, ahead of rendering.
+
+    Draws consume the RNG exactly like ``source``, so it can stand in for a
+    casing wrapper around ``source``.
+    """
+
+    source: WordList
+    casing: Casing
 
-    _options: ClassVar[list[str]] = load_json("Adverbs.json")
+    def _build_word_table(self) -> Sequence[str]:
+        return tuple(self.casing.apply(word) for word in self.source.word_table())
+
+    def _build_word_weights(self) -> Sequence[float] | None:
+        return self.source._build_word_weights()
 
     def make_text(self, rng: random.Random) -> str:
-        return rng.choice(self._options)
+        if self.weighted:
+            return _weighted_choice(self, rng)
+        return rng.choice(self.word_table())
+
+
+@lru_cache(maxsize=None)
+def _cached_vowel_index(component: WordList) -> tuple[bool, ...]:
+    return tuple(starts_with_vowel(word) for word in component.word_table())
 
 
 @dataclass(frozen=True)
-class Noun(Component):
-    """Random noun with optional pluralization."""
+class PluralizableWordList(WordList):
+    """Word list that can draw its entries in plural form.
+
+    Plurals are computed once per list into a table parallel to ``_options``,
+    so the same draw index picks the singular or the plural.
+    """
 
     is_plural: bool = False
 
-    _options: ClassVar[list[str]] = load_json("Nouns.json")
+    def plural_table(self) -> Sequence[str]:
+        """Return the plural of every option, in option order."""
+        return _cached_plurals(type(self))[0]
+
+    def _build_word_table(self) -> Sequence[str]:
+        return self.plural_table() if self.is_plural else self._options
 
     def make_text(self, rng: random.Random) -> str:
+        if self.weighted:
+            return _weighted_choice(self, rng)
         value = rng.choice(self._options)
+        if not self.is_plural:
+            return value
+        plural = _cached_plurals(type(self))[1].get(value)
+        return plural if plural is not None else pluralize(value)
+
+
+@lru_cache(maxsize=None)
+def _cached_plurals(
+    cls: type[PluralizableWordList],
+) -> tuple[tuple[str, ...], dict[str, str]]:
+    table = tuple(pluralize(value) for value in cls._options)
+    return table, dict(zip(cls._options, table))
+
+
+@dataclass(frozen=True)
+class Adjective(WordList):
+    """Random adjective from the asset list."""
+
+    _options = LazyAsset[list[str]]("Adjectives.json")
+
+
+@dataclass(frozen=True)
+class Adverb(WordList):
+    """Random adverb from the asset list."""
+
+    _options = LazyAsset[list[str]]("Adverbs.json")
+
+
+@dataclass(frozen=True)
+class Noun(PluralizableWordList):
+    """Random noun with optional pluralization."""
 
-        if self.is_plural:
-            if value.endswith(("ay", "ey", "iy", "oy", "uy")):
-                value += "s"
-            elif value.endswith("y"):
-                value = f"{value[:-1]}ies"
-            elif value.endswith(("x", "ss", "sh", "ch")):
-                value += "es"
-            elif value.endswith("ife"):
-                value = f"{value[:-2]}ves"
-            elif value.endswith("rf"):
-                value = f"{value[:-1]}ves"
-            elif value.endswith("man"):
-                if value == "human":
-                    value = "humans"
-                else:
-                    value = f"{value[:-2]}en"
-            elif not value.endswith("s"):
-                value += "s"
-
-        return value
+    _options = LazyAsset[list[str]]("Nouns.json")
 
 
 class VerbTense(Enum):
@@ -75,14 +212,21 @@ class VerbTense(Enum):
 
 
 @dataclass(frozen=True)
-class Verb(Component):
+class Verb(WordList):
     """Random verb in the requested tense."""
 
     tense: VerbTense = VerbTense.BASE
 
-    _options: ClassVar[list[list[str]]] = load_json("Verbs.json")
+    _options = LazyAsset[list[list[str]]]("Verbs.json")
+
+    def _build_word_table(self) -> Sequence[str]:
+        if isinstance(self._options, RowTable):
+            return self._options.column(self.tense.value)
+        return tuple(verb_row[self.tense.value] for verb_row in self._options)
 
     def make_text(self, rng: random.Random) -> str:
+        if self.weighted:
+            return _weighted_choice(self, rng)
         verb_row = rng.choice(self._options)
         return verb_row[self.tense.value]
 
@@ -104,19 +248,36 @@ class Pronoun(Component):
             return rng.choice(["I", "you"])
         return rng.choice(["we", "you"])
 
+    def _compile(self, compile_child: Callable[[Component], Renderer]) -> Renderer:
+        if self.is_third_person and not self.is_singular:
+
+            def render_they(rng: random.Random) -> str:
+                return "they"
+
+            return render_they
+
+        if self.is_third_person:
+            values: tuple[str, ...] = ("he", "she", "it")
+        elif self.is_singular:
+            values = ("I", "you")
+        else:
+            values = ("we", "you")
+
+        def render(rng: random.Random) -> str:
+            return rng.choice(values)
+
+        return render
+
 
 @dataclass(frozen=True)
-class ChemicalCompoundName(Component):
+class ChemicalCompoundName(WordList):
     """Random chemical compound name."""
 
-    _options: ClassVar[list[str]] = load_json("Chemical Compound Names.json")
-
-    def make_text(self, rng: random.Random) -> str:
-        return rng.choice(self._options)
+    _options = LazyAsset[list[str]]("Chemical Compound Names.json")
 
 
 @dataclass(frozen=True)
-class LocationAdjective(Component):
+class LocationAdjective(WordList):
     """Random location adjective."""
 
     _options: ClassVar[list[str]] = [
@@ -168,12 +329,9 @@ class LocationAdjective(Component):
         "windy",
     ]
 
-    def make_text(self, rng: random.Random) -> str:
-        return rng.choice(self._options)
-
 
 @dataclass(frozen=True)
-class MartialSocialConcept(Component):
+class MartialSocialConcept(WordList):
     """Random martial or social concept."""
 
     _options: ClassVar[list[str]] = [
@@ -222,12 +380,9 @@ class MartialSocialConcept(Component):
         "wrath",
     ]
 
-    def make_text(self, rng: random.Random) -> str:
-        return rng.choice(self._options)
-
 
 @dataclass(frozen=True)
-class UCBerkeleyEmotion(Component):
+class UCBerkeleyEmotion(WordList):
     """Random emotion from the UC Berkeley dataset."""
 
     _options: ClassVar[list[str]] = [
@@ -260,16 +415,11 @@ class UCBerkeleyEmotion(Component):
         "triumph",
     ]
 
-    def make_text(self, rng: random.Random) -> str:
-        return rng.choice(self._options)
-
 
 @dataclass(frozen=True)
-class VillainousPersonNoun(Component):
+class VillainousPersonNoun(PluralizableWordList):
     """Random villainous person noun with optional pluralization."""
 
-    is_plural: bool
-
     _options: ClassVar[list[str]] = [
         "bandit",
         "brigand",
@@ -346,37 +496,11 @@ class VillainousPersonNoun(Component):
         "villain",
     ]
 
-    def make_text(self, rng: random.Random) -> str:
-        text = rng.choice(self._options)
-
-        if self.is_plural:
-            if text.endswith(("ay", "ey", "iy", "oy", "uy")):
-                text += "s"
-            elif text.endswith("y"):
-                text = f"{text[:-1]}ies"
-            elif text.endswith(("x", "ss", "sh", "ch")):
-                text += "es"
-            elif text.endswith("ife"):
-                if text == "lowlife":
-                    text += "s"
-                else:
-                    text = f"{text[:-2]}ves"
-            elif text.endswith(("rf", "ief")):
-                text = f"{text[:-1]}ves"
-            elif text.endswith("man"):
-                text = f"{text[:-2]}en"
-            elif not text.endswith("s"):
-                text += "s"
-
-        return text
-
 
 @dataclass(frozen=True)
-class PrimitiveWeapon(Component):
+class PrimitiveWeapon(PluralizableWordList):
     """Random primitive weapon with optional pluralization."""
 
-    is_plural: bool = False
-
     _options: ClassVar[list[str]] = [
         "sword",
         "blade",
@@ -394,18 +518,9 @@ class PrimitiveWeapon(Component):
         "crossbow",
     ]
 
-    def make_text(self, rng: random.Random) -> str:
-        value = rng.choice(self._options)
-        if self.is_plural:
-            if value.endswith("ife"):
-                value = f"{value[:-2]}ves"
-            else:
-                value += "s"
-        return value
-
 
 @dataclass(frozen=True)
-class NauticalShipNameObject(Component):
+class NauticalShipNameObject(WordList):
     """Random ship name object."""
 
     _options: ClassVar[list[str]] = [
@@ -465,12 +580,9 @@ class NauticalShipNameObject(Component):
         "wolf",
     ]
 
-    def make_text(self, rng: random.Random) -> str:
-        return rng.choice(self._options)
-
 
 @dataclass(frozen=True)
-class NauticalShipNameColor(Component):
+class NauticalShipNameColor(WordList):
     """Random ship name color."""
 
     _options: ClassVar[list[str]] = [
@@ -490,12 +602,9 @@ class NauticalShipNameColor(Component):
         "white",
     ]
 
-    def make_text(self, rng: random.Random) -> str:
-        return rng.choice(self._options)
-
 
 @dataclass(frozen=True)
-class ShipNameAdjective(Component):
+class ShipNameAdjective(WordList):
     """Random ship name adjective."""
 
     _options: ClassVar[list[str]] = [
@@ -544,12 +653,9 @@ class ShipNameAdjective(Component):
         "youthful",
     ]
 
-    def make_text(self, rng: random.Random) -> str:
-        return rng.choice(self._options)
-
 
 @dataclass(frozen=True)
-class TimeOfDay(Component):
+class TimeOfDay(WordList):
     """Random time-of-day word."""
 
     _options: ClassVar[list[str]] = [
@@ -566,6 +672,3 @@ class TimeOfDay(Component):
         "twilight",
         "sunset",
     ]
-
-    def make_text(self, rng: random.Random) -> str:
-        return rng.choice(self._options)
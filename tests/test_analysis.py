@@ -0,0 +1,116 @@
+"""Tests for output-space analysis."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from wordsmith import (
+    Adjective,
+    FictionalElementName,
+    Literal,
+    LiteralChoice,
+    NauticalShipName,
+    Noun,
+    PersonName,
+    TownName,
+    WeirdName,
+    WorkTitle,
+    either,
+    maybe,
+    one_of,
+    optimize,
+    weighted_one_of,
+)
+from wordsmith.analysis import branch_report, cardinality, entropy_bits
+
+
+def test_literal_choice_is_uniform() -> None:
+    choice = LiteralChoice(("a", "b", "c", "d"))
+
+    assert cardinality(choice) == 4
+    assert entropy_bits(choice) == pytest.approx(2.0)
+
+
+def test_text_multiplies_and_choices_add() -> None:
+    tree = one_of("red", "blue") + weighted_one_of((3, "ship"), (1, "boat"))
+
+    assert cardinality(tree) == 4
+    assert entropy_bits(tree) == pytest.approx(1.0 + (-0.75 * math.log2(0.75) + 0.5))
+
+
+def test_maybe_counts_the_empty_branch() -> None:
+    tree = maybe(Literal("old"), probability=0.25) + Literal("harbour")
+
+    assert cardinality(tree) == 2
+    assert entropy_bits(tree) == pytest.approx(
+        -(0.25 * math.log2(0.25) + 0.75 * math.log2(0.75))
+    )
+
+
+def test_word_lists_count_distinct_words() -> None:
+    table = Noun().word_table()
+
+    assert cardinality(Noun()) == len(set(table))
+    assert entropy_bits(Noun()) <= math.log2(len(table)) + 1e-9
+
+
+def test_unreachable_branches_are_not_counted() -> None:
+    tree = either("first", "second", first_probability=1.0)
+
+    assert cardinality(tree) == 1
+    assert entropy_bits(tree) == pytest.approx(0.0)
+
+
+def test_optimize_keeps_the_analysis() -> None:
+    for component in (TownName(), PersonName(), NauticalShipName()):
+        assert cardinality(optimize(component, exact_stream=True)) == cardinality(
+            component
+        )
+        assert entropy_bits(optimize(component)) == pytest.approx(
+            entropy_bits(component)
+        )
+
+
+def test_recursive_grammar_has_infinite_space_but_finite_entropy() -> None:
+    assert cardinality(WorkTitle()) == math.inf
+    assert 0.0 < entropy_bits(WorkTitle()) < math.inf
+
+
+def test_recursive_entropy_follows_the_chain_rule_over_its_branches() -> None:
+    reports = branch_report(WorkTitle())
+    probabilities = [report.probability for report in reports]
+
+    assert entropy_bits(WorkTitle()) == pytest.approx(
+        -sum(p * math.log2(p) for p in probabilities)
+        + sum(report.probability * report.entropy_bits for report in reports)
+    )
+
+
+def test_weird_name_closed_form() -> None:
+    syllables = len(set(WeirdName._open_ended_syllables))
+    endings = len(set(WeirdName._ending_sounds))
+
+    plain = WeirdName(syllable_count=2)
+    assert cardinality(plain) == syllables**2 * (1 + endings)
+
+    # Three syllables: no marker, or a hyphen and/or apostrophe after the
+    # first or second syllable, where a shared slot keeps the apostrophe.
+    marked = WeirdName(syllable_count=3)
+    assert cardinality(marked) == 7 * syllables**3 * (1 + endings)
+
+
+def test_branch_report_probabilities_sum_to_one() -> None:
+    reports = branch_report(NauticalShipName())
+
+    assert sum(report.probability for report in reports) == pytest.approx(1.0)
+    assert all(report.cardinality >= 1 for report in reports)
+    assert branch_report(one_of("a", "b") + Adjective(), depth=1)[0].path == (0, 0)
+
+
+def test_custom_make_text_components_are_rejected() -> None:
+    with pytest.raises(TypeError, match="FictionalElementName"):
+        cardinality(FictionalElementName())
+    with pytest.raises(ValueError):
+        branch_report(TownName(), depth=0)
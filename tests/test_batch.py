@@ -0,0 +1,81 @@
+"""Tests for batched rendering."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from wordsmith import (
+    BandName,
+    CriminalGangName,
+    GivenName,
+    NauticalShipName,
+    Noun,
+    Surname,
+    TownName,
+    WorkTitle,
+    either,
+    maybe,
+    one_of,
+    weighted_one_of,
+)
+from wordsmith.core.base import Component
+
+GENERATORS: list[Component] = [
+    BandName(),
+    CriminalGangName(),
+    NauticalShipName(),
+    TownName(),
+    WorkTitle(),
+    GivenName() | Surname(),
+]
+
+
+@pytest.mark.parametrize("component", GENERATORS, ids=repr)
+def test_make_many_is_repeatable(component: Component) -> None:
+    batch_a = component.make_many(random.Random(7), 300)
+    batch_b = component.make_many(random.Random(7), 300)
+
+    assert len(batch_a) == 300
+    assert batch_a == batch_b
+    assert all(batch_a)
+
+
+def test_make_many_respects_structure() -> None:
+    component = one_of("alpha", "beta") | maybe("gamma", probability=0.0)
+    assert set(component.make_many(random.Random(0), 100)) == {"alpha", "beta"}
+
+    component = either("first", Noun(), first_probability=1.0)
+    assert component.make_many(random.Random(0), 10) == ["first"] * 10
+
+    component = weighted_one_of((1.0, "alpha"), (0.0, "beta"))
+    assert component.make_many(random.Random(0), 10) == ["alpha"] * 10
+
+
+def test_make_many_words_come_from_table() -> None:
+    plural = Noun(is_plural=True)
+    assert set(plural.make_many(random.Random(1), 200)) <= set(plural.word_table())
+
+
+def test_make_many_prefixes_articles() -> None:
+    component = one_of("hour", "user").prefixed_by_article()
+    assert set(component.make_many(random.Random(2), 100)) == {
+        "an hour",
+        "the hour",
+        "a user",
+        "the user",
+    }
+
+
+def test_iter_many_batches() -> None:
+    component = TownName()
+    values = list(component.iter_many(random.Random(3), n=25, batch_size=10))
+    assert len(values) == 25
+    assert values[:10] == component.make_many(random.Random(3), 10)
+
+
+def test_make_many_rejects_negative_counts() -> None:
+    with pytest.raises(ValueError):
+        TownName().make_many(random.Random(0), -1)
+    assert TownName().make_many(random.Random(0), 0) == []
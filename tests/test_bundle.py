@@ -0,0 +1,88 @@
+"""Tests for the binary asset bundle."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import random
+
+import pytest
+
+import wordsmith
+from wordsmith import Noun, Verb, VerbTense
+from wordsmith.util.bundle import (
+    BUNDLE_FILENAME,
+    RowTable,
+    StringTable,
+    build_bundle,
+    load_bundle,
+    read_bundle,
+)
+
+ASSETS_DIR = Path(wordsmith.__file__).parent / "assets"
+
+
+def test_bundle_round_trips_json_assets(tmp_path: Path) -> None:
+    output = tmp_path / BUNDLE_FILENAME
+    names = build_bundle(ASSETS_DIR, output)
+    tables = read_bundle(output.read_bytes())
+
+    assert "Exotic Character Sets.json" not in names
+    assert sorted(tables) == names
+    for name, table in tables.items():
+        expected = json.loads((ASSETS_DIR / name).read_text(encoding="utf-8"))
+        if isinstance(table, RowTable):
+            assert [list(row) for row in table] == expected
+        else:
+            assert list(table) == expected
+
+
+def test_bundle_keeps_per_entry_weights(tmp_path: Path) -> None:
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    (assets / "Fruit.json").write_text(json.dumps([["apple", 8], ["pear", 2]]))
+    (assets / "Pairs.json").write_text(json.dumps([["a", "b", 3], ["c", "d", 1]]))
+    output = tmp_path / BUNDLE_FILENAME
+    build_bundle(assets, output)
+    tables = read_bundle(output.read_bytes())
+
+    assert list(tables["Fruit.json"]) == ["apple", "pear"]
+    assert tuple(tables["Fruit.json"].weights) == (8.0, 2.0)
+    assert [list(row) for row in tables["Pairs.json"]] == [["a", "b"], ["c", "d"]]
+    assert tuple(tables["Pairs.json"].weights) == (3.0, 1.0)
+    assert tables["Pairs.json"].column(1).weights is tables["Pairs.json"].weights
+
+
+def test_packaged_bundle_is_up_to_date(tmp_path: Path) -> None:
+    output = tmp_path / BUNDLE_FILENAME
+    build_bundle(ASSETS_DIR, output)
+    assert (ASSETS_DIR / BUNDLE_FILENAME).read_bytes() == output.read_bytes(), (
+        "Run `python -m wordsmith.util.bundle` after editing assets."
+    )
+
+
+def test_word_lists_use_mapped_tables() -> None:
+    assert isinstance(load_bundle()["Nouns.json"], StringTable)
+    assert isinstance(Noun._options, StringTable)
+
+    nouns = json.loads((ASSETS_DIR / "Nouns.json").read_text(encoding="utf-8"))
+    rng = random.Random(5)
+    reference = random.Random(5)
+    for _ in range(100):
+        assert Noun().make_text(rng) == reference.choice(nouns)
+
+
+def test_verb_columns_are_lazy_views() -> None:
+    table = Verb(tense=VerbTense.PAST).word_table()
+    assert isinstance(table, StringTable)
+    assert list(table) == [row[VerbTense.PAST.value] for row in Verb._options]
+
+
+def test_string_table_indexing() -> None:
+    table = load_bundle()["Adverbs.json"]
+    assert table[-1] == table[len(table) - 1]
+    assert table[:3] == [table[0], table[1], table[2]]
+    with pytest.raises(IndexError):
+        table[len(table)]
+    with pytest.raises(ValueError):
+        read_bundle(b"nope")
@@ -0,0 +1,47 @@
+"""Tests for the casing helpers."""
+
+from __future__ import annotations
+
+from wordsmith.util.casing import (
+    WORD_CACHE_SIZE,
+    _title_case_word,
+    first_upper,
+    title_case,
+    title_case_many,
+)
+from wordsmith.util import strings
+
+
+def test_title_case_small_words() -> None:
+    assert title_case("the lord of the rings") == "The Lord of the Rings"
+    assert title_case("a tale to live by") == "A Tale to Live By"
+    assert title_case("OF MICE AND MEN") == "Of Mice and Men"
+
+
+def test_title_case_keeps_punctuation_and_spacing() -> None:
+    assert title_case('"the (lost) city" of') == '"The (Lost) City" Of'
+    assert title_case("war and  peace") == "War and Peace"
+    assert title_case("wait... what?!") == "Wait... What?!"
+    assert title_case("?! the end") == "?! the End"
+    assert title_case("") == ""
+
+
+def test_title_case_many_matches_title_case() -> None:
+    texts = ["the night of the hunter", "a man for all seasons", ""]
+    assert title_case_many(texts) == [title_case(text) for text in texts]
+
+
+def test_word_cache_is_bounded() -> None:
+    assert _title_case_word.cache_info().maxsize == WORD_CACHE_SIZE
+
+
+def test_first_upper() -> None:
+    assert first_upper("hello world") == "Hello world"
+    assert first_upper("'tis the season") == "'Tis the season"
+    assert first_upper("123") == "123"
+    assert first_upper("") == ""
+
+
+def test_casing_stays_importable_from_strings() -> None:
+    assert strings.title_case is title_case
+    assert strings.first_upper is first_upper
@@ -0,0 +1,73 @@
+"""Tests for compiled component renderers."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from wordsmith import (
+    Adjective,
+    AncientName,
+    BandName,
+    BinaryGender,
+    CriminalGangName,
+    GivenName,
+    NauticalShipName,
+    Noun,
+    PersonName,
+    PrimitiveWeapon,
+    Pronoun,
+    Surname,
+    TownName,
+    Verb,
+    VerbTense,
+    VillainousPersonNoun,
+    WorkTitle,
+    either,
+    maybe,
+    one_of,
+    text,
+    weighted_one_of,
+)
+from wordsmith.core.base import Component
+
+COMPONENTS: list[Component] = [
+    text("alpha", "beta", sep="-"),
+    "The" | maybe(Adjective()) | Noun(is_plural=True),
+    Noun() + "!",
+    one_of("alpha", "beta", "gamma"),
+    one_of(Noun(), Adjective(), "literal"),
+    weighted_one_of((3, "alpha"), (1, Noun()), (0.5, Adjective())),
+    either(Noun(), Adjective(), first_probability=0.25),
+    maybe("hello", probability=0.0) | "world",
+    Noun().prefixed_by_article(),
+    Adjective().prefixed_by_determiner(),
+    Noun().possessive_form().capitalized(),
+    Adjective().first_upper() | Noun().title_case(),
+    Verb(tense=VerbTense.PAST) | VillainousPersonNoun(is_plural=True),
+    PrimitiveWeapon(is_plural=True),
+    Pronoun(is_singular=False, is_third_person=True) | Pronoun(True, False),
+    GivenName() | GivenName(gender=BinaryGender.FEMALE) | Surname(),
+    PersonName(),
+    AncientName(syllable_count=3),
+    BandName(),
+    CriminalGangName(),
+    NauticalShipName(),
+    TownName(),
+    WorkTitle(),
+]
+
+
+@pytest.mark.parametrize("component", COMPONENTS, ids=repr)
+def test_compiled_output_matches_make_text(component: Component) -> None:
+    render = component.compile()
+    rng_a = random.Random(2024)
+    rng_b = random.Random(2024)
+
+    expected = [component.make_text(rng_a) for _ in range(200)]
+    actual = [render(rng_b) for _ in range(200)]
+
+    assert actual == expected
+    assert rng_a.getstate() == rng_b.getstate()
+
@@ -0,0 +1,140 @@
+"""Tests for length- and word-count-constrained generation."""
+
+from __future__ import annotations
+
+from collections import Counter
+import random
+
+import pytest
+
+from wordsmith import (
+    AncientName,
+    Article,
+    BandName,
+    NauticalShipName,
+    PersonName,
+    TownName,
+    WorkTitle,
+    either,
+    maybe,
+    one_of,
+)
+from wordsmith.constrained import Constrained, constrained
+
+
+def small_grammar():
+    return (
+        one_of("a", "big", "enormous")
+        | maybe(either("red", one_of("sky blue", "green"), first_probability=0.75))
+        | one_of("ox", "horse", "elephant")
+    ).title_case()
+
+
+def conditional(component, accepts, seed: int, n: int) -> Counter[str]:
+    """Count ``n`` accepted texts drawn by plain rejection."""
+    rng = random.Random(seed)
+    counts: Counter[str] = Counter()
+    while sum(counts.values()) < n:
+        text = component.make_text(rng)
+        if accepts(text):
+            counts[text] += 1
+    return counts
+
+
+def total_variation(first: Counter[str], second: Counter[str]) -> float:
+    total_first, total_second = sum(first.values()), sum(second.values())
+    return 0.5 * sum(
+        abs(first[key] / total_first - second[key] / total_second)
+        for key in first.keys() | second.keys()
+    )
+
+
+@pytest.mark.parametrize(
+    "limits",
+    [dict(max_len=12), dict(min_len=10, max_len=14), dict(max_words=2)],
+)
+def test_output_follows_the_conditional_distribution(limits) -> None:
+    tree = small_grammar()
+    limited = tree.constrained(**limits)
+    rng = random.Random(7)
+
+    drawn = Counter(limited.make_text(rng) for _ in range(20_000))
+    expected = conditional(tree, limited.accepts, seed=8, n=20_000)
+
+    assert drawn.keys() <= expected.keys()
+    assert total_variation(drawn, expected) < 0.03
+
+
+@pytest.mark.parametrize(
+    ("component", "limits"),
+    [
+        (NauticalShipName(), dict(max_len=24)),
+        (BandName(), dict(max_words=3)),
+        (TownName(), dict(min_len=14, max_len=16)),
+        (PersonName(), dict(max_len=10)),
+        (WorkTitle(), dict(max_len=12, max_words=2)),
+        (AncientName(syllable_count=3), dict(max_len=6)),
+    ],
+)
+def test_every_render_path_honors_the_limits(component, limits) -> None:
+    limited = component.constrained(**limits)
+    render = limited.compile()
+    rng = random.Random(3)
+
+    texts = [limited.make_text(rng) for _ in range(200)]
+    texts += [render(rng) for _ in range(200)]
+    texts += limited.make_many(rng, 200)
+
+    assert len(texts) == 600
+    assert all(limited.accepts(text) for text in texts)
+
+
+def test_seeded_output_is_repeatable() -> None:
+    limited = WorkTitle().constrained(max_len=16)
+
+    first = [limited.make_text(random.Random(5)) for _ in range(3)]
+
+    assert first == [limited.make_text(random.Random(5)) for _ in range(3)]
+    assert limited.compile()(random.Random(5)) == first[0]
+
+
+def test_pruning_drops_word_list_entries_that_cannot_fit() -> None:
+    tree = one_of("ox", "horse", "elephant") | "herd"
+    limited = constrained(tree, max_len=10)
+
+    assert sorted(set(limited.make_many(random.Random(1), 200))) == [
+        "horse herd",
+        "ox herd",
+    ]
+
+
+def test_articles_are_pruned_like_word_lists() -> None:
+    tree = one_of("apple", "ox").prefixed_by_article() | Article()
+    limited = constrained(tree, max_len=7)
+
+    assert set(limited.make_many(random.Random(2), 300)) == {"an ox a"}
+
+
+def test_accepts_counts_characters_and_words() -> None:
+    limited = Constrained(one_of("x"), min_len=2, max_len=8, max_words=2)
+
+    assert limited.accepts("ab cd")
+    assert not limited.accepts("a")
+    assert not limited.accepts("abcdefghi")
+    assert not limited.accepts("a b c")
+
+
+def test_infeasible_limits_raise() -> None:
+    limited = one_of("harbour", "lighthouse").constrained(max_len=4)
+
+    with pytest.raises(ValueError, match="fits the constraints"):
+        limited.make_text(random.Random(0))
+
+
+@pytest.mark.parametrize(
+    "limits",
+    [dict(min_len=-1), dict(min_len=5, max_len=4), dict(max_words=-1)],
+)
+def test_invalid_limits_raise(limits) -> None:
+    with pytest.raises(ValueError):
+        TownName().constrained(**limits)
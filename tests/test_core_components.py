@@ -4,15 +4,20 @@ from __future__ import annotations
 
 import random
 
+import pytest
+
 from wordsmith.core.components import (
     Literal,
+    coin_flips,
     either,
     maybe,
     one_of,
+    rolled_one_of,
     text,
     weighted_one_of,
 )
 from wordsmith.util.strings import starts_with_vowel
+from wordsmith.words import Article, Noun
 
 
 def test_text_joining() -> None:
@@ -47,6 +52,31 @@ def test_weighted_one_of_respects_zero_weight() -> None:
     assert component.make_text(rng) == "alpha"
 
 
+def test_rolled_one_of_matches_randint_table() -> None:
+    component = rolled_one_of((2, "low"), (3, "mid"), (5, "high"))
+    rng = random.Random(5)
+    reference = random.Random(5)
+    for _ in range(50):
+        roll = reference.randint(1, 10)
+        expected = "low" if roll <= 2 else "mid" if roll <= 5 else "high"
+        assert component.make_text(rng) == expected
+
+
+def test_rolled_one_of_requires_positive_weights() -> None:
+    with pytest.raises(ValueError):
+        rolled_one_of((0, "never"), (1, "always"))
+
+
+def test_coin_flips_matches_upfront_choices() -> None:
+    component = coin_flips(2, lambda first, second: f"{first}-{second}")
+    rng = random.Random(6)
+    reference = random.Random(6)
+    for _ in range(20):
+        first = reference.choice([True, False])
+        second = reference.choice([True, False])
+        assert component.make_text(rng) == f"{first}-{second}"
+
+
 def test_starts_with_vowel_heuristics() -> None:
     assert starts_with_vowel("hour") is True
     assert starts_with_vowel("honor") is True
@@ -62,6 +92,20 @@ def test_prefixed_by_article_respects_vowel_sound() -> None:
     assert text("user").prefixed_by_article().make_text(rng) == "a user"
 
 
+def test_prefixed_word_list_uses_vowel_index() -> None:
+    noun = Noun()
+    table = noun.word_table()
+    assert list(noun.vowel_index()) == [starts_with_vowel(word) for word in table]
+
+    rng = random.Random(8)
+    reference = random.Random(8)
+    for _ in range(200):
+        word = reference.choice(table)
+        article = Article(is_before_vowel=starts_with_vowel(word))
+        expected = f"{article.make_text(reference)} {word}"
+        assert noun.prefixed_by_article().make_text(rng) == expected
+
+
 def test_title_case_small_words() -> None:
     assert (
         text("the", "voyage", "of", "the", "sunrise", "wrath", sep=" ")
@@ -29,3 +29,35 @@ def test_exotic_character_any_set() -> None:
 def test_exotic_character_invalid_set() -> None:
     with pytest.raises(ValueError):
         ExoticCharacter.random_character_from_set("invalid")
+
+
+def test_random_string_draws_from_the_requested_set() -> None:
+    value = ExoticCharacter.random_string(32, "runic", random.Random(2))
+
+    assert len(value) == 32
+    assert set(value) <= set(ExoticCharacter._character_sets["runic"])
+    assert ExoticCharacter.random_string(0, rng=random.Random(2)) == ""
+
+
+def test_random_string_weights_sets_or_characters() -> None:
+    cuneiform = set(ExoticCharacter._character_sets["cuneiform"])
+    share = len(cuneiform) / sum(
+        len(char_set) for char_set in ExoticCharacter._character_sets.values()
+    )
+
+    by_set = ExoticCharacter.random_string(20000, rng=random.Random(3))
+    uniform = ExoticCharacter.random_string(20000, rng=random.Random(3), uniform=True)
+
+    assert sum(char in cuneiform for char in by_set) / 20000 == pytest.approx(
+        0.1, abs=0.015
+    )
+    assert sum(char in cuneiform for char in uniform) / 20000 == pytest.approx(
+        share, abs=0.015
+    )
+
+
+def test_random_string_rejects_bad_arguments() -> None:
+    with pytest.raises(ValueError):
+        ExoticCharacter.random_string(8, "invalid")
+    with pytest.raises(ValueError):
+        ExoticCharacter.random_string(-1)
@@ -45,6 +45,11 @@ def test_work_title_repeatable() -> None:
     assert_repeatable(WorkTitle())
 
 
+def test_generator_grammar_is_cached() -> None:
+    assert BandName().grammar() is BandName().grammar()
+    assert WorkTitle().grammar() is WorkTitle().grammar()
+
+
 def test_identifier_format() -> None:
     identifier = ReadableUniqueIdentifier.make_identifier(random.Random(0))
     parts = identifier.split("_")
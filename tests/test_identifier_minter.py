@@ -0,0 +1,161 @@
+"""Tests for identifier minting."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import random
+import threading
+
+import pytest
+
+from wordsmith import IdentifierLayout, IdentifierMinter, ReadableUniqueIdentifier
+from wordsmith.specials.readable_unique_identifier import (
+    EPOCH_NS,
+    NODE_BITS,
+    SEQUENCE_BITS,
+    SORTABLE_WIDTH,
+    _to_base36,
+)
+
+
+def _suffix(identifier: str) -> int:
+    return int(identifier.rsplit("_", 1)[1], 36)
+
+
+def test_base36_round_trips() -> None:
+    for value in [0, 1, 35, 36, 1295, 1296, 46656, 10**18, 2**80 + 5]:
+        encoded = _to_base36(value)
+        assert int(encoded, 36) == value
+        assert encoded == encoded.upper()
+        assert encoded == "0" or not encoded.startswith("0")
+
+
+def test_suffix_encodes_time_sequence_and_node() -> None:
+    now = EPOCH_NS + 5_000_123_456
+    minter = IdentifierMinter(node_id=7, clock=lambda: now)
+
+    first, second = minter.mint_many(2, random.Random(0))
+
+    assert _suffix(first) == (5_000_123 << SEQUENCE_BITS) << NODE_BITS | 7
+    assert _suffix(second) == ((5_000_123 << SEQUENCE_BITS) | 1) << NODE_BITS | 7
+
+
+def test_stalled_clock_still_mints_increasing_suffixes() -> None:
+    minter = IdentifierMinter(node_id=1, clock=lambda: EPOCH_NS)
+
+    suffixes = [_suffix(minter.mint(random.Random(1))) for _ in range(5000)]
+    suffixes += [_suffix(value) for value in minter.mint_many(5000)]
+
+    assert suffixes == sorted(set(suffixes))
+
+
+def test_nodes_keep_identical_clocks_apart() -> None:
+    clock = lambda: EPOCH_NS + 1_000  # noqa: E731
+    first = IdentifierMinter(node_id=1, clock=clock).mint_many(100)
+    second = IdentifierMinter(node_id=2, clock=clock).mint_many(100)
+
+    assert not {_suffix(value) for value in first} & {
+        _suffix(value) for value in second
+    }
+
+
+def test_threads_never_collide() -> None:
+    minter = IdentifierMinter(node_id=0)
+    minted: list[str] = []
+
+    def work() -> None:
+        minted.extend(minter.mint() for _ in range(2000))
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(minted)) == len(minted) == 8000
+
+
+def test_make_identifier_keeps_the_seeded_prefix() -> None:
+    identifier = ReadableUniqueIdentifier.make_identifier(random.Random(0))
+    minted = IdentifierMinter().mint(random.Random(0))
+
+    assert identifier.rsplit("_", 1)[0] == minted.rsplit("_", 1)[0]
+
+
+def test_time_first_identifiers_sort_by_mint_time() -> None:
+    ticks = iter(range(EPOCH_NS, EPOCH_NS + 10**15, 999_999_937))
+    minter = IdentifierMinter(
+        node_id=5, layout=IdentifierLayout.TIME_FIRST, clock=lambda: next(ticks)
+    )
+
+    minted = [minter.mint(random.Random(index)) for index in range(500)]
+    minted += minter.mint_many(5000, random.Random(0))
+
+    assert minted == sorted(minted)
+    assert all(value[SORTABLE_WIDTH] == "_" for value in minted)
+
+
+def test_minters_on_one_node_share_their_sequence() -> None:
+    clock = lambda: EPOCH_NS + 5_000  # noqa: E731
+    first = IdentifierMinter(node_id=4, clock=clock)
+    second = IdentifierMinter(node_id=4, clock=clock)
+
+    suffixes = [
+        minter.mint(random.Random(0)).rsplit("_", 1)[1]
+        for _ in range(50)
+        for minter in (first, second)
+    ]
+
+    assert len(set(suffixes)) == len(suffixes)
+
+
+def test_decode_recovers_time_sequence_and_node() -> None:
+    now = EPOCH_NS + 5_000_123_456
+    minter = IdentifierMinter(node_id=9, clock=lambda: now)
+
+    for layout in IdentifierLayout:
+        identifier = minter.mint(random.Random(2), layout=layout)
+        decoded = minter.decode(identifier)
+
+        assert decoded.layout is layout
+        assert decoded.node_id == 9
+        assert decoded.minted_at == datetime(
+            2001, 1, 1, 0, 0, 5, 123, tzinfo=timezone.utc
+        )
+        assert decoded.prefix in identifier
+        assert "_" in decoded.prefix
+
+    assert [minter.decode(value).sequence for value in minter.mint_many(3)] == [
+        2,
+        3,
+        4,
+    ]
+
+
+def test_decode_reads_the_default_identifier() -> None:
+    identifier = ReadableUniqueIdentifier.make_identifier(random.Random(0))
+    decoded = ReadableUniqueIdentifier.decode(identifier)
+
+    assert decoded.layout is IdentifierLayout.WORDS_FIRST
+    assert identifier == f"{decoded.prefix}_{identifier.rsplit('_', 1)[1]}"
+    assert abs(decoded.minted_at - datetime.now(timezone.utc)).total_seconds() < 60
+
+
+def test_decode_rejects_other_text() -> None:
+    for text in [
+        "",
+        "plain",
+        "brave_otter_",
+        "brave_otter_K0K-BT",
+        "brave_otter_k0kbte71rfg4xv",
+        "brave_otter_" + "Z" * 20,
+    ]:
+        with pytest.raises(ValueError):
+            IdentifierMinter.decode(text)
+
+
+def test_rejects_bad_arguments() -> None:
+    with pytest.raises(ValueError):
+        IdentifierMinter(node_id=1 << NODE_BITS)
+    with pytest.raises(ValueError):
+        IdentifierMinter().mint_many(-1)
@@ -0,0 +1,76 @@
+"""Import-time regression tests."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import wordsmith
+
+# Cold-import budget for the core DSL in microseconds. It leaves headroom for
+# slow CI machines; eagerly importing generators or assets blows past it.
+CORE_IMPORT_BUDGET_US = 150_000
+
+
+def _run_fresh(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+def _cold_import_us(statement: str) -> int:
+    """Return the cumulative ``-X importtime`` cost of Wordsmith modules."""
+    stderr = _run_fresh("-X", "importtime", "-c", statement).stderr
+    total = 0
+    for line in stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2]
+        is_top_level = name.startswith(" ") and not name.startswith("  ")
+        if is_top_level and name.strip().startswith("wordsmith"):
+            total += int(fields[1])
+    return total
+
+
+def test_core_import_stays_within_budget() -> None:
+    statement = "from wordsmith.core import Component, Literal, one_of"
+    best = min(_cold_import_us(statement) for _ in range(3))
+    assert 0 < best <= CORE_IMPORT_BUDGET_US
+
+
+def test_core_import_skips_generators_and_assets() -> None:
+    output = _run_fresh(
+        "-c",
+        "import sys\n"
+        "from wordsmith.core import Literal, one_of\n"
+        "from wordsmith.util.resources import load_json\n"
+        "print(load_json.cache_info().currsize)\n"
+        "print(' '.join(sorted(sys.modules)))",
+    ).stdout.split("\n")
+
+    assert output[0] == "0"
+    loaded = set(output[1].split())
+    assert "wordsmith.generators" not in loaded
+    assert "wordsmith.names" not in loaded
+    assert "wordsmith.specials" not in loaded
+
+
+def test_lazy_exports_resolve() -> None:
+    assert set(wordsmith.__all__) <= set(dir(wordsmith))
+    for name in wordsmith.__all__:
+        assert getattr(wordsmith, name) is not None
+
+    from wordsmith.core import Literal
+
+    assert wordsmith.Literal is Literal
+
+
+def test_unknown_export_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError, match="NotAComponent"):
+        wordsmith.NotAComponent
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 import random
 
 import pytest
@@ -14,6 +15,7 @@ from wordsmith.names import (
     Surname,
     WeirdName,
 )
+from wordsmith.names.syllables import SyllableTable
 
 
 def test_given_name_gendered() -> None:
@@ -60,3 +62,70 @@ def test_weird_name_requires_positive_syllables() -> None:
 def test_ancient_name_requires_positive_syllables() -> None:
     with pytest.raises(ValueError):
         AncientName(syllable_count=0)
+
+
+def test_syllable_table_mixture_weights() -> None:
+    table = SyllableTable.mixture([(0.75, ["a", "b", "c"]), (0.25, ["c", "d"])])
+
+    weights = dict(zip(table.texts, table.weights))
+    assert weights == pytest.approx({"a": 0.25, "b": 0.25, "c": 0.375, "d": 0.125})
+    assert all(0 <= index < 4 for index in table.sample_many(random.Random(0), 100))
+
+
+@pytest.mark.parametrize("syllable_count", [1, 3, 5])
+def test_ancient_name_batches_follow_the_flags(syllable_count: int) -> None:
+    plain = AncientName(syllable_count, allow_hyphen=False, allow_apostrophe=False)
+    marked = AncientName(syllable_count)
+
+    for value in plain.make_many(random.Random(5), 500):
+        assert value[0].isupper() and "-" not in value and "'" not in value
+    batch = marked.make_many(random.Random(5), 2000)
+    assert all(value[0].isupper() for value in batch)
+    if syllable_count > 3:
+        hyphenated = sum("-" in value for value in batch) / len(batch)
+        assert hyphenated == pytest.approx(0.25, abs=0.04)
+
+
+@pytest.mark.parametrize("syllable_count", [2, 5])
+def test_ancient_name_table_draws_keep_the_distribution(syllable_count: int) -> None:
+    exact = AncientName(syllable_count)
+    fast = AncientName(syllable_count, exact_stream=False)
+    rng = random.Random(7)
+    singles = [exact.make_text(rng) for _ in range(20_000)]
+    drawn = [fast.make_text(rng) for _ in range(20_000)]
+
+    def shares(values: list[str]) -> Counter[object]:
+        counts = Counter(len(value) for value in values)
+        counts.update(mark for value in values for mark in "-'" if mark in value)
+        return counts
+
+    expected, actual = shares(singles), shares(drawn)
+    for key in expected.keys() | actual.keys():
+        assert actual[key] / 20_000 == pytest.approx(
+            expected[key] / 20_000, abs=0.015
+        )
+
+
+def test_ancient_name_exact_stream_is_the_default() -> None:
+    name = AncientName(4)
+
+    assert name.exact_stream
+    assert name.make_text(random.Random(8)) != AncientName(
+        4, exact_stream=False
+    ).make_text(random.Random(8))
+
+
+def test_weird_name_batches_match_make_text_shape() -> None:
+    name = WeirdName(syllable_count=3)
+    batch = name.make_many(random.Random(6), 4000)
+    single = [name.make_text(random.Random(seed)) for seed in range(4000)]
+
+    def share(values: list[str], mark: str) -> float:
+        return sum(mark in value for value in values) / len(values)
+
+    for mark in ("-", "'"):
+        assert share(batch, mark) == pytest.approx(share(single, mark), abs=0.04)
+    assert not any(
+        "-" in value or "'" in value
+        for value in WeirdName(syllable_count=2).make_many(random.Random(1), 200)
+    )
@@ -0,0 +1,155 @@
+"""Tests for the grammar optimizer."""
+
+from __future__ import annotations
+
+from collections import Counter
+import random
+
+import pytest
+
+from wordsmith import (
+    Adjective,
+    AncientName,
+    BandName,
+    Capitalized,
+    CriminalGangName,
+    Either,
+    Literal,
+    LiteralChoice,
+    LocationAdjective,
+    Maybe,
+    NauticalShipName,
+    Noun,
+    RolledOneOf,
+    Text,
+    TownName,
+    UnusualWorkTitle,
+    WeightedOneOf,
+    WorkTitle,
+    either,
+    maybe,
+    one_of,
+    optimize,
+    weighted_one_of,
+)
+from wordsmith.core.base import Component
+from wordsmith.util import Casing
+from wordsmith.words import CasedWordList
+
+GENERATORS: list[Component] = [
+    BandName(),
+    CriminalGangName(),
+    NauticalShipName(),
+    TownName(),
+    WorkTitle(),
+    UnusualWorkTitle(),
+    "The" | maybe(Adjective()) | Noun() | "of" | TownName(),
+]
+
+
+@pytest.mark.parametrize("component", GENERATORS, ids=repr)
+def test_exact_stream_matches_original(component: Component) -> None:
+    optimized = optimize(component, exact_stream=True)
+    rng_a = random.Random(21)
+    rng_b = random.Random(21)
+
+    expected = [component.make_text(rng_a) for _ in range(300)]
+    assert [optimized.make_text(rng_b) for _ in range(300)] == expected
+    assert optimized.make_many(random.Random(22), 200) == component.make_many(
+        random.Random(22), 200
+    )
+
+
+def test_text_chains_are_flattened() -> None:
+    component = "The" | maybe(Adjective()) | Noun() | "of" | "the" | "night"
+    optimized = component.optimize()
+
+    assert isinstance(optimized, Text)
+    assert optimized.parts == (
+        Literal("The"),
+        Maybe(Adjective()),
+        Noun(),
+        Literal("of the night"),
+    )
+
+
+def test_constants_are_folded() -> None:
+    assert (Literal("of") + "" + "mice").title_case().optimize() == Literal("Ofmice")
+    assert maybe("gone", probability=0.0).optimize() == Literal("")
+    assert one_of("a", "b").optimize(exact_stream=True) == LiteralChoice(("a", "b"))
+
+
+def test_nested_choices_collapse() -> None:
+    optimized = one_of(one_of("a", "b"), "c", "c").optimize()
+    assert isinstance(optimized, WeightedOneOf)
+    values = [option.text for option in optimized.options]
+    assert values == ["a", "b", "c"]
+    assert optimized.weights == pytest.approx((1 / 6, 1 / 6, 2 / 3))
+
+    optimized = weighted_one_of((3, one_of("x", "y")), (1, Noun())).optimize()
+    assert isinstance(optimized, WeightedOneOf)
+    assert optimized.weights == pytest.approx((0.375, 0.375, 0.25))
+
+
+def test_ancient_names_switch_to_table_draws() -> None:
+    component = either(AncientName(3), "Harbour")
+
+    assert optimize(component).first == AncientName(3, exact_stream=False)
+    assert optimize(component, exact_stream=True).first == AncientName(3)
+
+
+def test_collapsed_choices_keep_distribution() -> None:
+    component = weighted_one_of(
+        (2, one_of("a", weighted_one_of((1, "b"), (3, "c")))),
+        (1, "a"),
+    )
+    optimized = component.optimize()
+    expected = {"a": 2 / 3, "b": 1 / 12, "c": 1 / 4}
+
+    counts = Counter(optimized.make_many(random.Random(23), 60_000))
+    for value, probability in expected.items():
+        assert counts[value] / 60_000 == pytest.approx(probability, abs=0.01)
+
+
+def test_casing_is_pushed_onto_word_tables() -> None:
+    component = one_of(LocationAdjective(), either("old town", Noun())).first_upper()
+    optimized = component.optimize(exact_stream=True)
+
+    assert optimized == one_of(
+        CasedWordList(LocationAdjective(), Casing.FIRST_UPPER),
+        Either(Literal("Old town"), CasedWordList(Noun(), Casing.FIRST_UPPER)),
+    )
+    rng_a = random.Random(24)
+    rng_b = random.Random(24)
+    assert [optimized.make_text(rng_b) for _ in range(200)] == [
+        component.make_text(rng_a) for _ in range(200)
+    ]
+
+
+def test_capitalized_is_pushed_through_spaced_text() -> None:
+    spaced = (Noun() | maybe(Adjective())).capitalized().optimize()
+    assert spaced == Text(
+        (
+            CasedWordList(Noun(), Casing.CAPITALIZED),
+            Maybe(CasedWordList(Adjective(), Casing.CAPITALIZED)),
+        ),
+        sep=" ",
+    )
+
+    joined = (Noun() + Adjective()).capitalized().optimize()
+    assert isinstance(joined, Capitalized)
+    assert isinstance(TownName().optimize(), RolledOneOf)
+
+
+def test_compiled_casing_uses_precased_table() -> None:
+    component = LocationAdjective().first_upper()
+    render = component.compile()
+    rng_a = random.Random(25)
+    rng_b = random.Random(25)
+
+    assert [render(rng_a) for _ in range(100)] == [
+        component.make_text(rng_b) for _ in range(100)
+    ]
+    assert CasedWordList(LocationAdjective(), Casing.FIRST_UPPER).word_table()[0] == (
+        "Ancient"
+    )
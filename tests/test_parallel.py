@@ -0,0 +1,67 @@
+"""Tests for process-pool generation."""
+
+from __future__ import annotations
+
+import multiprocessing
+import random
+
+import pytest
+
+from wordsmith import NauticalShipName, TownName, WorkTitle
+from wordsmith.parallel import chunk_seed, generate
+from wordsmith.util.samplers import SamplerPolicy, set_default_sampler_policy
+
+
+def test_output_is_independent_of_worker_count() -> None:
+    component = WorkTitle()
+    serial = list(generate(component, 250, seed=9, workers=1, chunk_size=40))
+    pooled = list(generate(component, 250, seed=9, workers=3, chunk_size=40))
+
+    assert len(serial) == 250
+    assert pooled == serial
+
+
+def test_chunks_follow_derived_seeds() -> None:
+    component = TownName()
+    values = list(generate(component, 25, seed=4, workers=1, chunk_size=10))
+
+    assert values[:10] == component.make_many(random.Random(chunk_seed(4, 0)), 10)
+    assert values[20:] == component.make_many(random.Random(chunk_seed(4, 2)), 5)
+
+
+def test_unordered_yields_the_same_texts() -> None:
+    component = TownName()
+    ordered = list(generate(component, 300, seed=1, workers=2, chunk_size=50))
+    unordered = list(
+        generate(component, 300, seed=1, workers=2, chunk_size=50, ordered=False)
+    )
+    assert sorted(unordered) == sorted(ordered)
+
+
+def test_spawned_workers_inherit_the_sampler_policy() -> None:
+    component = NauticalShipName()
+    spawn = multiprocessing.get_context("spawn")
+    aliased = list(generate(component, 60, seed=5, workers=1, chunk_size=20))
+    set_default_sampler_policy(SamplerPolicy.LEGACY)
+    try:
+        serial = list(generate(component, 60, seed=5, workers=1, chunk_size=20))
+        pooled = list(
+            generate(
+                component, 60, seed=5, workers=2, chunk_size=20, mp_context=spawn
+            )
+        )
+    finally:
+        set_default_sampler_policy(SamplerPolicy.ALIAS)
+
+    assert serial != aliased
+    assert pooled == serial
+
+
+def test_generate_validates_arguments() -> None:
+    assert list(generate(TownName(), 0, seed=0)) == []
+    with pytest.raises(ValueError):
+        generate(TownName(), -1, seed=0)
+    with pytest.raises(ValueError):
+        generate(TownName(), 10, seed=0, chunk_size=0)
+    with pytest.raises(ValueError):
+        generate(TownName(), 10, seed=0, workers=0)
@@ -0,0 +1,120 @@
+"""Tests for the default RNG policy."""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+
+import pytest
+
+from wordsmith import (
+    CounterRandom,
+    ExoticCharacter,
+    RngPolicy,
+    WorkTitle,
+    set_default_rng_policy,
+)
+from wordsmith.util import default_rng, get_default_rng_policy
+
+
+@pytest.fixture
+def system_policy():
+    set_default_rng_policy(RngPolicy.SYSTEM)
+    yield
+    set_default_rng_policy(RngPolicy.FAST)
+
+
+def test_fast_policy_caches_one_rng_per_thread() -> None:
+    assert get_default_rng_policy() is RngPolicy.FAST
+    rng = default_rng()
+    assert type(rng) is random.Random
+    assert default_rng() is rng
+
+    others: list[random.Random] = []
+    thread = threading.Thread(target=lambda: others.append(default_rng()))
+    thread.start()
+    thread.join()
+    assert others[0] is not rng
+
+
+@pytest.mark.usefixtures("system_policy")
+def test_system_policy_is_opt_in() -> None:
+    assert isinstance(default_rng(), random.SystemRandom)
+    assert WorkTitle()()
+    assert ExoticCharacter.random_character()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_reseeds() -> None:
+    parent_rng = default_rng()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        child_rng = default_rng()
+        os.write(write_fd, b"1" if child_rng is not parent_rng else b"0")
+        os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as reader:
+        assert reader.read() == b"1"
+    os.waitpid(pid, 0)
+
+
+def test_counter_random_matches_reference_splitmix64() -> None:
+    rng = CounterRandom(1234567)
+
+    assert [rng.getrandbits(64) for _ in range(3)] == [
+        6457827717110365317,
+        3203168211198807973,
+        9817491932198370423,
+    ]
+    assert rng.counter == 3
+    assert rng.getrandbits(0) == 0
+    assert rng.counter == 3
+
+
+def test_counter_random_jump_skips_draws() -> None:
+    stepped = CounterRandom(5)
+    for _ in range(1000):
+        stepped.random()
+    jumped = CounterRandom(5)
+    jumped.jump(1000)
+
+    assert jumped.random() == stepped.random()
+    with pytest.raises(ValueError):
+        CounterRandom(5).jump(-1)
+
+
+def test_counter_random_at_ignores_the_parent_position() -> None:
+    fresh = CounterRandom(42)
+    used = CounterRandom(42)
+    used.jump(12345)
+
+    assert WorkTitle().make_text(fresh.at(10_000_000)) == WorkTitle().make_text(
+        used.at(10_000_000)
+    )
+    assert fresh.at(1).random() != fresh.at(2).random()
+
+
+def test_counter_random_spawn_is_reproducible_and_independent() -> None:
+    children = CounterRandom(7).spawn(3)
+    again = CounterRandom(7).spawn(3)
+
+    firsts = [child.random() for child in children]
+    assert firsts == [child.random() for child in again]
+    assert len(set(firsts)) == 3
+
+
+def test_counter_random_state_round_trips_and_draws_uniformly() -> None:
+    rng = CounterRandom("world-1")
+    state = rng.getstate()
+    draws = [rng.randrange(3) for _ in range(30_000)]
+    rng.setstate(state)
+
+    assert [rng.randrange(3) for _ in range(30_000)] == draws
+    assert all(9_500 < draws.count(value) < 10_500 for value in range(3))
+    assert 0 <= rng.randrange(10**30) < 10**30
+    with pytest.raises(TypeError):
+        CounterRandom(1.5)  # type: ignore[arg-type]
@@ -0,0 +1,124 @@
+"""Tests for rank/unrank index addressing."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from wordsmith import (
+    AncientName,
+    FictionalElementName,
+    GivenName,
+    Literal,
+    NauticalShipName,
+    Noun,
+    PersonName,
+    Surname,
+    TownName,
+    WeirdName,
+    WorkTitle,
+    either,
+    maybe,
+    one_of,
+)
+from wordsmith.analysis import cardinality
+from wordsmith.core.base import Component
+from wordsmith.ranking import rank, unrank
+
+RANKABLE: list[Component] = [
+    TownName(),
+    PersonName(),
+    NauticalShipName(),
+    AncientName(syllable_count=4),
+    WeirdName(syllable_count=3),
+]
+
+
+def test_small_tree_enumerates_in_mixed_radix_order() -> None:
+    tree = one_of("red", "blue") | maybe(Literal("old")) | one_of("ship", "boat")
+
+    outputs = [tree.unrank(index) for index in range(cardinality(tree))]
+
+    assert outputs == [
+        "red old ship",
+        "red old boat",
+        "red ship",
+        "red boat",
+        "blue old ship",
+        "blue old boat",
+        "blue ship",
+        "blue boat",
+    ]
+    assert [tree.rank(value) for value in outputs] == list(range(8))
+
+
+def test_word_lists_number_their_distinct_words() -> None:
+    words = list(dict.fromkeys(Surname().word_table()))
+
+    assert [unrank(Surname(), index) for index in range(5)] == words[:5]
+    assert rank(Surname(), words[-1]) == len(words) - 1
+
+
+@pytest.mark.parametrize("component", RANKABLE, ids=repr)
+def test_unrank_covers_the_analysis_space(component: Component) -> None:
+    size = cardinality(component)
+    rng = random.Random(7)
+
+    for index in [0, size - 1, *(rng.randrange(size) for _ in range(50))]:
+        value = unrank(component, index)
+        try:
+            assert rank(component, value) == index
+        except ValueError as error:
+            assert "ambiguous" in str(error)
+
+
+@pytest.mark.parametrize("component", RANKABLE, ids=repr)
+def test_sampled_outputs_can_be_ranked(component: Component) -> None:
+    rng = random.Random(11)
+
+    for _ in range(100):
+        value = component(rng)
+        try:
+            assert unrank(component, rank(component, value)) == value
+        except ValueError as error:
+            assert "ambiguous" in str(error)
+
+
+def test_rank_ignores_case_while_matching_but_checks_the_render() -> None:
+    name = GivenName()
+    value = unrank(name, 3)
+
+    assert rank(name, value) == 3
+    with pytest.raises(ValueError, match="not an output"):
+        rank(name, value.upper() + "x")
+
+
+def test_rank_handles_characters_whose_lowercase_is_longer() -> None:
+    tree = one_of("İzmir", "Ankara") | one_of("Gate", "Road")
+
+    for index in range(4):
+        assert tree.rank(tree.unrank(index)) == index
+    assert tree.rank("İzmir Road") == 1
+
+
+def test_ambiguous_text_is_rejected() -> None:
+    tree = either("harbour", one_of("harbour", "dock"))
+
+    with pytest.raises(ValueError, match="ambiguous"):
+        rank(tree, "harbour")
+    assert rank(tree, "dock") == 2
+
+
+def test_out_of_range_index() -> None:
+    with pytest.raises(IndexError):
+        unrank(Noun(), cardinality(Noun()))
+    with pytest.raises(IndexError):
+        unrank(Noun(), -1)
+
+
+def test_unrankable_components_are_reported() -> None:
+    with pytest.raises(TypeError, match="recursive"):
+        unrank(WorkTitle(), 0)
+    with pytest.raises(TypeError, match="FictionalElementName"):
+        rank(FictionalElementName(), "Xyzzium")
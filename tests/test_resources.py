@@ -0,0 +1,79 @@
+"""Tests for asset loading."""
+
+from __future__ import annotations
+
+import pickle
+import subprocess
+import sys
+import textwrap
+
+from wordsmith.util.resources import (
+    LazyAsset,
+    WeightedList,
+    load_asset,
+    load_json,
+    weighted_rows,
+)
+
+
+def _run_fresh(source: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(source)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_assets() -> None:
+    output = _run_fresh(
+        """
+        import wordsmith
+        from wordsmith.util.resources import load_json
+
+        print(load_json.cache_info().currsize)
+        """
+    )
+    assert output == "0"
+
+
+def test_preload_loads_every_asset() -> None:
+    output = _run_fresh(
+        """
+        import wordsmith
+        from wordsmith.util.bundle import load_bundle
+        from wordsmith.util.resources import load_json
+
+        wordsmith.preload()
+        print(len(load_bundle()) + load_json.cache_info().currsize)
+        """
+    )
+    assert int(output) >= 9
+
+
+def test_lazy_asset_replaces_itself_on_first_read() -> None:
+    class Holder:
+        options = LazyAsset[list[str]]("Adverbs.json")
+
+    assert isinstance(Holder.__dict__["options"], LazyAsset)
+    assert list(Holder().options) == load_json("Adverbs.json")
+    assert Holder.__dict__["options"] is load_asset("Adverbs.json")
+
+
+def test_weighted_rows_split_off_trailing_weights() -> None:
+    assert weighted_rows([["apple", 8], ["pear", 2.5]]) == (
+        ["apple", "pear"],
+        [8.0, 2.5],
+    )
+    assert weighted_rows([["a", "b", 3]]) == ([["a", "b"]], [3.0])
+    assert weighted_rows(["apple", "pear"]) is None
+    assert weighted_rows([["a", "b"]]) is None
+
+
+def test_weighted_lists_keep_their_weights() -> None:
+    fruit = WeightedList(("apple", "pear"), (8, 2))
+
+    assert fruit == ("apple", "pear")
+    assert fruit.weights == (8.0, 2.0)
+    assert pickle.loads(pickle.dumps(fruit)).weights == (8.0, 2.0)
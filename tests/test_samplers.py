@@ -0,0 +1,111 @@
+"""Tests for weighted samplers."""
+
+from __future__ import annotations
+
+from collections import Counter
+import random
+
+import pytest
+
+from wordsmith import NauticalShipName, WorkTitle
+from wordsmith.core.components import weighted_one_of
+from wordsmith.util.samplers import (
+    AliasSampler,
+    CumulativeSampler,
+    PolicySampler,
+    SamplerPolicy,
+    get_default_sampler_policy,
+    make_sampler,
+    set_default_sampler_policy,
+)
+
+
+@pytest.fixture
+def legacy_policy():
+    set_default_sampler_policy(SamplerPolicy.LEGACY)
+    yield
+    set_default_sampler_policy(SamplerPolicy.ALIAS)
+
+
+def test_cumulative_sampler_matches_random_choices() -> None:
+    weights = [4, 3, 1, 1, 0.5, 2]
+    sampler = CumulativeSampler(weights)
+    rng = random.Random(11)
+    reference = random.Random(11)
+
+    expected = reference.choices(range(len(weights)), weights=weights, k=500)
+    singles = [sampler.sample(rng) for _ in range(250)]
+    assert singles + sampler.sample_many(rng, 250) == expected
+
+
+def test_alias_sampler_distribution() -> None:
+    weights = [5.0, 3.0, 2.0, 0.0]
+    sampler = AliasSampler(weights)
+    counts = Counter(sampler.sample_many(random.Random(12), 100_000))
+
+    assert counts[3] == 0
+    for index, weight in enumerate(weights[:3]):
+        assert counts[index] / 100_000 == pytest.approx(weight / 10.0, abs=0.01)
+
+
+def test_alias_sampler_single_option() -> None:
+    sampler = AliasSampler([0.0, 2.0, 0.0])
+    rng = random.Random(13)
+    assert {sampler.sample(rng) for _ in range(100)} == {1}
+
+
+def test_make_sampler_selects_implementation() -> None:
+    assert isinstance(make_sampler([1, 2]), PolicySampler)
+    assert isinstance(make_sampler([1, 2], legacy_stream=False), AliasSampler)
+    assert isinstance(make_sampler([1, 2], legacy_stream=True), CumulativeSampler)
+
+
+def test_sampler_rejects_invalid_weights() -> None:
+    with pytest.raises(ValueError):
+        AliasSampler([])
+    with pytest.raises(ValueError):
+        AliasSampler([0.0, 0.0])
+    with pytest.raises(ValueError):
+        CumulativeSampler([1.0, -1.0])
+
+
+def test_weighted_one_of_legacy_stream() -> None:
+    options = ["alpha", "beta", "gamma"]
+    weights = [1.0, 2.0, 3.0]
+    component = weighted_one_of(*zip(weights, options), legacy_stream=True)
+    rng = random.Random(14)
+    reference = random.Random(14)
+
+    for _ in range(100):
+        expected = reference.choices(options, weights=weights, k=1)[0]
+        assert component.make_text(rng) == expected
+
+
+def test_legacy_policy_switches_existing_samplers(legacy_policy) -> None:
+    weights = [1.0, 2.0, 3.0]
+    sampler = make_sampler(weights)
+    rng = random.Random(15)
+    reference = random.Random(15)
+
+    assert get_default_sampler_policy() is SamplerPolicy.LEGACY
+    assert sampler.sample_many(rng, 50) == reference.choices(range(3), weights, k=50)
+
+
+def test_legacy_policy_pins_built_in_generator_streams(legacy_policy) -> None:
+    ships = NauticalShipName()
+    rng = random.Random(99)
+
+    assert [ships.make_text(rng) for _ in range(5)] == [
+        "Lake Kelley",
+        "Delight",
+        "Invincible Princess",
+        "Unyielding Shield",
+        "Xase-fyr",
+    ]
+    assert ships.compile()(random.Random(99)) == "Lake Kelley"
+    rng = random.Random(99)
+    assert [WorkTitle().make_text(rng) for _ in range(3)] == [
+        "Curiously",
+        "Sunset Presets",
+        "Twilight Facsimile",
+    ]
@@ -0,0 +1,76 @@
+"""Tests for unique sampling over the rank space."""
+
+from __future__ import annotations
+
+import pytest
+
+from wordsmith import NauticalShipName, TownName, coin_flips, either, one_of
+from wordsmith.analysis import cardinality
+from wordsmith.unique import FeistelPermutation, UniqueSampler
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 65, 1000, 4099])
+def test_feistel_permutation_is_a_bijection(size: int) -> None:
+    permutation = FeistelPermutation(size, seed=42)
+
+    assert sorted(permutation[index] for index in range(size)) == list(range(size))
+
+
+def test_feistel_permutation_depends_on_the_seed() -> None:
+    first = [FeistelPermutation(1000, seed=1)[index] for index in range(20)]
+    second = [FeistelPermutation(1000, seed=2)[index] for index in range(20)]
+
+    assert first != second
+    assert first == [FeistelPermutation(1000, seed=1)[index] for index in range(20)]
+
+
+def test_sampler_exhausts_the_space_without_repeats() -> None:
+    tree = one_of("red", "blue", "green") | one_of("ship", "boat")
+    sampler = UniqueSampler(tree, seed=3)
+
+    drawn = list(sampler)
+
+    assert sorted(drawn) == sorted(tree.unrank(index) for index in range(6))
+    assert sampler.cursor == 6
+    with pytest.raises(IndexError):
+        sampler.draw()
+
+
+def test_sampler_skips_texts_rendered_by_several_derivations() -> None:
+    tree = either("harbour", one_of("harbour", "dock"))
+
+    assert sorted(UniqueSampler(tree, seed=5)) == ["dock", "harbour"]
+    assert len(list(UniqueSampler(tree, seed=5, skip_duplicates=False))) == 3
+
+
+def test_sampler_merges_coin_flip_variants() -> None:
+    tree = coin_flips(
+        2, lambda plural, _: one_of("harbour", "docks" if plural else "dock")
+    ).title_case()
+    sampler = UniqueSampler(tree, seed=2, skip_duplicates=False)
+
+    assert cardinality(tree) == 8
+    assert sampler.size == 3
+    assert sorted(sampler) == ["Dock", "Docks", "Harbour"]
+
+
+def test_sampler_resumes_from_its_cursor() -> None:
+    sampler = UniqueSampler(NauticalShipName(), seed=9)
+    sampler.draw_many(50)
+    resumed = UniqueSampler(NauticalShipName(), seed=9, cursor=sampler.cursor)
+
+    assert resumed.draw_many(50) == sampler.draw_many(50)
+
+
+def test_sampler_draws_are_unique() -> None:
+    sampler = UniqueSampler(TownName(), seed=11)
+
+    drawn = sampler.draw_many(2000)
+
+    assert len(set(drawn)) == len(drawn)
+    assert sampler.size == cardinality(TownName())
+
+
+def test_sampler_rejects_out_of_range_cursors() -> None:
+    with pytest.raises(ValueError):
+        UniqueSampler(TownName(), seed=1, cursor=-1)
@@ -0,0 +1,109 @@
+"""Tests for the optional NumPy rendering backend."""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from wordsmith import (  # noqa: E402
+    AncientName,
+    GivenName,
+    Literal,
+    NauticalShipName,
+    Noun,
+    PersonName,
+    Surname,
+    TownName,
+    WorkTitle,
+    either,
+    maybe,
+    one_of,
+    text,
+)
+from wordsmith.util import WeightedList  # noqa: E402
+from wordsmith.vectorized import render_array  # noqa: E402
+from wordsmith.words import WordList  # noqa: E402
+
+
+@dataclass(frozen=True)
+class Fruit(WordList):
+    _options = WeightedList(("apple", "banana", "cherry"), (8.0, 2.0, 2.0))
+
+
+def test_returns_a_string_array_of_the_requested_size() -> None:
+    rendered = render_array(TownName(), 1000, 1)
+
+    assert rendered.shape == (1000,)
+    assert rendered.dtype == np.dtypes.StringDType()
+    assert all(isinstance(value, str) for value in rendered.tolist())
+    assert render_array(TownName(), 0, 1).shape == (0,)
+
+
+def test_seeded_output_is_repeatable() -> None:
+    first = render_array(PersonName(), 500, 7).tolist()
+
+    assert render_array(PersonName(), 500, np.random.default_rng(7)).tolist() == first
+
+
+def test_word_leaves_draw_from_their_tables() -> None:
+    for component in (Noun(), Surname()):
+        rendered = set(render_array(component, 2000, 3).tolist())
+        assert rendered <= set(component.word_table())
+
+    names = set(GivenName._male_options) | set(GivenName._female_options)
+    assert set(render_array(GivenName(), 2000, 3).tolist()) <= names
+
+
+def test_text_skips_empty_parts_like_make_text() -> None:
+    tree = text(Literal("a"), maybe(Literal("b"), probability=0.5), "c", sep=" ")
+
+    counts = Counter(render_array(tree, 4000, 5).tolist())
+
+    assert set(counts) == {"a c", "a b c"}
+    assert 1700 < counts["a b c"] < 2300
+
+
+def test_either_and_one_of_follow_their_probabilities() -> None:
+    tree = either(one_of("x", "y"), "z", first_probability=0.75)
+
+    counts = Counter(render_array(tree, 20000, 9).tolist())
+
+    assert counts["z"] / 20000 == pytest.approx(0.25, abs=0.02)
+    assert counts["x"] / 20000 == pytest.approx(0.375, abs=0.02)
+
+
+def test_prefixes_and_casing_match_the_python_renderer() -> None:
+    tree = Noun().prefixed_by_article().capitalized() | Noun().possessive_form()
+
+    for value in render_array(tree, 2000, 4).tolist():
+        article, rest = value.split(" ", 1)
+        assert article in {"A", "An", "The"}
+        assert rest.endswith("'s") or rest.endswith("'")
+
+
+@pytest.mark.parametrize(
+    "component",
+    [NauticalShipName(), WorkTitle(), AncientName(syllable_count=3)],
+    ids=repr,
+)
+def test_generators_render_plausible_text(component) -> None:
+    rendered = render_array(component, 3000, 2).tolist()
+
+    assert all(rendered)
+    assert len(set(rendered)) > 1000
+
+
+def test_weighted_word_lists_follow_their_weights() -> None:
+    for tree in (Fruit(weighted=True), Fruit(weighted=True).prefixed_by_article()):
+        rendered = render_array(tree, 12000, 8).tolist()
+        counts = Counter(value.split(" ")[-1] for value in rendered)
+        assert counts["apple"] / 12000 == pytest.approx(8 / 12, abs=0.02)
+
+
+def test_rejects_negative_sizes() -> None:
+    with pytest.raises(ValueError):
+        render_array(TownName(), -1)
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from dataclasses import dataclass
 import random
 from typing import Sequence
 
+import pytest
+
 from tests.utils import assert_in_options
+from wordsmith import BinaryGender, GivenName
+from wordsmith.analysis import entropy_bits
+from wordsmith.util import WeightedList, pluralize
 from wordsmith.words import (
     Adjective,
     Adverb,
@@ -23,9 +30,15 @@ from wordsmith.words import (
     Verb,
     VerbTense,
     VillainousPersonNoun,
+    WordList,
 )
 
 
+@dataclass(frozen=True)
+class Fruit(WordList):
+    _options = WeightedList(("apple", "banana", "cherry"), (8.0, 2.0, 2.0))
+
+
 class ChoiceRandom:
     """Deterministic RNG that always returns a chosen value."""
 
@@ -129,3 +142,62 @@ def test_villainous_person_pluralization_rules() -> None:
 def test_primitive_weapon_pluralization_rules() -> None:
     assert PrimitiveWeapon(is_plural=True).make_text(ChoiceRandom("knife")) == "knives"
     assert PrimitiveWeapon(is_plural=True).make_text(ChoiceRandom("spear")) == "spears"
+
+
+def test_pluralize_shared_rules() -> None:
+    assert pluralize("wharf") == "wharves"
+    assert pluralize("thief") == "thieves"
+    assert pluralize("chief") == "chiefs"
+    assert pluralize("lowlife") == "lowlifes"
+    assert pluralize("highwayman") == "highwaymen"
+
+
+def test_plural_tables_parallel_options() -> None:
+    for component in (Noun(), VillainousPersonNoun(), PrimitiveWeapon()):
+        table = component.plural_table()
+        assert len(table) == len(component._options)
+        assert list(table) == [pluralize(value) for value in component._options]
+
+
+def test_weighted_word_lists_follow_their_weights() -> None:
+    fruit = Fruit(weighted=True)
+    expected = {"apple": 8 / 12, "banana": 2 / 12, "cherry": 2 / 12}
+    rng = random.Random(4)
+
+    renders = [
+        [fruit.make_text(rng) for _ in range(12000)],
+        fruit.make_many(rng, 12000),
+        [fruit.compile()(rng) for _ in range(12000)],
+        [value.lower() for value in fruit.capitalized().make_many(rng, 12000)],
+    ]
+
+    assert fruit.word_weights() == (8.0, 2.0, 2.0)
+    assert Fruit().word_weights() is None
+    for values in renders:
+        counts = Counter(values)
+        for word, share in expected.items():
+            assert counts[word] / 12000 == pytest.approx(share, abs=0.02)
+    assert entropy_bits(fruit) == pytest.approx(1.2516, abs=1e-4)
+
+
+def test_weighted_prefixes_keep_the_weights() -> None:
+    tree = Fruit(weighted=True).prefixed_by_article()
+    rng = random.Random(6)
+
+    counts = Counter(
+        value.split(" ")[1] for value in tree.make_many(rng, 6000)
+    ) + Counter(tree.make_text(rng).split(" ")[1] for _ in range(6000))
+
+    assert counts["apple"] / 12000 == pytest.approx(8 / 12, abs=0.02)
+
+
+def test_weighted_lists_without_weight_assets_raise() -> None:
+    for build in (
+        lambda: Noun(weighted=True),
+        lambda: Verb(VerbTense.PAST, weighted=True),
+        lambda: GivenName(weighted=True),
+        lambda: GivenName(gender=BinaryGender.FEMALE, weighted=True),
+    ):
+        with pytest.raises(ValueError, match="no frequency weights"):
+            build()
+    assert Noun().word_weights() is None